@@ -19,5 +19,26 @@ class AppConfig:
         "AZURE_OPENAI_API_VERSION", "2024-02-15-preview")
     azure_deployment: str | None = os.getenv("AZURE_OPENAI_DEPLOYMENT")
 
+    # Azure quota governor (integrations/rate_limiter.py); 0 = no limit
+    llm_rpm: int = int(os.getenv("LLM_RPM", "0"))
+    llm_tpm: int = int(os.getenv("LLM_TPM", "0"))
+    llm_max_in_flight: int = int(os.getenv("LLM_MAX_IN_FLIGHT", "4"))
+    # Per-attempt HTTP timeout and total budget per call (s), retries included
+    llm_request_timeout: float = float(os.getenv("LLM_REQUEST_TIMEOUT", "20"))
+    llm_max_wait: float = float(os.getenv("LLM_MAX_WAIT", "30"))
+    # Hedged requests (integrations/hedging.py): duplicate calls slower than p95
+    llm_hedge: bool = os.getenv("LLM_HEDGE", "0") == "1"
+
     # Save file
     save_dir: str = os.path.join(os.getcwd(), "Output")
+
+    # Content-addressed payload store (run dedup + warm cache for ContentEngine)
+    content_store_dir: str = os.path.join(os.getcwd(), "Output", "content")
+    # Warm cache replays stored content for identical prompts instead of
+    # generating fresh content, so it is opt-in (CONTENT_CACHE=1)
+    content_cache: bool = os.getenv("CONTENT_CACHE", "0") == "1"
+
+    # Frame profiler (ui/profiler.py): F3 toggles the overlay in game;
+    # PROFILE_TRACE=path writes a Chrome trace of the session on exit
+    profile_overlay: bool = os.getenv("PROFILE_OVERLAY", "0") == "1"
+    profile_trace: str | None = os.getenv("PROFILE_TRACE")
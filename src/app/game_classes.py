@@ -1,4 +1,6 @@
 import pygame
+from ui.asset_manager import asset_manager
+from ui.timestep import lerp
 
 #===============Constants===================
 GAME_WIDTH = 900
@@ -34,10 +36,11 @@ class Player:
     def __init__(self, x, y, width, height, img_path, speed):
 
         # Load player images for all directions
-        self.img_up    = pygame.transform.scale(pygame.image.load(img_path + "north.png").convert_alpha(),     (width, height))
-        self.img_down  = pygame.transform.scale(pygame.image.load(img_path + "south.png").convert_alpha(),     (width, height))
-        self.img_left  = pygame.transform.scale(pygame.image.load(img_path + "west.png").convert_alpha(),      (width, height))
-        self.img_right = pygame.transform.scale(pygame.image.load(img_path + "east.png").convert_alpha(),      (width, height))
+        assets = asset_manager()
+        self.img_up    = assets.load(img_path + "north.png", (width, height))
+        self.img_down  = assets.load(img_path + "south.png", (width, height))
+        self.img_left  = assets.load(img_path + "west.png",  (width, height))
+        self.img_right = assets.load(img_path + "east.png",  (width, height))
 
         # Player Attributes
         self.rect = pygame.Rect(x, y, width, height)
@@ -45,43 +48,63 @@ class Player:
         self.img_path = img_path 
         self.img = self.img_down
 
+        # Float position (rect holds the rounded copy for collisions)
+        self.x, self.y = float(self.rect.x), float(self.rect.y)
+        self.prev_x, self.prev_y = self.x, self.y
+
     def move(self, dt, game_width, game_height):
+        '''
+        Advance one simulation step of dt seconds (see ui.timestep)
+        '''
         keys = pygame.key.get_pressed()
 
+        # rect moved from outside (spawn/teleport): restart from there
+        if self.rect.topleft != (round(self.x), round(self.y)):
+            self.x, self.y = float(self.rect.x), float(self.rect.y)
+        self.prev_x, self.prev_y = self.x, self.y
+
         # Move Up
-        if (keys[pygame.K_UP] or keys[pygame.K_w] or keys[pygame.K_k]) and self.rect.y >= 0:
-            self.rect.y -= self.speed * dt
+        if (keys[pygame.K_UP] or keys[pygame.K_w] or keys[pygame.K_k]) and self.y >= 0:
+            self.y -= self.speed * dt
             self.img = self.img_up
 
         # Move Down
-        if (keys[pygame.K_DOWN] or keys[pygame.K_s] or keys[pygame.K_j]) and self.rect.y <= game_height - self.rect.height:
-            self.rect.y += self.speed * dt
+        if (keys[pygame.K_DOWN] or keys[pygame.K_s] or keys[pygame.K_j]) and self.y <= game_height - self.rect.height:
+            self.y += self.speed * dt
             self.img = self.img_down
 
         # Move Left
-        if (keys[pygame.K_LEFT] or keys[pygame.K_a] or keys[pygame.K_h]) and self.rect.x >= 0:
-            self.rect.x -= self.speed * dt
+        if (keys[pygame.K_LEFT] or keys[pygame.K_a] or keys[pygame.K_h]) and self.x >= 0:
+            self.x -= self.speed * dt
             self.img = self.img_left
 
         # Move Right
-        if (keys[pygame.K_RIGHT] or keys[pygame.K_d] or keys[pygame.K_l]) and self.rect.x <= game_width - self.rect.width:
-            self.rect.x += self.speed * dt
+        if (keys[pygame.K_RIGHT] or keys[pygame.K_d] or keys[pygame.K_l]) and self.x <= game_width - self.rect.width:
+            self.x += self.speed * dt
             self.img = self.img_right
 
-    def draw(self, surface):
-        surface.blit(self.img, self.rect)
+        self.rect.topleft = (round(self.x), round(self.y))
+
+    def draw(self, surface, alpha=1.0):
+        '''
+        alpha: how far between the previous and current step to draw
+        '''
+        if self.rect.topleft != (round(self.x), round(self.y)):
+            surface.blit(self.img, self.rect)
+            return
+        pos = (round(lerp(self.prev_x, self.x, alpha)), round(lerp(self.prev_y, self.y, alpha)))
+        surface.blit(self.img, pos)
 
 class Structure:
     def __init__(self, x, y, width, height, img_path, bg_img_path):
-        img = pygame.image.load(img_path).convert_alpha()
-        img = pygame.transform.scale(img, (width, height))
-
-        bg_img = pygame.image.load(bg_img_path)
-        bg_img = pygame.transform.scale(bg_img, (GAME_WIDTH, GAME_HEIGHT))
-
-        self.img = img
-        self.bg = bg_img
+        self.img = asset_manager().load(img_path, (width, height))
+        self.bg_img_path = bg_img_path
         self.rect = pygame.Rect(x, y, width, height)
 
+    @property
+    def bg(self):
+        # Loaded on first use and shared by every structure with the same background
+        return asset_manager().load(self.bg_img_path, (GAME_WIDTH, GAME_HEIGHT), alpha=False)
+
     def draw(self, surface):
         surface.blit(self.img, self.rect)
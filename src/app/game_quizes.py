@@ -3,6 +3,10 @@ import pygame
 import pygame_widgets
 from app.request import *
 from pygame_widgets.textbox import TextBox
+from ui.fonts import get_font
+from ui.text_cache import render_text
+from ui.text_layout import wrap_lines
+from ui.panels import draw_panel
 
 # Open Files
 with open("data/options_catalog.json", "r", encoding="utf-8") as f:
@@ -16,33 +20,15 @@ CAREER = [c["name"] for c in catalog["careers_poly_work"]]  # course names
 def draw_dialog_box(surface, rect, fill_color=(0,0,0), alpha=200, border_color=(255,255,255), border=3, radius=18):
     '''
     a small helper to draw a dialog box
+    (translucent rounded box + border, composited once and cached, see ui.panels)
     '''
-    # draw translucent rounded box
-    box = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-    pygame.draw.rect(box, (*fill_color, alpha), box.get_rect(), border_radius=radius)
-    surface.blit(box, (rect.x, rect.y))
-
-    # border
-    pygame.draw.rect(surface, border_color, rect, border, border_radius=radius)
+    draw_panel(surface, rect, fill_color, alpha, radius, border, border_color)
 
 def wrap_text(text, font, max_width):
     '''
-    text wrapping
+    text wrapping (cached per text/font/width, see ui.text_layout)
     '''
-    words = text.split(" ")
-    lines = []
-    cur = ""
-
-    for w in words:
-        test = (cur + " " + w).strip()
-        if font.size(test)[0] <= max_width:
-            cur = test
-        else:
-            lines.append(cur)
-            cur = w
-    if cur:
-        lines.append(cur)
-    return lines
+    return wrap_lines(text, font, max_width)
 
 # ----------------------------
 # Quiz Engine State
@@ -95,16 +81,16 @@ def draw_quiz_screen(screen, font, bg, quiz, npc_name="NPC"):
     draw_dialog_box(screen, box_rect, fill_color=(10, 10, 10), alpha=210, border_color=(255, 255, 255))
 
     # NPC name
-    name_surf = font.render(npc_name + ":", True, (255, 255, 255))
+    name_surf = render_text(font, npc_name + ":", True, (255, 255, 255))
     screen.blit(name_surf, (box_rect.x + 20, box_rect.y + 15))
 
     # Question text (wrapped)
-    prompt_font = pygame.font.SysFont("Arial", 28)
+    prompt_font = get_font("Arial", 28)
     lines = wrap_text(quiz.get("question", ""), prompt_font, box_rect.width - 40)
 
     y = box_rect.y + 60
     for line in lines[:2]:
-        screen.blit(prompt_font.render(line, True, (230, 230, 230)), (box_rect.x + 20, y))
+        screen.blit(render_text(prompt_font, line, True, (230, 230, 230)), (box_rect.x + 20, y))
         y += 32
 
     # Render based on question type
@@ -112,7 +98,7 @@ def draw_quiz_screen(screen, font, bg, quiz, npc_name="NPC"):
     if qtype == "multiple_choice":
         draw_multiple_choice(screen, box_rect, quiz)
 
-        hint = pygame.font.SysFont("Arial", 24).render(
+        hint = render_text(get_font("Arial", 24),
             "↑↓ choose • Enter confirm • 1-9 quick • Q exit", True, (180, 180, 180)
         )
         screen.blit(hint, (box_rect.x + 20, box_rect.bottom + 170))
@@ -120,7 +106,7 @@ def draw_quiz_screen(screen, font, bg, quiz, npc_name="NPC"):
     elif qtype == "slider":
         draw_slider(screen, box_rect, quiz)
 
-        hint = pygame.font.SysFont("Arial", 24).render(
+        hint = render_text(get_font("Arial", 24),
             "←→ change • Enter confirm • Q exit", True, (180, 180, 180)
         )
         screen.blit(hint, (box_rect.x + 20, box_rect.bottom + 170))
@@ -128,18 +114,18 @@ def draw_quiz_screen(screen, font, bg, quiz, npc_name="NPC"):
     elif qtype == "textinput":
         draw_textinput(screen, box_rect, quiz)
 
-        hint = pygame.font.SysFont("Arial", 24).render(
+        hint = render_text(get_font("Arial", 24),
             "Type answer • Enter confirm • Q exit", True, (180, 180, 180)
         )
         screen.blit(hint, (box_rect.x + 20, box_rect.bottom + 170))
 
     else:
-        err = pygame.font.SysFont("Arial", 26).render(f"Unknown quiz type: {qtype}", True, (255, 100, 100))
+        err = render_text(get_font("Arial", 26), f"Unknown quiz type: {qtype}", True, (255, 100, 100))
         screen.blit(err, (box_rect.x + 20, box_rect.y + 150))
 
 
 def draw_multiple_choice(screen, box_rect, quiz):
-    opt_font = pygame.font.SysFont("Arial", 26)
+    opt_font = get_font("Arial", 26)
     options = quiz.get("answers", [])
     selected_idx = int(quiz.get("user_choice_index", 0))
     opt_y = box_rect.y + 120
@@ -154,7 +140,7 @@ def draw_multiple_choice(screen, box_rect, quiz):
 
         label = f"{i+1}. {opt}"
         color = (255, 255, 0) if is_sel else (255, 255, 255)
-        screen.blit(opt_font.render(label, True, color), (opt_rect.x + 10, opt_rect.y + 5))
+        screen.blit(render_text(opt_font, label, True, color), (opt_rect.x + 10, opt_rect.y + 5))
 
         opt_y += 50
 
@@ -183,8 +169,8 @@ def draw_slider(screen, box_rect, quiz):
     pygame.draw.circle(screen, (255, 255, 255), (knob_x, knob_y), 12, 2)
 
     # label
-    num_font = pygame.font.SysFont("Arial", 28)
-    label = num_font.render(f"{val}/{max_val}", True, (230, 230, 230))
+    num_font = get_font("Arial", 28)
+    label = render_text(num_font, f"{val}/{max_val}", True, (230, 230, 230))
     screen.blit(label, (box_rect.x + 20, box_rect.y + 230))
 
 
@@ -215,8 +201,8 @@ def draw_textinput(screen, box_rect, quiz):
 
     # draw placeholder hint if empty
     if (tb.getText() or "").strip() == "" and placeholder:
-        ph_font = pygame.font.SysFont("Arial", 22)
-        ph = ph_font.render(f"Example: {placeholder}", True, (180, 180, 180))
+        ph_font = get_font("Arial", 22)
+        ph = render_text(ph_font, f"Example: {placeholder}", True, (180, 180, 180))
         screen.blit(ph, (box_rect.x + 20, box_rect.y + 160))
 
 
@@ -7,6 +7,15 @@ from pygame_widgets.textbox import TextBox
 import app.request as request_module
 from app.game_classes import *
 import app.game_quizes as gq  # Import as module to maintain global variable references
+from ui.fonts import get_font
+from ui.text_cache import render_text
+from ui.asset_manager import asset_manager
+from ui.atlas import ATLAS_INDEX
+from ui.frame_scheduler import FrameScheduler
+from ui.timestep import FixedTimestep
+from ui.transition import Transition
+from ui.profiler import FrameProfiler
+from app.config import AppConfig
 
 #=============Global Variables==================
 part1_payload = None
@@ -33,16 +42,16 @@ pygame.init()
 # Window
 screen = pygame.display.set_mode((GAME_WIDTH,GAME_HEIGHT)) # fixed window size
 pygame.display.set_caption("Welcome to PyGame!") # window header
-font = pygame.font.SysFont('Arial', 32)
+font = get_font("Arial", 32)
 
 # Background Images
 ## Chapter 1
-bg_img = pygame.image.load("images/background.png")  #.convert_alpha()
-bg_img = pygame.transform.scale(bg_img, (GAME_WIDTH, GAME_HEIGHT))
+assets = asset_manager()
+assets.use_atlas(ATLAS_INDEX)  # character/structure sprites, see ui/atlas.py
+bg_img = assets.load("images/background.png", (GAME_WIDTH, GAME_HEIGHT), alpha=False)
 #img = pygame.transform.scale(img, (img.get_width()*0.3, img.get_height()*0.3))
-## Chapter 2
-chapter2_bg = pygame.image.load("images/chapter2_bg.png")
-chapter2_bg = pygame.transform.scale(chapter2_bg, (GAME_WIDTH, GAME_HEIGHT))
+## Chapter 2 (decoded in the background while Chapter I runs, converted on first use)
+assets.preload("chapter2")
 
 def print_output():
     print(textbox.getText())
@@ -76,8 +85,16 @@ gender_rects = [
     pygame.Rect(250, 310, 20, 20),
 ]
 
-# Clock
-clock = pygame.time.Clock()
+# Clock (drops to an idle rate while nothing moves, see is_idle)
+scheduler = FrameScheduler(60)
+# Fixed 60 Hz simulation, rendering interpolates between steps
+timestep = FixedTimestep()
+# Active loading overlay between locations (see set_state)
+transition = None
+# Per-phase frame timings: F3 shows the overlay, PROFILE_TRACE=path dumps a trace on exit
+profile_cfg = AppConfig()
+profiler = FrameProfiler()
+profiler.overlay_visible = profile_cfg.profile_overlay
 
 # Invoking Main Player Instance
 main_player = Player(x=GAME_WIDTH // 2, y=GAME_HEIGHT // 2, width=100, height=100, img_path="images/warrior/", speed=800)
@@ -97,28 +114,27 @@ portal2 = Structure(GAME_WIDTH - 540, GAME_HEIGHT - 500, 100, 100, "images/home.
 portal3 = Structure(GAME_WIDTH - 420, GAME_HEIGHT - 500, 100, 100, "images/heart.png", "images/home_bg.png")
 #===============================================
 
-def loading_screen(title: str):
-    print("loading screen")
-
-    screen.fill(BLACK)
-    # TEXT
-    font = pygame.font.SysFont('Arial', 32)
-    text = font.render(f"{title}", True, WHITE)
-
-    screen.blit(text, [300,300])
-
-    pygame.display.flip()
-    time.sleep(1)
+#=========================Managing Locations===================================
+def set_state(new_state, spawn_pos=None, title=None, task=None, on_ready=None):
+    '''
+    Switch location. With a title, a loading overlay covers the switch for
+    as long as task (run on a background thread) takes; on_ready(result)
+    then runs on the main thread just before the new state shows.
+    '''
+    global transition
 
+    def enter(result=None):
+        global state
+        if on_ready is not None:
+            on_ready(result)
+        state = new_state
+        if spawn_pos is not None:
+            main_player.rect.topleft = spawn_pos
 
-#=========================Managing Locations===================================
-def set_state(new_state, spawn_pos=None, title=None):
-    global state
-    state = new_state
-    if spawn_pos is not None:
-        main_player.rect.topleft = spawn_pos
     if title:
-        loading_screen(title)
+        transition = Transition(title, task, enter)
+    else:
+        enter(task() if task is not None else None)
 
 def render_state():
     '''
@@ -133,14 +149,14 @@ def render_state():
         wiseman_tent.draw(screen)
 
         exit_gate1.draw(screen)
-        main_player.draw(screen)
+        main_player.draw(screen, timestep.alpha)
 
     elif state == HOME:
         if gq.quiz_i < len(gq.quiz_questions_home):
             gq.draw_quiz_screen(screen, font, home.bg, gq.quiz_questions_home[gq.quiz_i], npc_name="Fedora")
 
-            temp_main_player_img_home = pygame.transform.scale(main_player.img_down, (250, 250))
-            temp_fedora_img_home = pygame.transform.scale(fedora.img_down, (200, 200))
+            temp_main_player_img_home = assets.load(main_player.img_path + "south.png", (250, 250))
+            temp_fedora_img_home = assets.load(fedora.img_path + "south.png", (200, 200))
             screen.blit(temp_main_player_img_home, (100, 360))
             screen.blit(temp_fedora_img_home, (500, 380))
 
@@ -153,8 +169,8 @@ def render_state():
         if gq.quiz_i < len(gq.quiz_questions_wiseman):
             gq.draw_quiz_screen(screen, font, home.bg, gq.quiz_questions_wiseman[gq.quiz_i], npc_name="The Wise Man")
 
-            temp_main_player_img_meeting = pygame.transform.scale(main_player.img_down, (250, 250))
-            temp_wiseman_img_meeting = pygame.transform.scale(wiseman.img_down, (200, 200))
+            temp_main_player_img_meeting = assets.load(main_player.img_path + "south.png", (250, 250))
+            temp_wiseman_img_meeting = assets.load(wiseman.img_path + "south.png", (200, 200))
             screen.blit(temp_main_player_img_meeting, (100, 360))
             screen.blit(temp_wiseman_img_meeting, (500, 380))
 
@@ -162,9 +178,9 @@ def render_state():
         '''
         Chapter II : The Portals
         '''
-        screen.blit(chapter2_bg, (0, 0))
+        screen.blit(assets.load("images/chapter2_bg.png", (GAME_WIDTH, GAME_HEIGHT), alpha=False), (0, 0))
         # Add player
-        main_player.draw(screen)
+        main_player.draw(screen, timestep.alpha)
 
         # Portals
         portal1.draw(screen)
@@ -175,20 +191,20 @@ def render_state():
     elif state == PROFILE:
         screen.fill((20, 20, 20))
 
-        title = font.render("Create Your Profile", True, WHITE)
+        title = render_text(font, "Create Your Profile", True, WHITE)
         screen.blit(title, (220, 80))
 
         # Username label
-        label = font.render("Username:", True, WHITE)
+        label = render_text(font, "Username:", True, WHITE)
         screen.blit(label, (120, 160))
         profile_name_box.draw()
 
         # Gender label
-        g_label = font.render("Gender:", True, WHITE)
+        g_label = render_text(font, "Gender:", True, WHITE)
         screen.blit(g_label, (120, 240))
 
         # Draw radio options
-        small_font = pygame.font.SysFont('Arial', 26)
+        small_font = get_font("Arial", 26)
         for i, opt in enumerate(gender_options):
             r = gender_rects[i]
 
@@ -200,10 +216,10 @@ def render_state():
                 inner = r.inflate(-8, -8)
                 pygame.draw.rect(screen, WHITE, inner)
 
-            txt = small_font.render(opt, True, WHITE)
+            txt = render_text(small_font, opt, True, WHITE)
             screen.blit(txt, (r.x + 40, r.y - 5))
 
-        hint = small_font.render("Enter = confirm • Click gender • Tab to focus textbox", True, (180,180,180))
+        hint = render_text(small_font, "Enter = confirm • Click gender • Tab to focus textbox", True, (180,180,180))
         screen.blit(hint, (120, 520))
 
         print("TEXTBOX:", repr(profile_name_box.getText())) 
@@ -227,33 +243,35 @@ def handle_keydown_ch1(event):
             set_state(HOME, HOME_SPAWN, "Entering Home")
         '''
         if can_enter_home:
-            global part1_payload, quiz_questions_home
-            # Load questions - Part 1
-            request_module.get_question_part1()
-
-            gq.quiz_questions_home = request_module.quiz_questions_home
-            # Reset counters
-            gq.quiz_i = 0
-            gq.quiz_done = False
-            # Enter Home
-            set_state(HOME, HOME_SPAWN, "Entering Home")
+            def enter_home(_):
+                gq.quiz_questions_home = request_module.quiz_questions_home
+                # Reset counters
+                gq.quiz_i = 0
+                gq.quiz_done = False
+
+            # Load questions - Part 1, then enter Home
+            set_state(HOME, HOME_SPAWN, "Entering Home",
+                      task=request_module.get_question_part1, on_ready=enter_home)
         elif can_enter_wiseman:
-            global part2_payload, part1_answers_cached
             print("PART1 ANS CACHED")
             print(part1_answers_cached)
             print(type(part1_answers_cached[1]))
             print("-" * 50)
 
-            # Load questions - Part 2
-            part2_payload = request_module.get_question_part2(part1_answers_cached)
-            gq.quiz_questions_wiseman = request_module.quiz_questions_wiseman
-            print('MAIN QUIZ QUESTION WISEMAN')
-            print(gq.quiz_questions_wiseman)
-            # Reset counters
-            gq.quiz_i = 0
-            gq.quiz_done = False
-            # Enter Wiseman
-            set_state(WISEMAN, HOME_SPAWN, "Wise man")
+            def enter_wiseman(payload):
+                global part2_payload
+                part2_payload = payload
+                gq.quiz_questions_wiseman = request_module.quiz_questions_wiseman
+                print('MAIN QUIZ QUESTION WISEMAN')
+                print(gq.quiz_questions_wiseman)
+                # Reset counters
+                gq.quiz_i = 0
+                gq.quiz_done = False
+
+            # Load questions - Part 2, then enter Wiseman
+            answers = part1_answers_cached
+            set_state(WISEMAN, HOME_SPAWN, "Wise man",
+                      task=lambda: request_module.get_question_part2(answers), on_ready=enter_wiseman)
         elif can_enter_exit_gate:
             set_state(CHAPTER2, (100, 300), "Chapter 2: The Portals")
 
@@ -295,120 +313,178 @@ def get_active_quizzes():
         return gq.quiz_questions_wiseman
     return None
 
+def is_idle():
+    '''
+    True when the current state has nothing animating on its own.
+    (The scheduler stays at full rate anyway while a key is held.)
+    '''
+    if state in (HOME, WISEMAN):
+        active = get_active_quizzes()
+        # pygame_widgets TextBox blinks its cursor
+        return not (active and gq.quiz_i < len(active) and active[gq.quiz_i].get("type") == "textinput")
+    return state in (OUTSIDE, CHAPTER2)
+
 # Main Loop
-running = True
-while running:
-    dt = clock.tick(60) / 1000.0
-    events = pygame.event.get()
-
-    for event in events:
-        # Quit
-        if event.type == pygame.QUIT:
-            running = False
-            continue
-
-        # Profile
-        if state == PROFILE:
-            pygame_widgets.update([event])   # feed event to textbox immediately
-            handle_profile_events(event)
-            continue
-
-        if state in (HOME, WISEMAN):
-            active = get_active_quizzes()
-            if active is None:
+def main():
+    global state, part1_answers_cached, transition
+
+    running = True
+    while running:
+        dt, events = scheduler.next_frame(transition is None and not profiler.overlay_visible and is_idle())
+        profiler.begin_frame()
+
+        # Loading overlay: keep pumping events so quitting stays responsive;
+        # any other input during the load is discarded, not replayed
+        if transition is not None:
+            if any(event.type == pygame.QUIT for event in events):
+                break
+            transition.update(dt)
+            if not transition.done:
+                with profiler.phase("transition", "draw"):
+                    transition.draw(screen)
+                    profiler.draw_overlay(screen)
+                with profiler.phase("transition", "flip"):
+                    pygame.display.flip()
+                profiler.end_frame()
+                continue
+            finished, transition = transition, None
+            finished.finish()
+            events = []
+
+        scope = state
+        events_start = time.perf_counter()
+        for event in events:
+            # Quit
+            if event.type == pygame.QUIT:
+                running = False
                 continue
 
-            # Check if we should handle events first
-            if gq.quiz_i < len(active):
-                current_quiz = active[gq.quiz_i]
-
-                if current_quiz.get("type") == "textinput":
-                    pygame_widgets.update([event])
-
-                if event.type == pygame.KEYDOWN:
-                    print(state)
-                    action = gq.handle_quiz_event(event, active)
-                    print(f"handle_quiz_event returned: {action}")
-
-                    if action == "quit":
-                        state = OUTSIDE
-                        gq.quiz_done = False
-                        gq.quiz_i = 0
-
-                    elif action == "next":
-                        '''
-                        print(f"Before quiz_next: quiz_i={gq.quiz_i}, len={len(active)}")
-                        gq.quiz_next(active)
-                        print(f"After quiz_next: quiz_i={gq.quiz_i}, quiz_done={gq.quiz_done}")
-                        if gq.quiz_done:
-                            print("All quiz results:", active)
-                            state = OUTSIDE
-                            gq.quiz_done = False
-                            gq.quiz_i = 0
-                        '''
-                        gq.quiz_next(active)
-                        if gq.quiz_done:
-                            print("All quiz results:", active)
-                            print(state)
-
-                            if state == HOME:
-                                # 2) After player answered all HOME quizzes
-                                print("ui results to engine")
-                                print(gq.quiz_questions_home)
-                                part1_answers_cached = request_module.ui_results_to_engine_answers(gq.quiz_questions_home)
-                                print(part1_answers_cached)
-                                print("-" * 50)
-
-                            elif state == WISEMAN:
-                                # 4) After player answered all WISEMAN quizzes
-                                part2_answers = request_module.ui_results_to_engine_answers(gq.quiz_questions_wiseman)
-                                request_module.submit_part2_answers(part2_payload, part2_answers)
-
-                            # exit quiz mode
+            # Profiler overlay
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profiler.toggle_overlay()
+                continue
+
+            # Profile
+            if state == PROFILE:
+                pygame_widgets.update([event])   # feed event to textbox immediately
+                handle_profile_events(event)
+                continue
+
+            if state in (HOME, WISEMAN):
+                active = get_active_quizzes()
+                if active is None:
+                    continue
+
+                # Check if we should handle events first
+                if gq.quiz_i < len(active):
+                    current_quiz = active[gq.quiz_i]
+
+                    if current_quiz.get("type") == "textinput":
+                        pygame_widgets.update([event])
+
+                    if event.type == pygame.KEYDOWN:
+                        print(state)
+                        action = gq.handle_quiz_event(event, active)
+                        print(f"handle_quiz_event returned: {action}")
+
+                        if action == "quit":
                             state = OUTSIDE
                             gq.quiz_done = False
                             gq.quiz_i = 0
-            else:
-                # Quiz finished, exit to outside
-                state = OUTSIDE
-                gq.quiz_done = False
-                gq.quiz_i = 0
 
-            continue  # IMPORTANT: stop other key handlers while in quiz
-
-        # Pressing Keys
-        if event.type == pygame.KEYDOWN:
+                        elif action == "next":
+                            '''
+                            print(f"Before quiz_next: quiz_i={gq.quiz_i}, len={len(active)}")
+                            gq.quiz_next(active)
+                            print(f"After quiz_next: quiz_i={gq.quiz_i}, quiz_done={gq.quiz_done}")
+                            if gq.quiz_done:
+                                print("All quiz results:", active)
+                                state = OUTSIDE
+                                gq.quiz_done = False
+                                gq.quiz_i = 0
+                            '''
+                            gq.quiz_next(active)
+                            if gq.quiz_done:
+                                print("All quiz results:", active)
+                                print(state)
+
+                                if state == HOME:
+                                    # 2) After player answered all HOME quizzes
+                                    print("ui results to engine")
+                                    print(gq.quiz_questions_home)
+                                    part1_answers_cached = request_module.ui_results_to_engine_answers(gq.quiz_questions_home)
+                                    print(part1_answers_cached)
+                                    print("-" * 50)
+
+                                elif state == WISEMAN:
+                                    # 4) After player answered all WISEMAN quizzes
+                                    part2_answers = request_module.ui_results_to_engine_answers(gq.quiz_questions_wiseman)
+                                    payload = part2_payload
+                                    set_state(OUTSIDE, title="The Wise Man is thinking",
+                                              task=lambda: request_module.submit_part2_answers(payload, part2_answers))
+
+                                # exit quiz mode
+                                state = OUTSIDE
+                                gq.quiz_done = False
+                                gq.quiz_i = 0
+                else:
+                    # Quiz finished, exit to outside
+                    state = OUTSIDE
+                    gq.quiz_done = False
+                    gq.quiz_i = 0
+
+                continue  # IMPORTANT: stop other key handlers while in quiz
+
+            # Pressing Keys
+            if event.type == pygame.KEYDOWN:
+
+                print(f"{pygame.key.name(event.key)} has been pressed!")
+
+                if state == OUTSIDE:
+                    '''
+                    Chapter I
+                    '''
+                    handle_keydown_ch1(event)
+                else:
+                    # Chapter II
+                    if state == CHAPTER2:
+                        # Quitting from Chapter II
+                        if event.key == pygame.K_q:
+                            set_state(OUTSIDE, OUTSIDE_SPAWN, "Returning Outside")
+
+        update_start = time.perf_counter()
+        profiler.record(scope, "handle_event", events_start, update_start)
+
+        # WIDGETS
+        if state != PROFILE and state not in (HOME, WISEMAN):
+            pygame_widgets.update(events)
+
+        for _ in range(timestep.advance(dt)):
+            if state == OUTSIDE:
+                main_player.move(timestep.step, GAME_WIDTH, GAME_HEIGHT)
+                update_outside_interactions()
 
-            print(f"{pygame.key.name(event.key)} has been pressed!")
+            if state == CHAPTER2:
+                main_player.move(timestep.step, GAME_WIDTH, GAME_HEIGHT)
+        profiler.record(scope, "update", update_start, time.perf_counter())
 
-            if state == OUTSIDE:
-                '''
-                Chapter I
-                '''
-                handle_keydown_ch1(event)
-            else:
-                # Chapter II
-                if state == CHAPTER2:
-                    # Quitting from Chapter II
-                    if event.key == pygame.K_q:
-                        set_state(OUTSIDE, OUTSIDE_SPAWN, "Returning Outside")
-
-    # WIDGETS
-    if state != PROFILE and state not in (HOME, WISEMAN):
-        pygame_widgets.update(events)
+        # Render/Draw Location
+        with profiler.phase(state, "draw"):
+            render_state()
+        profiler.draw_overlay(screen)
 
-    if state == OUTSIDE:
-        main_player.move(dt, GAME_WIDTH, GAME_HEIGHT)
-        update_outside_interactions()
+        # FLIP THE DISPLAY
+        with profiler.phase(state, "flip"):
+            pygame.display.flip()                             # refresh screen
+        profiler.end_frame()
 
-    if state == CHAPTER2:
-        main_player.move(dt, GAME_WIDTH, GAME_HEIGHT)
+    if profile_cfg.profile_trace:
+        count = profiler.dump_trace(profile_cfg.profile_trace)
+        print(f"Wrote {count} trace events to {profile_cfg.profile_trace}")
 
-    # Render/Draw Location
-    render_state()
+    # Step 4 - after loop is exited, quit pygame
+    pygame.quit()
 
-    # FLIP THE DISPLAY
-    pygame.display.flip()                             # refresh screen
 
-# Step 4 - after loop is exited, quit pygame
-pygame.quit()
+if __name__ == "__main__":
+    main()
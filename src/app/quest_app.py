@@ -0,0 +1,39 @@
+"""
+Entry point for the Career Quest Map screen flow (ui/screens).
+
+Run from src/:
+    python -m app.quest_app
+"""
+from __future__ import annotations
+
+import pygame
+
+from app.config import AppConfig
+from app.state import AppState
+from ui.profiler import FrameProfiler
+from ui.screen_manager import ScreenManager
+from ui.screens.start_screen import StartScreen
+
+
+def main() -> None:
+    cfg = AppConfig()
+    pygame.init()
+    surface = pygame.display.set_mode((cfg.width, cfg.height))
+    pygame.display.set_caption("Career Quest Map")
+
+    state = AppState()
+    profiler = FrameProfiler()
+    profiler.overlay_visible = cfg.profile_overlay
+    sm = ScreenManager(None, profiler=profiler)
+    sm.set(StartScreen(sm, state, cfg.width, cfg.height))
+    sm.run(surface, cfg.fps)
+
+    if cfg.profile_trace:
+        count = profiler.dump_trace(cfg.profile_trace)
+        print(f"Wrote {count} trace events to {cfg.profile_trace}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List
+import random
+from typing import Any, Dict, List, Optional
 
 from app.config import AppConfig
 from app.state import AppState
@@ -67,12 +68,27 @@ def _convert_payload_for_ui(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
     return items
 
 
-def _mock_answer_for_question(q: Dict[str, Any]) -> Any:
+SYNTHETIC_TEXT_ANSWERS = [
+    "I like building small apps with my friends.",
+    "Drawing characters and designing posters.",
+    "Helping classmates understand maths problems.",
+    "Fixing computers and setting up networks at home.",
+    "Organising events for my school club.",
+    "Sample answer",
+]
+
+
+def _mock_answer_for_question(q: Dict[str, Any], rng: Optional[random.Random] = None) -> Any:
+    """
+    Answer a payload question. Without rng the answer is fixed (first
+    option, scale midpoint, 3, "Sample answer"); with rng it is a random
+    valid answer, for synthetic playthroughs.
+    """
     qtype = q.get("type")
     if qtype == "mcq":
         opts = q.get("options", [])
         if isinstance(opts, list) and opts:
-            return opts[0]
+            return rng.choice(opts) if rng else opts[0]
         return ""
     if qtype == "slider":
         scale = q.get("scale", {})
@@ -82,15 +98,15 @@ def _mock_answer_for_question(q: Dict[str, Any]) -> Any:
                 mn = int(scale.get("min"))
             if isinstance(scale.get("max"), (int, float)):
                 mx = int(scale.get("max"))
-        return (mn + mx) // 2
+        return rng.randint(mn, mx) if rng else (mn + mx) // 2
     if qtype == "rating":
-        return 3
+        return rng.randint(1, 5) if rng else 3
     if qtype == "text":
-        return "Sample answer"
+        return rng.choice(SYNTHETIC_TEXT_ANSWERS) if rng else "Sample answer"
     return ""
 
 
-def _mock_answers_from_payload(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+def _mock_answers_from_payload(payload: Dict[str, Any], rng: Optional[random.Random] = None) -> List[Dict[str, Any]]:
     answers: List[Dict[str, Any]] = []
     qs = payload.get("questions", [])
     if isinstance(qs, list):
@@ -101,7 +117,7 @@ def _mock_answers_from_payload(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
                 "id": q.get("id"),
                 "type": q.get("type"),
                 "prompt": q.get("prompt"),
-                "answer": _mock_answer_for_question(q),
+                "answer": _mock_answer_for_question(q, rng),
             })
     peq = payload.get("poly_extra_question")
     if isinstance(peq, dict):
@@ -109,7 +125,7 @@ def _mock_answers_from_payload(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
             "id": peq.get("id"),
             "type": peq.get("type"),
             "prompt": peq.get("prompt"),
-            "answer": _mock_answer_for_question(peq),
+            "answer": _mock_answer_for_question(peq, rng),
         })
     return answers
 
@@ -228,12 +244,7 @@ def main() -> None:
 
 """
 cfg = AppConfig()
-llm = LLMClient(
-    cfg.azure_endpoint,
-    cfg.azure_api_key,
-    cfg.azure_api_version,
-    cfg.azure_deployment,
-)
+llm = LLMClient.from_config(cfg)
 engine = ContentEngine(llm)
 
 education_status = "Poly"
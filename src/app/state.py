@@ -6,7 +6,7 @@ EducationStatus = Literal["Secondary School", "JC", "Poly"]
 PolyPathChoice = Literal["Work", "Go to uni"]
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     user_name: str = ""
     education_status: EducationStatus = "Secondary School"
@@ -14,7 +14,7 @@ class UserProfile:
     poly_path_choice: PolyPathChoice | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class QAItem:
     qid: str
     qtype: Literal["mcq", "slider", "rating", "text"]
@@ -24,7 +24,7 @@ class QAItem:
     placeholder: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GameData:
     part1_questions: list[QAItem] = field(default_factory=list)
     part1_answers: list[Any] = field(default_factory=list)
@@ -38,6 +38,15 @@ class GameData:
     feedback_lines: list[str] = field(default_factory=list)
     suggested_options: list[str] = field(default_factory=list)
 
+    # Raw ContentEngine payloads, kept so screens and saved runs share one source.
+    part1_payload: dict[str, Any] | None = None
+    part2_payload: dict[str, Any] | None = None
+    analysis_payload: dict[str, Any] | None = None
+    gate_payloads: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    # option name -> {"choice": "Yes"/"No"/None, "quests": {...}}
+    gate_choices: dict[str, dict[str, Any]] = field(default_factory=dict)
+
     gates_log: list[dict[str, Any]] = field(default_factory=list)
     chosen_gate: str | None = None
     chosen_gate_yes: bool | None = None
@@ -47,7 +56,7 @@ class GameData:
     dragon_resources: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldState:
     # Scene progression
     # start, profile, training, part1, wise, gates, gate_scene, dragon_scene, end
@@ -65,8 +74,11 @@ class WorldState:
     house_entered: bool = False
     wise_met: bool = False
 
+    # Gate currently being explored
+    current_gate_option: str | None = None
+
 
-@dataclass
+@dataclass(slots=True)
 class AppState:
     profile: UserProfile = field(default_factory=UserProfile)
     data: GameData = field(default_factory=GameData)
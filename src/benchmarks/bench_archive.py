@@ -0,0 +1,165 @@
+"""
+Archive compression ratio and read-back latency for core.run_archive.
+
+Writes --runs saved runs (indented JSON, as save_run does) into a temp
+directory, built from offline ContentEngine playthroughs with mock answers.
+Fallback content is the same in every run, unlike real LLM output, so
+--vary replaces that share of the words in every generated string with
+other words from the same content, standing in for rephrased answers.
+Each mode then archives a fresh copy of the runs and reports:
+- compression ratio (loose bytes / segment + dictionary bytes)
+- archive pass time
+- single-run read_archived_run latency (p50/p99 over --lookups random ids)
+- full iter_archived_runs throughput
+
+Modes: gzip, zstd with one plain frame per run, zstd with a trained
+dictionary (the default for zstd).
+
+Run from src/:
+    python -m benchmarks.bench_archive --runs 2000
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import dataclasses
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from typing import Any, Callable
+
+from app.request import _mock_answers_from_payload
+from app.state import AppState
+from benchmarks.flow_sim import EDUCATION, POLY_COURSES, percentile
+from core import run_archive
+from core.content_engine import ContentEngine
+from core.persistence import RUN_PREFIX, RUN_SUFFIX
+from integrations.llm_client import LLMClient
+
+
+def _map_strings(obj: Any, fn: Callable[[str], str]) -> Any:
+    if isinstance(obj, dict):
+        return {k: _map_strings(v, fn) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_map_strings(v, fn) for v in obj]
+    return fn(obj) if isinstance(obj, str) else obj
+
+
+def make_runs(count: int, vary: float, seed: int) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    engine = ContentEngine(LLMClient(None, None, None, None))
+    runs = []
+    # ContentEngine prints every generated payload
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(count):
+            state = AppState()
+            edu = rng.choice(EDUCATION)
+            state.profile.education_status = edu
+            state.profile.poly_course_of_study = rng.choice(POLY_COURSES) if edu == "Poly" else None
+            state.profile.user_name = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 10)))
+            data = state.data
+            data.part1_payload = engine.gen_part1(edu, state.profile.poly_course_of_study)
+            data.part1_answers = _mock_answers_from_payload(data.part1_payload, rng)
+            data.part2_payload = engine.gen_part2(edu, data.part1_answers)
+            data.part2_answers = _mock_answers_from_payload(data.part2_payload, rng)
+            data.inferred_fields = list(data.part2_payload.get("inferred_fields", []))
+            data.analysis_payload = engine.gen_analysis(edu, None, data.inferred_fields, data.part2_answers)
+            for option in data.analysis_payload.get("suggested_options", [])[:3]:
+                data.gate_payloads[option] = engine.gen_gate_scene(option, False, edu, None)
+                data.gate_choices[option] = {"choice": rng.choice(["Yes", "No", None])}
+            runs.append(dataclasses.asdict(state))
+
+    words: set[str] = set()
+    _map_strings(runs, lambda s: words.update(s.split()) or s)
+    pool = sorted(words)
+
+    def rephrase(s: str) -> str:
+        parts = s.split()
+        if len(parts) < 4:
+            return s
+        return " ".join(rng.choice(pool) if rng.random() < vary else w for w in parts)
+
+    return [_map_strings(run, rephrase) for run in runs] if vary else runs
+
+
+def write_loose(runs: list[dict[str, Any]], out_dir: str) -> int:
+    old = time.time() - 90 * 86400
+    total = 0
+    for i, run in enumerate(runs):
+        path = os.path.join(out_dir, f"{RUN_PREFIX}20240101_{i:06d}{RUN_SUFFIX}")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(run, f, ensure_ascii=False, indent=2)
+        os.utime(path, (old, old))
+        total += os.path.getsize(path)
+    return total
+
+
+def measure(runs: list[dict[str, Any]], codec: str, use_dict: bool, lookups: int, seed: int) -> dict[str, Any]:
+    out_dir = tempfile.mkdtemp(prefix="bench_archive_")
+    min_samples = run_archive.DICT_MIN_SAMPLES
+    try:
+        loose = write_loose(runs, out_dir)
+        if not use_dict:
+            run_archive.DICT_MIN_SAMPLES = sys.maxsize
+        t0 = time.perf_counter()
+        run_archive.archive_old_runs(out_dir, codec=codec)
+        pack_s = time.perf_counter() - t0
+
+        adir = run_archive.archive_dir(out_dir)
+        packed = sum(os.path.getsize(os.path.join(adir, n)) for n in os.listdir(adir) if n != run_archive.INDEX_NAME)
+
+        ids = run_archive.archived_run_ids(out_dir)
+        rng = random.Random(seed)
+        run_archive.read_archived_run(out_dir, ids[0])  # index + dictionary load
+        samples = []
+        for run_id in rng.choices(ids, k=lookups):
+            t0 = time.perf_counter()
+            run_archive.read_archived_run(out_dir, run_id)
+            samples.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        n = sum(1 for _ in run_archive.iter_archived_runs(out_dir))
+        scan_s = time.perf_counter() - t0
+        return {
+            "ratio": loose / packed,
+            "packed_kib": packed / 1024,
+            "pack_s": pack_s,
+            "lookup_p50_us": percentile(samples, 0.50) * 1e6,
+            "lookup_p99_us": percentile(samples, 0.99) * 1e6,
+            "scan_runs_per_s": n / scan_s if scan_s > 0 else 0.0,
+        }
+    finally:
+        run_archive.DICT_MIN_SAMPLES = min_samples
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=2000)
+    parser.add_argument("--vary", type=float, default=0.4, help="share of words rephrased per string (0 = none)")
+    parser.add_argument("--lookups", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    runs = make_runs(args.runs, args.vary, args.seed)
+    modes = [("gzip", "gzip", False)]
+    if run_archive.zstandard is not None:
+        modes += [("zstd", "zstd", False), ("zstd+dict", "zstd", True)]
+    else:
+        print("zstandard is not installed; only gzip is measured")
+
+    print(f"{args.runs} runs, {args.vary:.0%} of words rephrased")
+    print(f"  {'mode':<10} {'ratio':>6} {'KiB':>9} {'pack s':>7} {'p50 us':>8} {'p99 us':>8} {'scan runs/s':>12}")
+    for name, codec, use_dict in modes:
+        r = measure(runs, codec, use_dict, args.lookups, args.seed)
+        print(f"  {name:<10} {r['ratio']:5.1f}x {r['packed_kib']:9.0f} {r['pack_s']:7.2f} "
+              f"{r['lookup_p50_us']:8.0f} {r['lookup_p99_us']:8.0f} {r['scan_runs_per_s']:12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
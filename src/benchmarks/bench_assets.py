@@ -0,0 +1,88 @@
+"""
+Benchmark for ui.asset_manager.
+
+- full-screen background blit: raw pygame.image.load surface vs the
+  display-converted surface the asset manager hands out
+- loading the Chapter I structures and players the old way (one decode per
+  object) vs through the shared manager
+- preload: time to first use of the Chapter II background with and without
+  a background decode started beforehand
+
+Run from src/:
+    python -m benchmarks.bench_assets --frames 300
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from benchmarks.common import format_row, init_headless, time_frames
+
+import pygame
+
+SIZE = (900, 600)
+CHAPTER1 = [
+    ("images/house.png", (200, 200)),
+    ("images/wiseman/west.png", (100, 100)),
+    ("images/gate.png", (100, 100)),
+] + [(f"images/{who}/{d}.png", (100, 100)) for who in ("warrior", "fedora", "wiseman") for d in ("north", "south", "west", "east")]
+STRUCTURE_BGS = 6  # home, wiseman_tent, exit_gate1, portal1..3 all use home_bg.png
+
+
+def legacy_chapter1() -> None:
+    for path, size in CHAPTER1:
+        pygame.transform.scale(pygame.image.load(path).convert_alpha(), size)
+    for _ in range(STRUCTURE_BGS):
+        pygame.transform.scale(pygame.image.load("images/home_bg.png"), SIZE)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    screen = init_headless(*SIZE)
+    from ui.asset_manager import AssetManager
+
+    raw_bg = pygame.transform.scale(pygame.image.load("images/background.png"), SIZE)
+    assets = AssetManager()
+    converted_bg = assets.load("images/background.png", SIZE, alpha=False)
+
+    print(f"background blit, {args.frames} frames")
+    print(format_row("raw surface", time_frames(lambda: screen.blit(raw_bg, (0, 0)), args.frames)))
+    print(format_row("asset manager", time_frames(lambda: screen.blit(converted_bg, (0, 0)), args.frames)))
+
+    start = time.perf_counter()
+    legacy_chapter1()
+    legacy_ms = (time.perf_counter() - start) * 1000.0
+
+    assets = AssetManager()
+    start = time.perf_counter()
+    for path, size in CHAPTER1:
+        assets.load(path, size)
+    for _ in range(STRUCTURE_BGS):
+        assets.load("images/home_bg.png", SIZE, alpha=False)
+    shared_ms = (time.perf_counter() - start) * 1000.0
+    print("Chapter I sprites + structure backgrounds")
+    print(f"  per-object load            {legacy_ms:8.1f} ms")
+    print(f"  asset manager              {shared_ms:8.1f} ms  {assets.stats()}")
+
+    assets = AssetManager()
+    start = time.perf_counter()
+    assets.load("images/chapter2_bg.png", SIZE, alpha=False)
+    cold_ms = (time.perf_counter() - start) * 1000.0
+
+    assets = AssetManager()
+    assets.register("chapter2", ["images/chapter2_bg.png"])
+    assets.preload("chapter2")
+    time.sleep(0.5)  # the previous screen keeps running meanwhile
+    start = time.perf_counter()
+    assets.load("images/chapter2_bg.png", SIZE, alpha=False)
+    warm_ms = (time.perf_counter() - start) * 1000.0
+    print("Chapter II background, time to first use")
+    print(f"  lazy load                  {cold_ms:8.1f} ms")
+    print(f"  after preload              {warm_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
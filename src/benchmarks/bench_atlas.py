@@ -0,0 +1,60 @@
+"""
+Startup benchmark for ui.atlas.
+
+Loads every legacy character/structure sprite through a fresh AssetManager,
+once from individual files and once from the packed atlas, and reports the
+load time, the number of image files decoded and the cost of blitting the
+whole set.
+
+Build the atlas first, then run from src/:
+    python -m ui.atlas
+    python -m benchmarks.bench_atlas --repeat 20
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from benchmarks.common import format_row, init_headless, time_frames
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    screen = init_headless()
+    from ui.asset_manager import AssetManager
+    from ui.atlas import ATLAS_INDEX, LEGACY_SPRITES
+
+    def load_all(use_atlas: bool) -> tuple[float, int, list]:
+        assets = AssetManager()
+        if use_atlas:
+            assets.use_atlas(ATLAS_INDEX)
+        start = time.perf_counter()
+        surfaces = [assets.load(path, size) for path, size in LEGACY_SPRITES]
+        return (time.perf_counter() - start) * 1000.0, assets.decodes, surfaces
+
+    print(f"{len(LEGACY_SPRITES)} sprites, median of {args.repeat} cold loads")
+    results = {}
+    for name, use_atlas in (("individual files", False), ("atlas", True)):
+        runs = [load_all(use_atlas) for _ in range(args.repeat)]
+        ms = statistics.median(r[0] for r in runs)
+        results[name] = runs[-1][2]
+        print(f"  {name:<28} {ms:7.1f} ms  {runs[-1][1]:3d} files decoded")
+
+    def blitter(surfaces):
+        def frame() -> None:
+            for i, surf in enumerate(surfaces):
+                screen.blit(surf, ((i % 8) * 110, (i // 8) * 210))
+        return frame
+
+    print(f"blitting all sprites, {args.frames} frames")
+    for name, surfaces in results.items():
+        print(format_row(name, time_frames(blitter(surfaces), args.frames)))
+
+
+if __name__ == "__main__":
+    main()
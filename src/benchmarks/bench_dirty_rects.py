@@ -0,0 +1,107 @@
+"""
+CPU benchmark for the dirty-rect mode of ScreenManager.present.
+
+For each mostly static screen, runs a frame loop with the old full
+draw + display.flip every frame and with ScreenManager.present, once fully
+idle and once with --presses Enter key presses spread over the run (kept
+below the dialog length so no screen finishes). Reports
+CPU milliseconds per frame (time.process_time) and how many frames actually
+drew. Uses the offline fallback content (no LLM).
+
+Run from src/:
+    python -m benchmarks.bench_dirty_rects --frames 600
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable
+
+from benchmarks.common import init_headless
+
+import pygame
+
+
+def build_screens(sm, w: int, h: int) -> dict[str, Callable[[], object]]:
+    from app.state import AppState
+    from core.content_engine import ContentEngine
+    from integrations.llm_client import LLMClient
+    from ui.screens.dragon_scene_screen import DragonSceneScreen
+    from ui.screens.end_screen import EndScreen
+    from ui.screens.gate_scene_screen import GateSceneScreen
+    from ui.screens.house_questions_screen import HouseQuestionsScreen
+    from ui.screens.wise_man_screen import WiseManScreen
+
+    engine = ContentEngine(LLMClient(None, None, None, None))
+
+    def state() -> AppState:
+        st = AppState()
+        st.profile.education_status = "Poly"
+        st.data.part1_payload = engine.gen_part1("Poly", None)
+        return st
+
+    class Back:
+        def on_analysis_completed(self) -> None:
+            pass
+
+    gate = engine.gen_gate_scene(option_name="Software Engineering", work_path=False)
+    return {
+        "WiseManScreen": lambda: WiseManScreen(sm, state(), w, h, engine, Back()),
+        "EndScreen": lambda: EndScreen(sm, state(), w, h, "Output/run.txt"),
+        "DragonSceneScreen": lambda: DragonSceneScreen(sm, state(), w, h, engine, "Software Engineering", gate),
+        "GateSceneScreen": lambda: GateSceneScreen(sm, state(), w, h, Back(), "Software Engineering"),
+        "HouseQuestionsScreen": lambda: HouseQuestionsScreen(sm, state(), w, h, Back()),
+    }
+
+
+def run(sm, surface, make_screen, frames: int, presses: int, dirty: bool) -> tuple[float, int]:
+    screen = make_screen()
+    sm.set(screen)
+    drawn = 0
+    real_draw = screen.draw
+
+    def counting_draw(s: pygame.Surface) -> None:
+        nonlocal drawn
+        drawn += 1
+        real_draw(s)
+
+    screen.draw = counting_draw
+    enter = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, unicode="\r", mod=0, scancode=0)
+    press_every = frames // (presses + 1) if presses else 0
+    start = time.process_time()
+    for i in range(frames):
+        if press_every and i and i % press_every == 0 and i // press_every <= presses:
+            sm.handle_event(enter)
+        sm.update(1 / 60)
+        if dirty:
+            sm.present(surface)
+        else:
+            sm.draw(surface)
+            pygame.display.flip()
+    return (time.process_time() - start) * 1000.0 / frames, drawn
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--presses", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    surface = init_headless()
+    from ui.screen_manager import ScreenManager
+
+    sm = ScreenManager(None)
+    w, h = surface.get_size()
+    print(f"{args.frames} frames, CPU ms/frame (frames drawn)")
+    print(f"  {'screen':<22} {'flip idle':>16} {'dirty idle':>16} {'flip input':>16} {'dirty input':>16}")
+    for name, make in build_screens(sm, w, h).items():
+        cells = []
+        for press in (0, args.presses):
+            for dirty in (False, True):
+                ms, drawn = run(sm, surface, make, args.frames, press, dirty)
+                cells.append(f"{ms:7.3f} ({drawn:4d})")
+        print(f"  {name:<22} " + " ".join(f"{c:>16}" for c in cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Frame-time benchmark for the font registry.
+
+Draws the legacy quiz screen (app/game_quizes.draw_quiz_screen) for every
+question type, once with fonts from ui.fonts and once with the old
+behaviour of building pygame.font.SysFont on every call.
+
+Run from src/:
+    python -m benchmarks.bench_fonts --frames 300
+"""
+from __future__ import annotations
+
+import argparse
+
+from benchmarks.common import format_row, init_headless, time_frames
+
+import pygame
+
+QUIZZES = [
+    {"type": "multiple_choice", "select_count": 4, "question": "Which school tasks do you enjoy most?",
+     "answers": ["Math/Logic", "Writing/Language", "Design/Art", "Science/Lab"], "user_choice_index": 1},
+    {"type": "slider", "select_count": 10, "question": "How much do you like working with people?",
+     "user_choice_index": 4},
+    {"type": "textinput", "question": "If you could learn any skill in 3 months, what would it be?",
+     "placeholder": "coding, baking, photography", "user_input": ""},
+]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    screen = init_headless()
+    import app.game_quizes as gq
+    from ui.fonts import font_registry, get_font
+    from ui.text_cache import text_cache
+
+    bg = pygame.Surface(screen.get_size())
+    font = get_font("Arial", 32)
+
+    def uncached(family, size, bold=False, italic=False):
+        return pygame.font.SysFont(family, size, bold=bold, italic=italic)
+
+    print("draw_quiz_screen:")
+    for quiz in QUIZZES:
+        def frame() -> None:
+            gq.draw_quiz_screen(screen, font, bg, quiz, npc_name="Fedora")
+
+        gq.get_font = uncached
+        before = time_frames(frame, args.frames)
+        gq.get_font = get_font
+        after = time_frames(frame, args.frames)
+        print(format_row(f"{quiz['type']} (SysFont/frame)", before))
+        print(format_row(f"{quiz['type']} (registry)", after))
+        print(f"  {'':<28} {before['mean_ms'] / max(after['mean_ms'], 1e-9):7.1f}x faster")
+
+    print("registry stats:", font_registry().stats())
+
+    # Text cache hit rate in steady state (the SysFont pass above keys on throwaway fonts).
+    tc = text_cache()
+    tc.clear()
+    tc.hits = tc.misses = tc.evictions = 0
+    for quiz in QUIZZES:
+        for _ in range(args.frames):
+            gq.draw_quiz_screen(screen, font, bg, quiz, npc_name="Fedora")
+    print("text cache stats:", tc.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Tail latency with and without hedged LLM requests.
+
+Runs the flow simulator (benchmarks.flow_sim) twice against an in-process
+stub server whose latency has a stall tail (--latency, default
+lognormal:0.2,0.4, plus --stall-rate of requests stalling --stall seconds):
+once plain, once with a HedgePolicy on the client.
+Both runs use the same stub seed. Reports p50/p95/p99 per stage, with
+gen_gate_scene first, plus the extra requests hedging spent and how many
+hedges won. The policy needs --warmup playthroughs of history before it
+hedges; those are run first and not measured.
+
+Run from src/:
+    python -m benchmarks.bench_hedging --playthroughs 200 --concurrency 16
+"""
+from __future__ import annotations
+
+import argparse
+from typing import Any
+
+from benchmarks.flow_sim import simulate
+from benchmarks.stub_llm_server import StubLLMServer
+from core.content_engine import ContentEngine
+from integrations.hedging import HedgePolicy
+from integrations.llm_client import LLMClient
+
+
+def run(args: argparse.Namespace, hedge: HedgePolicy | None) -> tuple[dict[str, Any], dict[str, Any]]:
+    server = StubLLMServer(port=0, latency=args.latency, token_delay=args.token_delay,
+                           stall_rate=args.stall_rate, stall_s=args.stall, seed=args.seed)
+    server.start()
+    try:
+        llm = LLMClient(server.endpoint, "stub-key", "2024-02-15-preview", "stub", hedge=hedge)
+        engine = ContentEngine(llm)
+        if args.warmup:
+            simulate(engine, llm, args.warmup, args.concurrency, seed=10_000)
+            llm.reset_metrics()
+        report = simulate(engine, llm, args.playthroughs, args.concurrency, args.seed)
+        return report, server.snapshot()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--playthroughs", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--latency", default="lognormal:0.2,0.4", help="stub first-token latency spec")
+    parser.add_argument("--stall-rate", type=float, default=0.03)
+    parser.add_argument("--stall", type=float, default=2.0)
+    parser.add_argument("--token-delay", type=float, default=0.0005)
+    parser.add_argument("--quantile", type=float, default=0.95)
+    parser.add_argument("--budget", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    plain, _ = run(args, None)
+    hedged, server = run(args, HedgePolicy(quantile=args.quantile, budget=args.budget))
+
+    print(f"{args.playthroughs} playthroughs, concurrency {args.concurrency}, latency {args.latency}, "
+          f"{args.stall_rate:.0%} stalls of {args.stall:g} s")
+    print(f"  {'stage':<9} {'p50 ms':>15} {'p95 ms':>15} {'p99 ms':>15}")
+    for stage in ("gate", "part1", "part2", "analysis"):
+        a, b = plain["stages"][stage], hedged["stages"][stage]
+        cols = "".join(f" {a[k]:7.0f}->{b[k]:<7.0f}" for k in ("p50_ms", "p95_ms", "p99_ms"))
+        print(f"  {stage:<9}{cols}")
+    gate_before, gate_after = plain["stages"]["gate"]["p99_ms"], hedged["stages"]["gate"]["p99_ms"]
+    if gate_before:
+        print(f"  gen_gate_scene p99 {gate_before:.0f} -> {gate_after:.0f} ms "
+              f"({(gate_after - gate_before) / gate_before:+.0%})")
+    llm = hedged["llm"]
+    print(f"  hedges {llm['hedges']} ({llm['hedge_extra_share']:.1%} extra requests, budget {args.budget:.0%}), "
+          f"won {llm['hedge_wins']}, denied {llm['hedge_denied']}, streams cancelled {server['cancelled']}")
+    print(f"  learned thresholds (s) { {k: round(v, 3) for k, v in llm['hedge_thresholds_s'].items()} }")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Idle CPU benchmark for ui.frame_scheduler.
+
+Leaves the game sitting on a dialog with no input for --seconds of wall time
+and reports CPU use (process time / wall time) and frames run, for:
+- the legacy app/main.py WISEMAN quiz state
+- the screen-flow WiseManScreen through ScreenManager
+each with a fixed clock.tick(60) loop and with the FrameScheduler.
+
+Run from src/:
+    python -m benchmarks.bench_idle --seconds 3
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable
+
+from benchmarks.common import init_headless
+
+import pygame
+
+QUIZ = {
+    "type": "multiple_choice",
+    "select_count": 4,
+    "question": "Which kind of work would you most like to try first?",
+    "answers": ["Engineering", "Design", "IT", "Business"],
+    "user_choice_index": 0,
+}
+
+
+def measure(frame: Callable[[], None], seconds: float, warmup: float = 1.0) -> tuple[float, int]:
+    end = time.perf_counter() + warmup  # past the scheduler's idle_after
+    while time.perf_counter() < end:
+        frame()
+    frames = 0
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    while time.perf_counter() - wall0 < seconds:
+        frame()
+        frames += 1
+    wall = time.perf_counter() - wall0
+    return (time.process_time() - cpu0) / wall * 100.0, frames
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args(argv)
+
+    surface = init_headless()
+    import app.game_quizes as gq
+    import app.main as legacy
+    from core.content_engine import ContentEngine
+    from integrations.llm_client import LLMClient
+    from app.state import AppState
+    from ui.frame_scheduler import FrameScheduler
+    from ui.screen_manager import ScreenManager
+    from ui.screens.wise_man_screen import WiseManScreen
+
+    gq.quiz_questions_wiseman = [QUIZ]
+    gq.quiz_i = 0
+    legacy.state = legacy.WISEMAN
+
+    sm = ScreenManager(None)
+    sm.set(WiseManScreen(sm, AppState(), *surface.get_size(), ContentEngine(LLMClient(None, None, None, None)), None))
+
+    clock = pygame.time.Clock()
+
+    def legacy_fixed() -> None:
+        clock.tick(60)
+        pygame.event.get()
+        legacy.render_state()
+        pygame.display.flip()
+
+    legacy_sched = FrameScheduler(60)
+
+    def legacy_idle() -> None:
+        legacy_sched.next_frame(legacy.is_idle())
+        legacy.render_state()
+        pygame.display.flip()
+
+    def flow_fixed() -> None:
+        clock.tick(60)
+        pygame.event.get()
+        sm.update(1 / 60)
+        sm.draw(surface)
+        pygame.display.flip()
+
+    flow_sched = FrameScheduler(60)
+
+    def flow_idle() -> None:
+        dt, _ = flow_sched.next_frame(sm.is_idle())
+        sm.update(dt)
+        sm.present(surface)
+
+    print(f"{args.seconds:.1f} s idle on a dialog")
+    for name, frame in (
+        ("main.py WISEMAN tick(60)", legacy_fixed),
+        ("main.py WISEMAN scheduler", legacy_idle),
+        ("WiseManScreen tick(60)", flow_fixed),
+        ("WiseManScreen scheduler", flow_idle),
+    ):
+        cpu, frames = measure(frame, args.seconds)
+        print(f"  {name:<28} {cpu:6.1f}% CPU  {frames / args.seconds:6.1f} frames/s")
+
+
+if __name__ == "__main__":
+    main()
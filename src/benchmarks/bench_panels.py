@@ -0,0 +1,107 @@
+"""
+Allocation benchmark for ui.panels.
+
+Counts pygame.Surface constructions and the pixel memory they allocate per
+steady-state frame for the quiz dialog box and the QuestionModal
+overlay, comparing the old per-frame SRCALPHA surfaces against the cached
+panels, and times both.
+
+Run from src/:
+    python -m benchmarks.bench_panels --frames 300
+"""
+from __future__ import annotations
+
+import argparse
+from typing import Callable
+
+from benchmarks.common import CountingSurface, RealSurface, format_row, init_headless, time_frames
+
+import pygame
+
+
+QUIZ = {
+    "type": "multiple_choice",
+    "select_count": 4,
+    "question": "Which kind of work would you most like to try first?",
+    "answers": ["Engineering", "Design", "IT", "Business"],
+    "user_choice_index": 0,
+}
+QUESTION = {
+    "type": "mcq",
+    "prompt": "Which sounds more interesting right now?",
+    "options": ["Designing apps", "Making them fast", "Explaining them"],
+}
+
+
+def legacy_dialog_box(surface, rect, fill_color=(0, 0, 0), alpha=200, border_color=(255, 255, 255), border=3, radius=18):
+    box = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+    pygame.draw.rect(box, (*fill_color, alpha), box.get_rect(), border_radius=radius)
+    surface.blit(box, (rect.x, rect.y))
+    pygame.draw.rect(surface, border_color, rect, border, border_radius=radius)
+
+
+def legacy_overlay(surface, w, h):
+    overlay = pygame.Surface((w, h), pygame.SRCALPHA)
+    overlay.fill((0, 0, 0, 120))
+    surface.blit(overlay, (0, 0))
+
+
+def allocations(frame: Callable[[], None], frames: int) -> tuple[float, float]:
+    """
+    (surfaces, pixel KiB) allocated per frame after warmup.
+    """
+    for _ in range(10):
+        frame()
+    CountingSurface.created = 0
+    CountingSurface.pixel_bytes = 0
+    for _ in range(frames):
+        frame()
+    return CountingSurface.created / frames, CountingSurface.pixel_bytes / frames / 1024.0
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    screen = init_headless()
+    pygame.Surface = CountingSurface  # count every Surface built from Python
+
+    import app.game_quizes as gq
+    from ui.fonts import get_font
+    from ui.panels import draw_panel, panel_cache
+    from ui.screens.question_modal import QuestionModal
+
+    w, h = screen.get_size()
+    box = pygame.Rect(40, 50, 720, 330)
+    bg = RealSurface((w, h))
+    font = get_font("Arial", 32)
+    modal = QuestionModal(w, h)
+    modal.open(QUESTION)
+
+    def legacy_frame() -> None:
+        legacy_dialog_box(screen, box, fill_color=(10, 10, 10), alpha=210)
+        legacy_overlay(screen, w, h)
+
+    def cached_frame() -> None:
+        gq.draw_dialog_box(screen, box, fill_color=(10, 10, 10), alpha=210)
+        draw_panel(screen, screen.get_rect(), (0, 0, 0), alpha=120)
+
+    def quiz_frame() -> None:
+        gq.draw_quiz_screen(screen, font, bg, QUIZ, npc_name="Fedora")
+        modal.draw(screen)
+
+    print(f"{args.frames} frames per case")
+    for name, frame in (
+        ("per-frame SRCALPHA", legacy_frame),
+        ("cached panels", cached_frame),
+        ("quiz + modal (full)", quiz_frame),
+    ):
+        surfaces, kib = allocations(frame, args.frames)
+        print(format_row(name, time_frames(frame, args.frames)))
+        print(f"  {'':<28} {surfaces:7.2f} surfaces/frame  {kib:9.1f} KiB pixels/frame")
+    print("  panel stats  :", panel_cache().stats())
+
+
+if __name__ == "__main__":
+    main()
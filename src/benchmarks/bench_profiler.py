@@ -0,0 +1,108 @@
+"""
+Frame profiler report and overhead check for ui.profiler.
+
+Runs --frames frames (handle_event, update, draw, flip) of a few screens
+through ScreenManager with the profiler overlay shown (full frames), plus
+the legacy app/main.py HOME quiz (draw_quiz_screen), then prints the
+per-phase summary and the profiler's own recording cost (same frames
+with the overlay hidden, with and without a profiler).
+--trace writes the Chrome trace (open in chrome://tracing or Perfetto).
+
+Run from src/:
+    python -m benchmarks.bench_profiler --frames 300 --trace Output/frame_trace.json
+"""
+from __future__ import annotations
+
+import argparse
+
+from benchmarks.common import format_row, init_headless, time_frames
+
+import pygame
+
+QUIZ = {
+    "type": "multiple_choice",
+    "select_count": 4,
+    "question": "Which kind of work would you most like to try first?",
+    "answers": ["Engineering", "Design", "IT", "Business"],
+    "user_choice_index": 0,
+}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--trace", default=None)
+    args = parser.parse_args(argv)
+
+    surface = init_headless()
+    w, h = surface.get_size()
+    import app.game_quizes as gq
+    import app.main as legacy
+    from app.state import AppState
+    from ui.profiler import FrameProfiler
+    from ui.screen_manager import ScreenManager
+    from ui.screens.house_questions_screen import HouseQuestionsScreen
+    from ui.screens.training_map_screen import TrainingMapScreen
+
+    def screens(sm: ScreenManager) -> list:
+        state = AppState()
+        game_map = TrainingMapScreen(sm, state, w, h)
+        return [game_map, HouseQuestionsScreen(sm, state, w, h, back_screen=game_map)]
+
+    def flow_frame(sm: ScreenManager):
+        def frame() -> None:
+            if sm.profiler is not None:
+                sm.profiler.begin_frame()
+            sm.handle_event(pygame.event.Event(pygame.MOUSEMOTION, pos=(10, 10), rel=(0, 0), buttons=(0, 0, 0)))
+            sm.update(1 / 60)
+            sm.present(surface)
+            if sm.profiler is not None:
+                sm.profiler.end_frame()
+        return frame
+
+    # Overhead: recording only (overlay hidden, so dirty-rect screens still skip draws)
+    results = []
+    for prof in (None, FrameProfiler()):
+        sm = ScreenManager(None, profiler=prof)
+        for screen in screens(sm):
+            sm.set(screen)
+            results.append((f"{type(screen).__name__}{' +prof' if prof else ''}",
+                            time_frames(flow_frame(sm), args.frames)))
+
+    # Report: overlay shown, which forces full frames
+    profiler = FrameProfiler()
+    profiler.overlay_visible = True
+    sm = ScreenManager(None, profiler=profiler)
+    for screen in screens(sm):
+        sm.set(screen)
+        time_frames(flow_frame(sm), args.frames)
+
+    gq.quiz_questions_home = [QUIZ]
+    gq.quiz_i = 0
+    legacy.state = legacy.HOME
+
+    def legacy_frame() -> None:
+        profiler.begin_frame()
+        with profiler.phase(legacy.state, "draw"):
+            legacy.render_state()
+        profiler.draw_overlay(legacy.screen)
+        with profiler.phase(legacy.state, "flip"):
+            pygame.display.flip()
+        profiler.end_frame()
+
+    time_frames(legacy_frame, args.frames)
+
+    print(f"{args.frames} full frames per screen (mean/p50/p99/max ms)")
+    for key, row in profiler.summary().items():
+        print(f"  {key:<36} {row['mean_ms']:7.3f} {row['p50_ms']:7.3f} {row['p99_ms']:7.3f} {row['max_ms']:7.3f}")
+    scope, name, mean = profiler.slowest_phase()
+    print(f"  slowest phase: {scope}.{name} ({mean:.3f} ms)")
+    print("profiler overhead (frame loop without / with profiler, overlay hidden)")
+    for name, r in results:
+        print(format_row(name, r))
+    if args.trace:
+        print(f"wrote {profiler.dump_trace(args.trace)} trace events to {args.trace}")
+
+
+if __name__ == "__main__":
+    main()
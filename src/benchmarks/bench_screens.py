@@ -0,0 +1,151 @@
+"""
+Gate entry benchmark for the ScreenManager screen stack/cache.
+
+Times entering a gate from the training map (main-thread ms until the
+GateSceneScreen is current), with the offline ContentEngine plus --latency
+seconds of simulated LLM time per gen_gate_scene:
+- rebuilt: a new GateSceneScreen (and ContentEngine) on every entry
+- cached, first visit: sm.cached() builds it once
+- cached, revisit: the same gate again
+- preloaded: sm.preload() when the gates spawn, entered --walk seconds later
+
+It then checks request priority: with a RateLimiter saturated at
+max_in_flight=1, all the --gates are preloaded and the last one is entered
+with sm.push_cached() while the others are still queued. The entered gate
+must be admitted next, ahead of the queued preloads (exit status 1 if not).
+
+Run from src/:
+    python -m benchmarks.bench_screens --latency 0.5
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from benchmarks.common import init_headless
+
+OPTION = "Software Engineering"
+
+
+class SlowEngine:
+    """ContentEngine stand-in adding a fixed delay to gen_gate_scene."""
+
+    def __init__(self, engine, latency: float):
+        self.engine = engine
+        self.latency = latency
+
+    def gen_gate_scene(self, **kwargs):
+        time.sleep(self.latency)
+        return self.engine.gen_gate_scene(**kwargs)
+
+
+class QueuedEngine:
+    """
+    ContentEngine stand-in that goes through a RateLimiter the way
+    LLMClient does, recording the order gate requests are admitted in.
+    """
+
+    def __init__(self, engine, limiter, latency: float):
+        self.engine = engine
+        self.limiter = limiter
+        self.latency = latency
+        self.admitted: list[str] = []
+
+    def gen_gate_scene(self, **kwargs):
+        self.limiter.acquire(1)
+        try:
+            self.admitted.append(kwargs["option_name"])
+            time.sleep(self.latency)
+        finally:
+            self.limiter.release()
+        return self.engine.gen_gate_scene(**kwargs)
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000.0
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--walk", type=float, default=1.0)
+    parser.add_argument("--gates", type=int, default=4, help="gates preloaded for the priority check")
+    args = parser.parse_args(argv)
+
+    surface = init_headless()
+    w, h = surface.get_size()
+    from app.state import AppState
+    from core.content_engine import ContentEngine
+    from integrations.llm_client import LLMClient
+    from integrations.rate_limiter import RateLimiter
+    from ui.screen_manager import ScreenManager
+    from ui.screens.gate_scene_screen import GateSceneScreen
+    from ui.screens.training_map_screen import TrainingMapScreen
+
+    state = AppState()
+    engine = SlowEngine(ContentEngine(LLMClient(None, None, None, None)), args.latency)
+    sm = ScreenManager(None)
+    game_map = TrainingMapScreen(sm, state, w, h)
+    sm.set(game_map)
+
+    def rebuilt() -> None:
+        screen = GateSceneScreen(sm, state, w, h, back_screen=game_map, option_name=OPTION)
+        screen.engine = engine  # keep the per-entry engine build, add the latency
+        screen.payload = engine.gen_gate_scene(option_name=OPTION, work_path=screen.work_path)
+        sm.push(screen)
+
+    def enter(option: str):
+        return lambda: sm.push(sm.cached(
+            GateSceneScreen, sm, state, w, h, back_screen=game_map, option_name=option, engine=engine))
+
+    rows = []
+    rows.append(("rebuilt every entry", timed(rebuilt)))
+    sm.pop_to(game_map)
+    rows.append(("cached, first visit", timed(enter(OPTION))))
+    sm.pop_to(game_map)
+    rows.append(("cached, revisit", timed(enter(OPTION))))
+    sm.pop_to(game_map)
+
+    other = "Data Analytics"
+    sm.preload(GateSceneScreen, sm, state, w, h, back_screen=game_map, option_name=other, engine=engine)
+    end = time.perf_counter() + args.walk
+    while time.perf_counter() < end:  # player walking over to the gate
+        sm.update(1 / 60)
+        time.sleep(1 / 60)
+    rows.append((f"preloaded ({args.walk:.1f} s ahead)", timed(enter(other))))
+
+    print(f"gate entry, {args.latency:.2f} s simulated LLM latency (main-thread ms)")
+    for name, ms in rows:
+        print(f"  {name:<28} {ms:9.2f} ms")
+    print(f"  stats {sm.stats()}")
+
+    # Entered gate vs queued preloads, one request in flight at a time
+    queued = QueuedEngine(ContentEngine(LLMClient(None, None, None, None)), RateLimiter(max_in_flight=1), args.latency)
+    sm = ScreenManager(None)
+    game_map = TrainingMapScreen(sm, state, w, h)
+    sm.set(game_map)
+    gates = [f"Gate {i + 1}" for i in range(args.gates)]
+    for option in gates:
+        sm.preload(GateSceneScreen, sm, state, w, h, back_screen=game_map, option_name=option, engine=queued)
+    while not queued.admitted:  # first preload is on the wire, the rest queue behind it
+        time.sleep(0.001)
+    time.sleep(0.05)
+    entered = gates[-1]
+    start = time.perf_counter()
+    sm.push_cached(GateSceneScreen, sm, state, w, h, back_screen=game_map, option_name=entered, engine=queued)
+    while not (isinstance(sm.current, GateSceneScreen) and sm.current.option_name == entered):
+        sm.update(1 / 60)
+        time.sleep(1 / 60)
+    waited = time.perf_counter() - start
+    position = queued.admitted.index(entered)
+    print(f"entered {entered!r} with {args.gates - 1} preloads queued (max_in_flight=1)")
+    print(f"  admission order {queued.admitted}")
+    print(f"  entered gate admitted {position + 1} of {args.gates}, on screen after {waited:.2f} s")
+    if position != 1:
+        raise SystemExit("entered gate was not admitted ahead of the queued preloads")
+
+
+if __name__ == "__main__":
+    main()
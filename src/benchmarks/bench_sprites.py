@@ -0,0 +1,82 @@
+"""
+Frame-time benchmark for the HOME and WISEMAN states of app/main.py.
+
+Renders each quiz state headlessly with the AssetManager's scaled sprites
+warm (steady state) and with the old per-frame pygame.transform.scale of
+both sprites added to every frame. The sprite step is also timed on its
+own, since the full frame is dominated by the background blit.
+
+Run from src/:
+    python -m benchmarks.bench_sprites --frames 600
+"""
+from __future__ import annotations
+
+import argparse
+
+from benchmarks.common import format_row, init_headless, time_frames
+
+import pygame
+
+SHORT = {"multiple_choice": "mcq", "slider": "slider"}
+
+QUIZZES = [
+    {
+        "type": "multiple_choice",
+        "select_count": 4,
+        "question": "Which kind of work would you most like to try first?",
+        "answers": ["Engineering", "Design", "IT", "Business"],
+        "user_choice_index": 0,
+    },
+    {
+        "type": "slider",
+        "select_count": 10,
+        "question": "How confident are you in your current choice of course?",
+        "user_choice_index": 4,
+    },
+]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args(argv)
+
+    init_headless()
+    import app.game_quizes as gq
+    import app.main as legacy
+    from ui.asset_manager import asset_manager
+
+    assets = asset_manager()
+    gq.quiz_questions_home = QUIZZES
+    gq.quiz_questions_wiseman = QUIZZES
+
+    def sprite_step_scale() -> None:
+        pygame.transform.scale(legacy.main_player.img_down, (250, 250))
+        pygame.transform.scale(legacy.fedora.img_down, (200, 200))
+
+    def sprite_step_cached() -> None:
+        assets.load(legacy.main_player.img_path + "south.png", (250, 250))
+        assets.load(legacy.fedora.img_path + "south.png", (200, 200))
+
+    print(f"{args.frames} frames per case")
+    print(format_row("sprite step scale()", time_frames(sprite_step_scale, args.frames)))
+    print(format_row("sprite step cached", time_frames(sprite_step_cached, args.frames)))
+    for name, state in (("HOME", legacy.HOME), ("WISEMAN", legacy.WISEMAN)):
+        legacy.state = state
+        for quiz_i in range(len(QUIZZES)):
+            gq.quiz_i = quiz_i
+
+            def uncached() -> None:
+                sprite_step_scale()
+                legacy.render_state()
+
+            cold = time_frames(uncached, args.frames)
+            warm = time_frames(legacy.render_state, args.frames)
+            label = f"{name} {SHORT[QUIZZES[quiz_i]['type']]}"
+            print(format_row(f"{label} per-frame", cold))
+            print(format_row(f"{label} cached", warm))
+    print("  asset stats  :", assets.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Memory and attribute-access benchmark for the AppState model.
+
+Compares the slotted dataclasses in app.state against dict-backed copies with
+the same fields (what the classes were before slots), at server-like session
+counts.
+
+Run from src/:
+    python -m benchmarks.bench_state --sessions 10000
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import gc
+import timeit
+import tracemalloc
+from typing import Any
+
+from app.state import AppState, GameData, UserProfile, WorldState
+
+
+def _unslotted_copies() -> type:
+    """
+    Rebuild AppState and its children as regular (__dict__) dataclasses.
+    """
+    mapping: dict[type, type] = {}
+    for cls in (UserProfile, GameData, WorldState, AppState):
+        fields: list[tuple[str, Any, Any]] = []
+        for f in dataclasses.fields(cls):
+            if f.default_factory is not dataclasses.MISSING:
+                factory = mapping.get(f.default_factory, f.default_factory)
+                spec = dataclasses.field(default_factory=factory)
+            else:
+                spec = dataclasses.field(default=f.default)
+            fields.append((f.name, f.type, spec))
+        mapping[cls] = dataclasses.make_dataclass(f"Dict{cls.__name__}", fields)
+    return mapping[AppState]
+
+
+def _measure_memory(factory, sessions: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = [factory() for _ in range(sessions)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del keep
+    return after - before
+
+
+def _measure_access(state: Any, number: int) -> float:
+    def read() -> None:
+        state.profile.education_status
+        state.data.inferred_fields
+        state.data.part2_answers
+        state.world.current_gate_option
+
+    return min(timeit.repeat(read, number=number, repeat=5)) / number * 1e9
+
+
+def _measure_legacy_getattr(state: Any, number: int) -> float:
+    # The lookup pattern screens used before the fields were declared.
+    def read() -> None:
+        getattr(state.profile, "education_status", "Secondary School")
+        getattr(state, "inferred_fields", state.data.inferred_fields)
+        getattr(state, "part2_answers", state.data.part2_answers)
+        getattr(state, "current_gate_option", None)
+
+    return min(timeit.repeat(read, number=number, repeat=5)) / number * 1e9
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10000)
+    parser.add_argument("--number", type=int, default=200000)
+    args = parser.parse_args(argv)
+
+    DictAppState = _unslotted_copies()
+
+    slotted_bytes = _measure_memory(AppState, args.sessions)
+    dict_bytes = _measure_memory(DictAppState, args.sessions)
+    print(f"sessions: {args.sessions}")
+    print(f"  slotted AppState : {slotted_bytes / args.sessions:8.0f} B/session  ({slotted_bytes / 1e6:.1f} MB)")
+    print(f"  dict AppState    : {dict_bytes / args.sessions:8.0f} B/session  ({dict_bytes / 1e6:.1f} MB)")
+
+    print("attribute access (4 reads):")
+    print(f"  slotted          : {_measure_access(AppState(), args.number):6.1f} ns")
+    print(f"  dict             : {_measure_access(DictAppState(), args.number):6.1f} ns")
+    print(f"  dict + getattr() : {_measure_legacy_getattr(DictAppState(), args.number):6.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Measurement-cost benchmark for ui.text_layout.
+
+Counts font.size() calls and wrap time per frame for typical question
+prompts, comparing the old prefix-measuring wrap (formerly in
+app/game_quizes.wrap_text and QuestionModal._blit_wrap) against the cached
+layout engine.
+
+Run from src/:
+    python -m benchmarks.bench_text_layout --frames 300
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from benchmarks.common import init_headless
+
+import pygame
+
+PROMPTS = [
+    "On a scale of 0-10, how difficult is balancing coursework with personal study and other commitments?",
+    "If you could spend a month building one small project with free tools, what would you want it to do for people?",
+    "Which sounds more interesting right now: designing how an app looks, making it run fast, or explaining it to users?",
+]
+
+
+class CountingFont(pygame.font.Font):
+    calls = 0
+
+    def size(self, text):  # type: ignore[override]
+        CountingFont.calls += 1
+        return super().size(text)
+
+
+def legacy_wrap(text, font, max_width):
+    words = text.split(" ")
+    lines = []
+    cur = ""
+    for w in words:
+        test = (cur + " " + w).strip()
+        if font.size(test)[0] <= max_width:
+            cur = test
+        else:
+            lines.append(cur)
+            cur = w
+    if cur:
+        lines.append(cur)
+    return lines
+
+
+def run(wrap, font, frames: int) -> tuple[float, float]:
+    CountingFont.calls = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        for p in PROMPTS:
+            wrap(p, font, 600)
+    elapsed = time.perf_counter() - start
+    return CountingFont.calls / frames, elapsed / frames * 1e6
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    init_headless()
+    from ui.text_layout import TextLayout
+
+    font = CountingFont(None, 28)
+    layout = TextLayout()
+
+    legacy_calls, legacy_us = run(legacy_wrap, font, args.frames)
+    cached_calls, cached_us = run(layout.wrap, font, args.frames)
+    print(f"{len(PROMPTS)} prompts per frame, {args.frames} frames")
+    print(f"  prefix wrap  : {legacy_calls:8.2f} font.size()/frame  {legacy_us:8.1f} us/frame")
+    print(f"  text_layout  : {cached_calls:8.2f} font.size()/frame  {cached_us:8.1f} us/frame")
+    print("  layout stats :", layout.stats())
+
+
+if __name__ == "__main__":
+    main()
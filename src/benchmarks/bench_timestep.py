@@ -0,0 +1,86 @@
+"""
+Frame-rate independence check for the fixed-timestep loop (ui.timestep).
+
+Holds the right arrow for --seconds of game time at several frame rates
+and reports how far the player travelled:
+- legacy Player (app/main.py): old integer-rect move vs float Player.move
+  stepped by FixedTimestep
+- TrainingMapScreen: old 3 px per frame vs 180 px/s at a fixed step
+
+With the fixed step every frame rate should cover the same distance (the
+interpolated draw position trails the simulation by up to one step).
+Frames are simulated (no sleeping), so this runs in well under a second.
+
+Run from src/:
+    python -m benchmarks.bench_timestep --seconds 1
+"""
+from __future__ import annotations
+
+import argparse
+
+from benchmarks.common import HeldKeys, init_headless
+
+import pygame
+
+RATES = (30, 60, 144)
+
+
+def legacy_player_distance(speed: float, fps: int, seconds: float) -> float:
+    rect = pygame.Rect(0, 300, 100, 100)
+    for _ in range(round(seconds * fps)):
+        rect.x += speed * (1.0 / fps)  # old Player.move: truncated into the int rect
+    return rect.x
+
+
+def fixed_player_distance(speed: float, fps: int, seconds: float) -> float:
+    from app.game_classes import Player
+    from ui.timestep import FixedTimestep, lerp
+
+    player = Player(0, 300, 100, 100, "images/warrior/", speed)
+    ts = FixedTimestep()
+    for _ in range(round(seconds * fps)):
+        for _ in range(ts.advance(1.0 / fps)):
+            player.move(ts.step, 100000, 100000)
+    return lerp(player.prev_x, player.x, ts.alpha)
+
+
+def training_map_distance(fps: int, seconds: float, fixed: bool) -> float:
+    from app.state import AppState
+    from ui.screen_manager import ScreenManager
+    from ui.screens.training_map_screen import TrainingMapScreen
+
+    sm = ScreenManager(None)
+    screen = TrainingMapScreen(sm, AppState(), 900, 600)
+    screen.player_rect.topleft = (0, 500)  # clear of the house and the wise man
+    frames = round(seconds * fps)
+    if not fixed:
+        return 3 * frames  # old update: 3 px per frame, dt ignored
+    for _ in range(frames):
+        for _ in range(sm.timestep.advance(1.0 / fps)):
+            screen.update(sm.timestep.step)
+    sm.alpha = sm.timestep.alpha
+    return screen._interpolated_player_rect().x
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    init_headless()
+    pygame.key.get_pressed = lambda: HeldKeys(pygame.K_RIGHT)
+
+    print(f"distance (px) after holding right for {args.seconds:.2f} s of game time")
+    print(f"  {'':<32}" + "".join(f"{f'{fps} fps':>10}" for fps in RATES))
+    rows = [
+        ("Player speed=800, int rect", lambda fps: legacy_player_distance(800, fps, args.seconds)),
+        ("Player speed=800, fixed step", lambda fps: fixed_player_distance(800, fps, args.seconds)),
+        ("TrainingMap 3 px/frame", lambda fps: training_map_distance(fps, args.seconds, fixed=False)),
+        ("TrainingMap 180 px/s, fixed", lambda fps: training_map_distance(fps, args.seconds, fixed=True)),
+    ]
+    for name, fn in rows:
+        print(f"  {name:<32}" + "".join(f"{fn(fps):10.1f}" for fps in RATES))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Location-change benchmark for ui.transition.
+
+Times a location switch that needs an LLM call (simulated with the offline
+ContentEngine plus --latency seconds of sleep) and reports total wall time
+and the longest gap between two event pumps (how long the window is
+unresponsive):
+- legacy: loading_screen() title + time.sleep(1), then the call inline
+- Transition: overlay animated at 60 FPS while the call runs on a
+  background thread, for as long as the call needs (min 0.4 s)
+
+Run from src/:
+    python -m benchmarks.bench_transition --latency 0 0.3 1.5
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from benchmarks.common import init_headless
+
+import pygame
+
+
+def legacy_switch(surface: pygame.Surface, task) -> list[float]:
+    from ui.fonts import get_font
+    from ui.text_cache import render_text
+
+    pumps = [time.perf_counter()]
+    surface.fill((0, 0, 0))
+    surface.blit(render_text(get_font("Arial", 32), "Entering Home", True, (255, 255, 255)), [300, 300])
+    pygame.display.flip()
+    time.sleep(1)
+    task()
+    pygame.event.get()
+    pumps.append(time.perf_counter())
+    return pumps
+
+
+def transition_switch(surface: pygame.Surface, task) -> list[float]:
+    from ui.transition import Transition
+
+    clock = pygame.time.Clock()
+    transition = Transition("Entering Home", task)
+    pumps = [time.perf_counter()]
+    while True:
+        dt = clock.tick(60) / 1000.0
+        pygame.event.get()
+        pumps.append(time.perf_counter())
+        transition.update(dt)
+        if transition.done:
+            transition.finish()
+            return pumps
+        transition.draw(surface)
+        pygame.display.flip()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--latency", type=float, nargs="*", default=[0.0, 0.3, 1.5])
+    args = parser.parse_args(argv)
+
+    surface = init_headless()
+    from core.content_engine import ContentEngine
+    from integrations.llm_client import LLMClient
+
+    engine = ContentEngine(LLMClient(None, None, None, None))
+
+    for latency in args.latency:
+        def task() -> dict:
+            time.sleep(latency)
+            return engine.gen_part1("Poly", "IT")
+
+        print(f"LLM latency {latency:.1f} s")
+        for name, switch in (("loading_screen + sleep(1)", legacy_switch), ("Transition", transition_switch)):
+            pumps = switch(surface, task)
+            total = pumps[-1] - pumps[0]
+            gap = max(b - a for a, b in zip(pumps, pumps[1:]))
+            print(f"  {name:<26} total {total * 1000:7.1f} ms   longest stall {gap * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
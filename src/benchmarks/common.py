@@ -0,0 +1,75 @@
+"""
+Shared helpers for the headless benchmarks (SDL dummy video driver).
+"""
+from __future__ import annotations
+
+import os
+import statistics
+import time
+from typing import Callable
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+RealSurface = pygame.Surface
+
+
+class CountingSurface(RealSurface):
+    """
+    pygame.Surface that counts constructions and their pixel bytes.
+    Install with pygame.Surface = CountingSurface; only surfaces built from
+    Python are seen (not font.render / transform / copy results).
+    """
+
+    created = 0
+    pixel_bytes = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        CountingSurface.created += 1
+        CountingSurface.pixel_bytes += self.get_pitch() * self.get_height()
+
+
+class HeldKeys:
+    """
+    Stand-in for pygame.key.get_pressed() with the given keys held.
+    """
+
+    def __init__(self, *keys: int):
+        self.keys = set(keys)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.keys
+
+
+def init_headless(width: int = 900, height: int = 600) -> pygame.Surface:
+    pygame.init()
+    return pygame.display.set_mode((width, height))
+
+
+def time_frames(frame: Callable[[], None], frames: int, warmup: int = 10) -> dict[str, float]:
+    """
+    Call frame() repeatedly and summarize per-frame wall time in milliseconds.
+    """
+    for _ in range(warmup):
+        frame()
+    samples: list[float] = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        frame()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    samples.sort()
+    mean = statistics.fmean(samples)
+    return {
+        "frames": frames,
+        "mean_ms": mean,
+        "p50_ms": samples[len(samples) // 2],
+        "p99_ms": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+        "fps": 1000.0 / mean if mean > 0 else 0.0,
+    }
+
+
+def format_row(name: str, r: dict[str, float]) -> str:
+    return f"  {name:<28} {r['mean_ms']:7.3f} ms/frame  p99 {r['p99_ms']:7.3f} ms  {r['fps']:8.0f} fps"
@@ -0,0 +1,268 @@
+"""
+Scripted end-to-end flow simulator for LLM backend load and latency.
+
+Runs --playthroughs complete playthroughs of the real ContentEngine flow
+(profile -> Part 1 -> Part 2 -> analysis -> three gate scenes) with
+synthetic answers (app.request._mock_answers_from_payload with a seeded
+RNG), --concurrency at a time on a thread pool, and reports per stage:
+latency percentiles, token usage (from LLMClient.thread_usage) and errors,
+plus end-to-end playthrough time and throughput.
+
+By default an in-process stub server (benchmarks.stub_llm_server) answers
+over HTTP with --latency per call (seconds or a distribution spec such as
+lognormal:0.2,0.5) and optional --error-rate / --malformed-rate faults, so
+the run exercises the real AzureChatOpenAI client, retry and validation
+path. --rpm / --tpm / --max-in-flight put a shared RateLimiter in front of
+the client; gate scenes run at prefetch priority, as the training map
+preloads them, so the interactive stages are served first. --breaker adds
+a CircuitBreaker; with the stub at --error-rate 1 (backend down) it shows
+how quickly playthroughs switch to fallback content. --hedge enables
+hedged requests (see benchmarks.bench_hedging for an A/B run). --endpoint targets another server (e.g. a
+stub started separately); --offline skips HTTP and uses the engine's
+fallback content.
+
+Run from src/:
+    python -m benchmarks.flow_sim --playthroughs 1000 --concurrency 32 --latency 0.2
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from core.content_engine import ContentEngine
+from integrations.circuit_breaker import CircuitBreaker
+from integrations.hedging import HedgePolicy
+from integrations.llm_client import LLMClient
+from integrations.rate_limiter import PRIORITY_PREFETCH, RateLimiter, priority
+
+STAGES = ("part1", "part2", "analysis", "gate")
+EDUCATION = ("Secondary School", "JC", "Poly")
+POLY_COURSES = ("IT", "Engineering", "Business", "Design", "Applied Science")
+
+
+def percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+class FlowRecorder:
+    """
+    Thread-safe per-stage samples: latency (s), tokens, errors.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latency: dict[str, list[float]] = {s: [] for s in STAGES}
+        self.prompt_tokens: dict[str, list[int]] = {s: [] for s in STAGES}
+        self.completion_tokens: dict[str, list[int]] = {s: [] for s in STAGES}
+        self.errors: dict[str, int] = dict.fromkeys(STAGES, 0)
+        self.playthroughs: list[float] = []
+        self.failed = 0
+
+    def stage(self, stage: str, seconds: float, usage: dict[str, float]) -> None:
+        with self._lock:
+            self.latency[stage].append(seconds)
+            self.prompt_tokens[stage].append(int(usage["prompt_tokens"]))
+            self.completion_tokens[stage].append(int(usage["completion_tokens"]))
+
+    def error(self, stage: str) -> None:
+        with self._lock:
+            self.errors[stage] += 1
+            self.failed += 1
+
+    def done(self, seconds: float) -> None:
+        with self._lock:
+            self.playthroughs.append(seconds)
+
+    def report(self) -> dict[str, Any]:
+        stages = {}
+        for s in STAGES:
+            lat = self.latency[s]
+            stages[s] = {
+                "count": len(lat),
+                "errors": self.errors[s],
+                "p50_ms": percentile(lat, 0.50) * 1000,
+                "p95_ms": percentile(lat, 0.95) * 1000,
+                "p99_ms": percentile(lat, 0.99) * 1000,
+                "max_ms": max(lat, default=0.0) * 1000,
+                "mean_prompt_tokens": statistics.fmean(self.prompt_tokens[s]) if lat else 0.0,
+                "mean_completion_tokens": statistics.fmean(self.completion_tokens[s]) if lat else 0.0,
+            }
+        total = self.playthroughs
+        return {
+            "stages": stages,
+            "playthroughs": {
+                "completed": len(total),
+                "failed": self.failed,
+                "p50_s": percentile(total, 0.50),
+                "p99_s": percentile(total, 0.99),
+                "max_s": max(total, default=0.0),
+            },
+        }
+
+
+def _delta(before: dict[str, float], after: dict[str, float]) -> dict[str, float]:
+    return {k: after[k] - before[k] for k in after}
+
+
+def playthrough(engine: ContentEngine, llm: LLMClient, rec: FlowRecorder, seed: int) -> None:
+    from app.request import _mock_answers_from_payload
+
+    rng = random.Random(seed)
+    edu = rng.choice(EDUCATION)
+    poly_course = rng.choice(POLY_COURSES) if edu == "Poly" else None
+    start = time.perf_counter()
+
+    def run(stage: str, fn, *args):
+        before = llm.thread_usage()
+        t0 = time.perf_counter()
+        try:
+            out = fn(*args)
+        except Exception:
+            rec.error(stage)
+            raise
+        rec.stage(stage, time.perf_counter() - t0, _delta(before, llm.thread_usage()))
+        return out
+
+    try:
+        part1 = run("part1", engine.gen_part1, edu, poly_course)
+        part2 = run("part2", engine.gen_part2, edu, _mock_answers_from_payload(part1, rng))
+        part2_answers = _mock_answers_from_payload(part2, rng)
+
+        poly_choice = None
+        if isinstance(part2.get("poly_extra_question"), dict) and part2_answers:
+            poly_choice = part2_answers[-1]["answer"]
+        analysis = run("analysis", engine.gen_analysis, edu, poly_choice,
+                       part2.get("inferred_fields", []), part2_answers)
+
+        work_path = edu == "Poly" and poly_choice == "Work"
+        with priority(PRIORITY_PREFETCH):
+            for option in analysis.get("suggested_options", [])[:3]:
+                run("gate", engine.gen_gate_scene, option, work_path, edu, poly_choice)
+    except Exception:
+        return
+    rec.done(time.perf_counter() - start)
+
+
+def simulate(engine: ContentEngine, llm: LLMClient, playthroughs: int, concurrency: int, seed: int = 0) -> dict[str, Any]:
+    rec = FlowRecorder()
+    start = time.perf_counter()
+    # ContentEngine prints every generated payload; keep the report readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="flow") as pool:
+            for i in range(playthroughs):
+                pool.submit(playthrough, engine, llm, rec, seed + i)
+    wall = time.perf_counter() - start
+
+    report = rec.report()
+    report["wall_s"] = wall
+    report["playthroughs_per_s"] = report["playthroughs"]["completed"] / wall if wall > 0 else 0.0
+    report["llm"] = llm.metrics() if llm.enabled else {}
+    report["fallbacks"] = dict(engine.fallbacks)
+    if llm.enabled and llm.limiter is not None:
+        report["limiter"] = llm.limiter.stats()
+    report["requests_per_s"] = report["llm"].get("calls", 0) / wall if wall > 0 else 0.0
+    return report
+
+
+def print_report(report: dict[str, Any]) -> None:
+    p = report["playthroughs"]
+    print(f"{p['completed']} playthroughs ok, {p['failed']} failed in {report['wall_s']:.1f} s "
+          f"({report['playthroughs_per_s']:.1f}/s, {report['requests_per_s']:.1f} LLM req/s)")
+    print(f"  playthrough p50 {p['p50_s']:.2f} s  p99 {p['p99_s']:.2f} s  max {p['max_s']:.2f} s")
+    print(f"  {'stage':<9} {'count':>6} {'err':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'in tok':>7} {'out tok':>7}")
+    for name, s in report["stages"].items():
+        print(f"  {name:<9} {s['count']:6d} {s['errors']:5d} {s['p50_ms']:8.1f} {s['p95_ms']:8.1f} "
+              f"{s['p99_ms']:8.1f} {s['max_ms']:8.1f} {s['mean_prompt_tokens']:7.0f} {s['mean_completion_tokens']:7.0f}")
+    llm = report["llm"]
+    if llm:
+        print(f"  LLM calls {llm['calls']}  attempts {llm['attempts']}  failures {llm['failures']}  "
+              f"tokens {llm['prompt_tokens']} in / {llm['completion_tokens']} out")
+        print(f"  429s {llm['rate_limited']}  backoff {llm['backoff_s']:.1f} s  queued {llm['queued_s']:.1f} s")
+        if "breaker_state" in llm:
+            print(f"  breaker {llm['breaker_state']}  opened {llm['breaker_opened']}  "
+                  f"short-circuited {llm['short_circuited']}  probes {llm['breaker_probes']}")
+        if "hedge_requests" in llm:
+            print(f"  hedges {llm['hedges']} ({llm['hedge_extra_share']:.1%} extra)  won {llm['hedge_wins']}")
+    if report["fallbacks"]:
+        print(f"  fallback content served {report['fallbacks']}")
+    lim = report.get("limiter")
+    if lim:
+        print(f"  limiter granted {lim['granted']}  max queue {lim['max_queue']}  "
+              f"max wait {lim['max_queued_s']:.2f} s  throttled {lim['throttled']}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--playthroughs", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", default="0.2", help="in-process stub latency: seconds or distribution spec")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="in-process stub injected HTTP error share")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="in-process stub non-JSON answer share")
+    parser.add_argument("--rpm", type=int, default=0, help="requests per minute limit (0 = none)")
+    parser.add_argument("--tpm", type=int, default=0, help="tokens per minute limit (0 = none)")
+    parser.add_argument("--max-in-flight", type=int, default=0, help="concurrent request cap (0 = none)")
+    parser.add_argument("--breaker", action="store_true", help="put a circuit breaker in front of the client")
+    parser.add_argument("--hedge", action="store_true", help="hedge requests slower than the learned p95")
+    parser.add_argument("--request-timeout", type=float, default=20.0, help="per-attempt HTTP timeout (s)")
+    parser.add_argument("--max-wait", type=float, default=30.0, help="total budget per LLM call (s)")
+    parser.add_argument("--endpoint", default=None, help="external chat-completions endpoint (stub or Azure)")
+    parser.add_argument("--api-key", default=os.getenv("AZURE_OPENAI_API_KEY", "stub-key"))
+    parser.add_argument("--deployment", default=os.getenv("AZURE_OPENAI_DEPLOYMENT", "stub"))
+    parser.add_argument("--api-version", default="2024-02-15-preview")
+    parser.add_argument("--offline", action="store_true", help="fallback content only, no HTTP")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", default=None, help="write the report to this path")
+    args = parser.parse_args(argv)
+
+    server = None
+    endpoint = args.endpoint
+    if not args.offline and endpoint is None:
+        from benchmarks.stub_llm_server import StubLLMServer
+
+        server = StubLLMServer(port=0, latency=args.latency, error_rate=args.error_rate,
+                               malformed_rate=args.malformed_rate, seed=args.seed)
+        server.start()
+        endpoint = server.endpoint
+
+    if args.offline:
+        llm = LLMClient(None, None, None, None)
+    else:
+        limiter = RateLimiter(args.rpm, args.tpm, args.max_in_flight)
+        llm = LLMClient(endpoint, args.api_key, args.api_version, args.deployment,
+                        limiter=limiter if limiter.enabled else None,
+                        breaker=CircuitBreaker() if args.breaker else None,
+                        hedge=HedgePolicy() if args.hedge else None,
+                        request_timeout=args.request_timeout, max_wait_s=args.max_wait)
+    engine = ContentEngine(llm)
+
+    print(f"simulating {args.playthroughs} playthroughs, concurrency {args.concurrency}, "
+          f"backend {'offline fallback' if args.offline else endpoint}")
+    report = simulate(engine, llm, args.playthroughs, args.concurrency, args.seed)
+    print_report(report)
+    if server is not None:
+        report["server"] = server.snapshot()
+        print(f"  stub server {report['server']}")
+        server.shutdown()
+        server.server_close()
+
+    if args.json:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json)), exist_ok=True)
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+"""
+Local stub of the Azure OpenAI chat-completions endpoint.
+
+Answers POST /openai/deployments/<name>/chat/completions with schema-valid
+payloads (the offline fallbacks from core.fallback_content, which pass
+core.validation) for whichever ContentEngine stage the prompt asks for,
+with a usage block estimated at ~4 characters per token. Point LLMClient
+at it to exercise the real HTTP, parsing and validation path without an
+Azure deployment:
+
+    LLMClient("http://127.0.0.1:8099", "stub-key", "2024-02-15-preview", "stub")
+
+Knobs (all randomness comes from one seeded RNG, so runs repeat):
+- --latency: time to first token, a number or a distribution spec
+  (fixed:S, uniform:A,B, normal:MEAN,SD, lognormal:MEDIAN,SIGMA, exp:MEAN)
+- --stall-rate / --stall: share of requests that stall for an extra
+  --stall seconds before answering (a slow replica or queue hiccup, the
+  kind of tail hedged requests cut)
+- --token-delay: extra seconds per completion token (generation time)
+- "stream": true requests get SSE chunks (chat.completion.chunk), paced
+  by --token-delay, ending with data: [DONE]
+- --error-rate: share of requests failing with one of --error-codes
+  (429 carries Retry-After: --retry-after)
+- --malformed-rate: share of answers whose content is not valid JSON
+  (truncated, wrapped in a code fence, or prefixed with prose)
+
+GET /stats returns request/error/malformed/stream counters, including
+streams the client closed early (cancelled).
+
+Run from src/:
+    python -m benchmarks.stub_llm_server --port 8099 --latency lognormal:0.4,0.5 \
+        --token-delay 0.002 --error-rate 0.02 --malformed-rate 0.02
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterable
+
+from core.fallback_content import fallback_analysis, fallback_gate, fallback_part1, fallback_part2
+
+
+def _context(prompt: str) -> dict[str, str]:
+    out: dict[str, str] = {}
+    for line in prompt.splitlines():
+        key, sep, value = line.partition(": ")
+        if sep and key and " " not in key:
+            out[key] = value
+    return out
+
+
+def _json_value(raw: str | None, default: Any) -> Any:
+    try:
+        return json.loads(raw) if raw else default
+    except ValueError:
+        return default
+
+
+def payload_for(prompt: str) -> tuple[str, dict[str, Any]]:
+    """
+    (stage, fallback payload) for a ContentEngine user prompt.
+    """
+    ctx = _context(prompt)
+    edu = ctx.get("education_status", "Secondary School")
+    if "Generate Part 1" in prompt:
+        return "part1", fallback_part1(edu)
+    if "Generate Part 2" in prompt:
+        return "part2", fallback_part2(edu, _json_value(ctx.get("part1_answers_json"), []))
+    if "Produce analysis" in prompt:
+        return "analysis", fallback_analysis(
+            edu, ctx.get("poly_path_choice") or None,
+            _json_value(ctx.get("inferred_fields"), []),
+            _json_value(ctx.get("part2_answers_json"), []))
+    if "gate scene" in prompt:
+        return "gate", fallback_gate(ctx.get("option_name", "Option"), ctx.get("work_path") == "True")
+    return "unknown", {}
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def parse_latency(spec: float | str) -> Callable[[random.Random], float]:
+    """
+    Sampler for a latency spec: a number of seconds or "kind:params"
+    (fixed:S, uniform:A,B, normal:MEAN,SD, lognormal:MEDIAN,SIGMA, exp:MEAN).
+    """
+    if isinstance(spec, (int, float)):
+        value = float(spec)
+        return lambda rng: value
+    kind, _, params = str(spec).partition(":")
+    if not params:
+        value = float(kind)
+        return lambda rng: value
+    nums = [float(x) for x in params.split(",")]
+    samplers: dict[str, Callable[[random.Random], float]] = {
+        "fixed": lambda rng: nums[0],
+        "uniform": lambda rng: rng.uniform(nums[0], nums[1]),
+        "normal": lambda rng: rng.gauss(nums[0], nums[1]),
+        "lognormal": lambda rng: rng.lognormvariate(math.log(nums[0]), nums[1]),
+        "exp": lambda rng: rng.expovariate(1.0 / nums[0]),
+    }
+    if kind not in samplers:
+        raise ValueError(f"unknown latency distribution: {spec!r}")
+    sample = samplers[kind]
+    return lambda rng: max(0.0, sample(rng))
+
+
+MALFORMED_MODES = ("truncated", "fenced", "prose")
+
+
+def malform(content: str, mode: str) -> str:
+    if mode == "truncated":
+        return content[: max(1, len(content) // 2)]
+    if mode == "fenced":
+        return f"```json\n{content}\n```"
+    return f"Here is the JSON you asked for: {content}"
+
+
+def chunks(text: str, size: int = 16) -> Iterable[str]:
+    for i in range(0, len(text), size):
+        yield text[i:i + size]
+
+
+class StubLLMServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server; each request is answered on its own thread.
+    Counters are in .stats (also served at GET /stats).
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8099,
+        latency: float | str = 0.0,
+        token_delay: float = 0.0,
+        error_rate: float = 0.0,
+        error_codes: tuple[int, ...] = (429, 500, 503),
+        retry_after: float = 1.0,
+        malformed_rate: float = 0.0,
+        stall_rate: float = 0.0,
+        stall_s: float = 3.0,
+        seed: int = 0,
+    ):
+        super().__init__((host, port), _Handler)
+        self.latency = parse_latency(latency)
+        self.token_delay = token_delay
+        self.error_rate = error_rate
+        self.error_codes = error_codes
+        self.retry_after = retry_after
+        self.malformed_rate = malformed_rate
+        self.stall_rate = stall_rate
+        self.stall_s = stall_s
+        self.rng = random.Random(seed)
+        self.stats: dict[str, Any] = {"requests": {}, "errors": {}, "malformed": 0, "streamed": 0, "cancelled": 0, "stalled": 0}
+        self._lock = threading.Lock()
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def requests(self) -> dict[str, int]:
+        return self.stats["requests"]
+
+    def draw(self) -> tuple[float, int | None, str | None]:
+        """
+        (first-token latency, error status or None, malformed mode or None)
+        for one request.
+        """
+        with self._lock:
+            delay = self.latency(self.rng)
+            if self.rng.random() < self.stall_rate:
+                delay += self.stall_s
+                self.stats["stalled"] += 1
+            error = self.rng.choice(self.error_codes) if self.rng.random() < self.error_rate else None
+            bad = self.rng.choice(MALFORMED_MODES) if self.rng.random() < self.malformed_rate else None
+        return delay, error, bad
+
+    def count(self, key: str, sub: str | int | None = None) -> None:
+        with self._lock:
+            if sub is None:
+                self.stats[key] += 1
+            else:
+                bucket = self.stats[key]
+                bucket[str(sub)] = bucket.get(str(sub), 0) + 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return json.loads(json.dumps(self.stats))
+
+    def start(self) -> threading.Thread:
+        """
+        Serve on a daemon thread (for in-process use by drivers).
+        """
+        t = threading.Thread(target=self.serve_forever, name="stub-llm", daemon=True)
+        t.start()
+        return t
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: StubLLMServer
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; without TCP_NODELAY, Nagle plus
+    # delayed ACK adds ~40 ms to every non-streamed answer
+    disable_nagle_algorithm = True
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] == "/stats":
+            self._send(200, self.server.snapshot())
+        else:
+            self._send(404, {"error": {"code": "NotFound", "message": "unknown route"}})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        body = _json_value(self.rfile.read(length).decode("utf-8"), {})
+        if not self.path.split("?")[0].endswith("/chat/completions") or not isinstance(body, dict):
+            self._send(404, {"error": {"code": "NotFound", "message": "unknown route"}})
+            return
+
+        messages = body.get("messages", [])
+        prompt = "\n".join(str(m.get("content", "")) for m in messages if isinstance(m, dict))
+        user = str(messages[-1].get("content", "")) if messages and isinstance(messages[-1], dict) else ""
+        stage, payload = payload_for(user)
+        self.server.count("requests", stage)
+
+        delay, error, bad = self.server.draw()
+        time.sleep(delay)
+        if error is not None:
+            self.server.count("errors", error)
+            headers = {"Retry-After": f"{self.server.retry_after:g}"} if error == 429 else {}
+            self._send(error, {"error": {"code": str(error), "message": f"stub injected error {error}"}}, headers)
+            return
+
+        content = json.dumps(payload, ensure_ascii=False)
+        if bad is not None:
+            self.server.count("malformed")
+            content = malform(content, bad)
+        usage = {"prompt_tokens": estimate_tokens(prompt), "completion_tokens": estimate_tokens(content)}
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+
+        if body.get("stream"):
+            self.server.count("streamed")
+            include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+            try:
+                self._stream(completion_id, content, usage if include_usage else None)
+            except (BrokenPipeError, ConnectionResetError):
+                # Client closed the stream early (e.g. a hedged request lost)
+                self.server.count("cancelled")
+                self.close_connection = True
+            return
+
+        time.sleep(self.server.token_delay * usage["completion_tokens"])
+        self._send(200, {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": "stub",
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": content}}],
+            "usage": usage,
+        })
+
+    def _stream(self, completion_id: str, content: str, usage: dict[str, int] | None) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def event(delta: dict[str, Any], finish: str | None = None, extra: dict[str, Any] | None = None) -> None:
+            doc = {
+                "id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                "model": "stub", "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+            }
+            if extra:
+                doc.update(extra)
+            self._chunk(f"data: {json.dumps(doc)}\n\n")
+
+        event({"role": "assistant", "content": ""})
+        for piece in chunks(content):
+            time.sleep(self.server.token_delay * estimate_tokens(piece))
+            event({"content": piece})
+        event({}, "stop")
+        if usage is not None:
+            self._chunk(f"data: {json.dumps({'id': completion_id, 'object': 'chat.completion.chunk', 'created': int(time.time()), 'model': 'stub', 'choices': [], 'usage': usage})}\n\n")
+        self._chunk("data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _chunk(self, text: str) -> None:
+        raw = text.encode("utf-8")
+        self.wfile.write(f"{len(raw):x}\r\n".encode("ascii") + raw + b"\r\n")
+        self.wfile.flush()
+
+    def _send(self, status: int, doc: dict[str, Any], headers: dict[str, str] | None = None) -> None:
+        raw = json.dumps(doc).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(raw)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency", default="0", help="seconds or distribution spec, e.g. lognormal:0.4,0.5")
+    parser.add_argument("--token-delay", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-codes", default="429,500,503")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--stall-rate", type=float, default=0.0)
+    parser.add_argument("--stall", type=float, default=3.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    server = StubLLMServer(
+        args.host, args.port, args.latency, args.token_delay, args.error_rate,
+        tuple(int(c) for c in args.error_codes.split(",") if c), args.retry_after,
+        args.malformed_rate, args.stall_rate, args.stall, args.seed)
+    print(f"stub LLM listening on {server.endpoint}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
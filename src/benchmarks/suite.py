@@ -0,0 +1,338 @@
+"""
+Headless rendering benchmark suite (SDL dummy driver).
+
+Renders every screen for --frames frames with scripted input and the
+offline ContentEngine (fallback content, no network), and reports per
+scenario:
+- frame time (mean/p50/p99 ms) and FPS, from a plain timed pass
+- pygame Surfaces constructed per frame and their pixel KiB
+- Python heap allocated per frame (tracemalloc peak above the frame's
+  starting point, from a separate pass since tracing slows frames down)
+
+Scenarios: TrainingMapScreen, QuestionModal for each question type,
+GateSceneScreen, WiseManScreen and the legacy app/main.py states.
+
+Results are written as JSON (--out). With --baseline, each scenario is
+compared against a previous results file and the run exits with status 1
+when frame time grows by more than --tolerance (relative) or more
+Surfaces are allocated per frame, so CI can gate on it.
+
+Run from src/:
+    python -m benchmarks.suite --frames 300 --out Output/bench/results.json
+    python -m benchmarks.suite --baseline Output/bench/baseline.json
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import sys
+import tracemalloc
+from typing import Any, Callable
+
+from benchmarks.common import CountingSurface, HeldKeys, time_frames
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+Frame = Callable[[], None]
+
+MODAL_QUESTIONS = {
+    "mcq": {"id": "q1", "type": "mcq", "prompt": "Which sounds more interesting right now?",
+            "options": ["Designing apps", "Making them fast", "Explaining them", "Testing them"]},
+    "slider": {"id": "q2", "type": "slider", "prompt": "How much do you enjoy working with numbers?",
+               "scale": {"min": 0, "max": 10, "min_label": "Not at all", "max_label": "A lot"}},
+    "rating": {"id": "q3", "type": "rating", "prompt": "Rate your interest in teamwork.",
+               "scale": {"min": 1, "max": 5}},
+    "text": {"id": "q4", "type": "text", "prompt": "Describe a project you are proud of.",
+             "placeholder": "Type your answer"},
+}
+MODAL_KEYS = {
+    "mcq": (pygame.K_DOWN, pygame.K_UP),
+    "slider": (pygame.K_RIGHT, pygame.K_LEFT),
+    "rating": (pygame.K_RIGHT, pygame.K_LEFT),
+}
+LEGACY_QUIZ = {
+    "type": "multiple_choice",
+    "select_count": 4,
+    "question": "Which kind of work would you most like to try first?",
+    "answers": ["Engineering", "Design", "IT", "Business"],
+    "user_choice_index": 0,
+}
+
+
+def key_event(key: int, unicode: str = "") -> pygame.event.Event:
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode=unicode, scancode=0)
+
+
+class Input:
+    """
+    Scripted input: which keys are held (seen through
+    pygame.key.get_pressed) and which KEYDOWN events a frame gets.
+    """
+
+    held: HeldKeys = HeldKeys()
+
+    @classmethod
+    def install(cls) -> None:
+        pygame.key.get_pressed = lambda: cls.held
+
+    @classmethod
+    def hold_alternating(cls, i: int, a: int, b: int, period: int = 60) -> None:
+        cls.held = HeldKeys(a if (i // period) % 2 == 0 else b)
+
+
+# ---------------- scenarios ----------------
+
+def build_scenarios(surface: pygame.Surface) -> dict[str, Callable[[], Frame]]:
+    w, h = surface.get_size()
+    from app.state import AppState
+    from core.content_engine import ContentEngine
+    from integrations.llm_client import LLMClient
+    from ui.screen_manager import ScreenManager
+    from ui.screens.gate_scene_screen import GateSceneScreen
+    from ui.screens.question_modal import QuestionModal
+    from ui.screens.training_map_screen import TrainingMapScreen
+    from ui.screens.wise_man_screen import WiseManScreen
+
+    engine = ContentEngine(LLMClient(None, None, None, None))
+
+    def screen_frame(screen, script: Callable[[int], list[pygame.event.Event]]) -> Frame:
+        i = 0
+
+        def frame() -> None:
+            nonlocal i
+            for event in script(i):
+                screen.handle_event(event)
+            screen.update(1 / 60)
+            screen.draw(surface)
+            pygame.display.flip()
+            i += 1
+        return frame
+
+    def training_map() -> Frame:
+        sm = ScreenManager(None)
+        screen = TrainingMapScreen(sm, AppState(), w, h)
+        sm.set(screen)
+        screen.player_rect.topleft = (0, h - 60)  # clear of the house and the wise man
+
+        def script(i: int) -> list:
+            Input.hold_alternating(i, pygame.K_RIGHT, pygame.K_LEFT)
+            return []
+        return screen_frame(screen, script)
+
+    def modal(kind: str) -> Callable[[], Frame]:
+        def build() -> Frame:
+            m = QuestionModal(w, h)
+            m.open(MODAL_QUESTIONS[kind])
+            Input.held = HeldKeys()
+
+            def frame_script(i: int) -> list:
+                if i % 10:
+                    return []
+                if kind == "text":
+                    return [key_event(pygame.K_BACKSPACE)] if i % 40 == 30 else [key_event(pygame.K_a, "a")]
+                a, b = MODAL_KEYS[kind]
+                return [key_event(a if (i // 30) % 2 == 0 else b)]
+
+            i = 0
+
+            def frame() -> None:
+                nonlocal i
+                for event in frame_script(i):
+                    m.handle_event(event)
+                surface.fill((245, 245, 250))
+                m.draw(surface)
+                pygame.display.flip()
+                i += 1
+            return frame
+        return build
+
+    def gate_scene() -> Frame:
+        sm = ScreenManager(None)
+        state = AppState()
+        back = TrainingMapScreen(sm, state, w, h)
+        sm.set(back)
+        screen = GateSceneScreen(sm, state, w, h, back_screen=back,
+                                 option_name="Software Engineering", engine=engine)
+        sm.push(screen)
+
+        def script(i: int) -> list:
+            Input.hold_alternating(i, pygame.K_RIGHT, pygame.K_LEFT)
+            if screen.phase == "info" and i % 30 == 0:
+                return [key_event(pygame.K_RETURN)]
+            return []
+        return screen_frame(screen, script)
+
+    def wise_man() -> Frame:
+        sm = ScreenManager(None)
+        state = AppState()
+        back = TrainingMapScreen(sm, state, w, h)
+        sm.set(back)
+        screen = WiseManScreen(sm, state, w, h, engine, back_screen=back)
+        sm.push(screen)
+        Input.held = HeldKeys()
+
+        def script(i: int) -> list:
+            if i % 30 == 0 and screen.step < len(screen.lines) - 1:
+                return [key_event(pygame.K_RETURN)]
+            return []
+        return screen_frame(screen, script)
+
+    scenarios: dict[str, Callable[[], Frame]] = {
+        "training_map": training_map,
+        "gate_scene": gate_scene,
+        "wise_man": wise_man,
+    }
+    for kind in MODAL_QUESTIONS:
+        scenarios[f"modal.{kind}"] = modal(kind)
+    return scenarios
+
+
+def build_legacy_scenarios() -> dict[str, Callable[[], Frame]]:
+    import app.game_quizes as gq
+    import app.main as legacy
+
+    def state_frame(state: str, held: tuple[int, int] | None = None, quiz: bool = False) -> Callable[[], Frame]:
+        def build() -> Frame:
+            legacy.state = state
+            if state == legacy.HOME:
+                gq.quiz_questions_home = [dict(LEGACY_QUIZ)]
+            if state == legacy.WISEMAN:
+                gq.quiz_questions_wiseman = [dict(LEGACY_QUIZ)]
+            gq.quiz_i = 0
+            legacy.main_player.rect.topleft = (legacy.GAME_WIDTH // 2, legacy.GAME_HEIGHT // 2)
+            Input.held = HeldKeys()
+            sink = open(os.devnull, "w")  # PROFILE prints the textbox every frame
+            i = 0
+
+            def frame() -> None:
+                nonlocal i
+                with contextlib.redirect_stdout(sink):
+                    if held is not None:
+                        Input.hold_alternating(i, *held)
+                        for _ in range(legacy.timestep.advance(1 / 60)):
+                            legacy.main_player.move(legacy.timestep.step, legacy.GAME_WIDTH, legacy.GAME_HEIGHT)
+                    if quiz and i % 10 == 0:
+                        gq.handle_quiz_event(key_event(pygame.K_DOWN if (i // 30) % 2 == 0 else pygame.K_UP),
+                                             legacy.get_active_quizzes())
+                    legacy.render_state()
+                    pygame.display.flip()
+                i += 1
+            return frame
+        return build
+
+    return {
+        "legacy.profile": state_frame(legacy.PROFILE),
+        "legacy.outside": state_frame(legacy.OUTSIDE, held=(pygame.K_RIGHT, pygame.K_LEFT)),
+        "legacy.home": state_frame(legacy.HOME, quiz=True),
+        "legacy.wiseman": state_frame(legacy.WISEMAN, quiz=True),
+        "legacy.chapter2": state_frame(legacy.CHAPTER2, held=(pygame.K_DOWN, pygame.K_UP)),
+    }
+
+
+# ---------------- measurement ----------------
+
+def measure(build: Callable[[], Frame], frames: int) -> dict[str, float]:
+    result = time_frames(build(), frames)
+
+    frame = build()
+    for _ in range(10):
+        frame()
+    CountingSurface.created = 0
+    CountingSurface.pixel_bytes = 0
+    tracemalloc.start()
+    heap = 0
+    for _ in range(frames):
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        frame()
+        heap += tracemalloc.get_traced_memory()[1] - start
+    tracemalloc.stop()
+
+    result["surfaces_per_frame"] = CountingSurface.created / frames
+    result["surface_kib_per_frame"] = CountingSurface.pixel_bytes / frames / 1024.0
+    result["py_kib_per_frame"] = heap / frames / 1024.0
+    return result
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], tolerance: float) -> list[str]:
+    """
+    Regression messages for results against baseline (empty if none).
+    """
+    problems = []
+    for name, r in results.items():
+        b = baseline.get(name)
+        if b is None:
+            continue
+        if b["mean_ms"] > 0 and r["mean_ms"] > b["mean_ms"] * (1 + tolerance):
+            problems.append(f"{name}: mean {b['mean_ms']:.3f} -> {r['mean_ms']:.3f} ms "
+                            f"(+{(r['mean_ms'] / b['mean_ms'] - 1) * 100:.0f}%)")
+        if r["surfaces_per_frame"] > b["surfaces_per_frame"] + 1e-9:
+            problems.append(f"{name}: surfaces/frame {b['surfaces_per_frame']:.2f} -> {r['surfaces_per_frame']:.2f}")
+    return problems
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--only", nargs="*", help="scenario names or prefixes (e.g. modal legacy.home)")
+    parser.add_argument("--out", default=os.path.join("Output", "bench", "results.json"))
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    import app.main  # noqa: F401  sets the display mode the legacy states draw to
+    surface = pygame.display.get_surface()
+    pygame.Surface = CountingSurface  # count every Surface built from Python
+    Input.install()
+
+    scenarios = {**build_scenarios(surface), **build_legacy_scenarios()}
+    if args.only:
+        scenarios = {k: v for k, v in scenarios.items() if any(k.startswith(p) for p in args.only)}
+
+    results: dict[str, dict[str, float]] = {}
+    print(f"{args.frames} frames per scenario")
+    print(f"  {'scenario':<18} {'mean ms':>8} {'p99 ms':>8} {'fps':>8} {'surf/f':>7} {'surf KiB/f':>10} {'py KiB/f':>9}")
+    for name, build in scenarios.items():
+        r = results[name] = measure(build, args.frames)
+        print(f"  {name:<18} {r['mean_ms']:8.3f} {r['p99_ms']:8.3f} {r['fps']:8.0f} "
+              f"{r['surfaces_per_frame']:7.2f} {r['surface_kib_per_frame']:10.1f} {r['py_kib_per_frame']:9.1f}")
+
+    doc = {
+        "meta": {
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "frames": args.frames,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "sdl": ".".join(map(str, pygame.get_sdl_version())),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=2)
+    print(f"wrote {args.out}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        problems = compare(results, baseline, args.tolerance)
+        if problems:
+            print(f"REGRESSIONS vs {args.baseline} (tolerance {args.tolerance:.0%}):")
+            for p in problems:
+                print(f"  {p}")
+            return 1
+        print(f"no regressions vs {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
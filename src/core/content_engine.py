@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from core.validation import (
     validate_part1,
@@ -16,6 +16,7 @@ from core.fallback_content import (
     fallback_analysis,
     fallback_gate,
 )
+from core.content_store import ContentStore
 from integrations.llm_client import LLMClient
 
 
@@ -254,8 +255,41 @@ def _print_questions(tag: str, payload: Dict[str, Any]) -> None:
 # Content Engine
 # ------------------------------------------------------------
 class ContentEngine:
-    def __init__(self, llm: LLMClient):
+    def __init__(self, llm: LLMClient, store: Optional[ContentStore] = None):
         self.llm = llm
+        # Optional warm cache: validated payloads keyed by prompt hash.
+        self.store = store
+        # Stage -> times fallback content was served because the LLM call
+        # failed, was short-circuited, or returned an invalid payload.
+        self.fallbacks: Dict[str, int] = {}
+
+    def _invoke(self, user_prompt: str, kind: str) -> Dict[str, Any]:
+        if self.store is not None:
+            cached = self.store.lookup(ContentStore.prompt_key(SYSTEM_RULES, user_prompt))
+            if isinstance(cached, dict):
+                return cached
+        return self.llm.invoke_json(SYSTEM_RULES, user_prompt, kind=kind)
+
+    def _remember(self, user_prompt: str, out: Dict[str, Any]) -> None:
+        if self.store is None:
+            return
+        try:
+            self.store.remember(ContentStore.prompt_key(SYSTEM_RULES, user_prompt), out)
+        except OSError as e:
+            # The cache is best effort: never lose a good payload over it
+            print(f"[ContentStore] could not cache payload: {e}")
+
+    def _fallback(self, stage: str, err: Exception, out: Dict[str, Any],
+                  validate: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        """
+        Serve offline content when the backend is down (circuit open),
+        exhausted its retries, or returned something invalid. Fallbacks are
+        not remembered in the store.
+        """
+        self.fallbacks[stage] = self.fallbacks.get(stage, 0) + 1
+        print(f"[{stage}] LLM content unavailable ({err}); using fallback content")
+        validate(out)
+        return out
 
     # ---------------- Part 1 ----------------
     def gen_part1(self, education_status: str, poly_course: Optional[str]) -> Dict[str, Any]:
@@ -293,8 +327,12 @@ class ContentEngine:
 
         user_prompt = _build_prompt(task, context_lines, _schema_part1(), hard_rules)
 
-        out = self.llm.invoke_json(SYSTEM_RULES, user_prompt)
-        validate_part1(out)
+        try:
+            out = self._invoke(user_prompt, "part1")
+            validate_part1(out)
+        except Exception as e:
+            return self._fallback("Part1", e, fallback_part1(education_status), validate_part1)
+        self._remember(user_prompt, out)
         p1_q = _print_questions("Part1", out)
         return out
 
@@ -344,18 +382,18 @@ class ContentEngine:
 
         user_prompt = _build_prompt(task, context_lines, _schema_part2(is_poly=is_poly), hard_rules)
 
-        out = self.llm.invoke_json(SYSTEM_RULES, user_prompt)
         try:
+            out = self._invoke(user_prompt, "part2")
             validate_part2(out, is_poly=is_poly)
-            fields = out.get("inferred_fields", [])
-            if isinstance(fields, list):
-                print(f"[Part2] inferred_fields: {fields}")
-            _print_questions("Part2", out)
-            return out
-        except Exception:
-            fallback = fallback_part2(education_status, part1_answers)
-            validate_part2(fallback, is_poly=is_poly)
-            return fallback
+        except Exception as e:
+            return self._fallback("Part2", e, fallback_part2(education_status, part1_answers),
+                                  lambda p: validate_part2(p, is_poly=is_poly))
+        self._remember(user_prompt, out)
+        fields = out.get("inferred_fields", [])
+        if isinstance(fields, list):
+            print(f"[Part2] inferred_fields: {fields}")
+        _print_questions("Part2", out)
+        return out
 
     # ---------------- Analysis ----------------
     def gen_analysis(
@@ -406,8 +444,14 @@ class ContentEngine:
 
         user_prompt = _build_prompt(task, context_lines, _schema_analysis(options_kind), hard_rules)
 
-        out = self.llm.invoke_json(SYSTEM_RULES, user_prompt)
-        validate_analysis(out, options_kind=options_kind)
+        try:
+            out = self._invoke(user_prompt, "analysis")
+            validate_analysis(out, options_kind=options_kind)
+        except Exception as e:
+            return self._fallback(
+                "Analysis", e, fallback_analysis(education_status, poly_path_choice, inferred_fields, part2_answers),
+                lambda p: validate_analysis(p, options_kind=options_kind))
+        self._remember(user_prompt, out)
         return out
 
     # ---------------- Gate Scene ----------------
@@ -474,6 +518,11 @@ class ContentEngine:
 
         user_prompt = _build_prompt(task, context_lines, _schema_gate(work_path), hard_rules)
 
-        out = self.llm.invoke_json(SYSTEM_RULES, user_prompt)
-        validate_gate(out, need_salary=work_path)
+        try:
+            out = self._invoke(user_prompt, "gate")
+            validate_gate(out, need_salary=work_path)
+        except Exception as e:
+            return self._fallback("Gate", e, fallback_gate(option_name, work_path),
+                                  lambda p: validate_gate(p, need_salary=work_path))
+        self._remember(user_prompt, out)
         return out
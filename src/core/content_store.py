@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any
+
+REF_KEY = "$ref"
+
+
+def canonical_json(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+class ContentStore:
+    """
+    Content-addressed store for generated payloads.
+
+    Layout under root:
+    - blobs/<2-char prefix>/<sha256>.json   payload, stored once per distinct content
+    - keys/<2-char prefix>/<sha256>         prompt hash -> payload digest (warm cache)
+
+    Writes go through a temp file + os.replace, so concurrent writers of the
+    same content are harmless.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.hits = 0
+        self.misses = 0
+
+    # ---------------- blobs ----------------
+
+    @staticmethod
+    def digest(payload: Any) -> str:
+        return hashlib.sha256(canonical_json(payload)).hexdigest()
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.root, "blobs", digest[:2], f"{digest}.json")
+
+    def has(self, digest: str) -> bool:
+        return os.path.exists(self._blob_path(digest))
+
+    def put(self, payload: Any) -> str:
+        raw = canonical_json(payload)
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            self._write_atomic(path, raw)
+        return digest
+
+    def get(self, digest: str) -> Any:
+        try:
+            with open(self._blob_path(digest), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    # ---------------- warm cache ----------------
+
+    @staticmethod
+    def prompt_key(system_rules: str, user_prompt: str) -> str:
+        return hashlib.sha256(f"{system_rules}\0{user_prompt}".encode("utf-8")).hexdigest()
+
+    def _key_path(self, key: str) -> str:
+        return os.path.join(self.root, "keys", key[:2], key)
+
+    def lookup(self, key: str) -> Any:
+        try:
+            with open(self._key_path(key), "r", encoding="utf-8") as f:
+                digest = f.read().strip()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        payload = self.get(digest)
+        if payload is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return payload
+
+    def remember(self, key: str, payload: Any) -> str:
+        digest = self.put(payload)
+        path = self._key_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                current = f.read().strip()
+        except FileNotFoundError:
+            current = None
+        # Cache hits remember the same payload again; don't rewrite the key
+        if current != digest:
+            self._write_atomic(path, digest.encode("ascii"))
+        return digest
+
+    # ---------------- run references ----------------
+
+    def ref(self, payload: Any) -> dict[str, str]:
+        return {REF_KEY: self.put(payload)}
+
+    def resolve(self, value: Any) -> Any:
+        if isinstance(value, dict) and set(value) == {REF_KEY}:
+            payload = self.get(value[REF_KEY])
+            if payload is None:
+                raise KeyError(f"content store is missing blob {value[REF_KEY]}")
+            return payload
+        return value
+
+    def _write_atomic(self, path: str, raw: bytes) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Unique temp name per writer: threads of one process may race on a key
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(raw)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
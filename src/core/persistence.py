@@ -3,18 +3,124 @@ import json
 import os
 from datetime import datetime
 from dataclasses import asdict
+from typing import Any, Iterator
 from app.state import AppState
+from core.content_store import ContentStore
+from core.run_archive import archived_run_ids, iter_archived_runs, read_archived_run
+
+RUN_PREFIX = "career_quest_map_run_"
+RUN_SUFFIX = ".txt"
+
+# GameData fields holding whole generated payloads; stored by digest when a
+# ContentStore is given.
+PAYLOAD_FIELDS = ("part1_payload", "part2_payload", "analysis_payload")
 
 
 def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
-def save_run(state: AppState, out_dir: str) -> str:
+def save_run(state: AppState, out_dir: str, store: ContentStore | None = None) -> str:
     ensure_dir(out_dir)
     stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    path = os.path.join(out_dir, f"career_quest_map_run_{stamp}.txt")
+    path = os.path.join(out_dir, f"{RUN_PREFIX}{stamp}{RUN_SUFFIX}")
     payload = asdict(state)
+    if store is not None:
+        payload = externalize_payloads(payload, store)
     with open(path, "w", encoding="utf-8") as f:
         json.dump(payload, f, ensure_ascii=False, indent=2)
     return path
+
+
+def externalize_payloads(run: dict[str, Any], store: ContentStore) -> dict[str, Any]:
+    """
+    Replace embedded generated payloads with {"$ref": digest} entries.
+    """
+    data = run.get("data")
+    if not isinstance(data, dict):
+        return run
+    for key in PAYLOAD_FIELDS:
+        if data.get(key) is not None:
+            data[key] = store.ref(data[key])
+    gates = data.get("gate_payloads")
+    if isinstance(gates, dict):
+        data["gate_payloads"] = {k: store.ref(v) for k, v in gates.items()}
+    return run
+
+
+def resolve_payloads(run: dict[str, Any], store: ContentStore) -> dict[str, Any]:
+    data = run.get("data")
+    if not isinstance(data, dict):
+        return run
+    for key in PAYLOAD_FIELDS:
+        if key in data:
+            data[key] = store.resolve(data[key])
+    gates = data.get("gate_payloads")
+    if isinstance(gates, dict):
+        data["gate_payloads"] = {k: store.resolve(v) for k, v in gates.items()}
+    return run
+
+
+def run_id_from_path(path: str) -> str:
+    name = os.path.basename(path)
+    if name.endswith(RUN_SUFFIX):
+        name = name[: -len(RUN_SUFFIX)]
+    return name
+
+
+def list_loose_runs(out_dir: str) -> list[tuple[str, str]]:
+    """
+    (run_id, path) for every uncompressed run file written by save_run.
+    """
+    try:
+        names = os.listdir(out_dir)
+    except FileNotFoundError:
+        return []
+    out: list[tuple[str, str]] = []
+    for name in sorted(names):
+        if name.startswith(RUN_PREFIX) and name.endswith(RUN_SUFFIX):
+            out.append((run_id_from_path(name), os.path.join(out_dir, name)))
+    return out
+
+
+def list_runs(out_dir: str) -> list[str]:
+    """
+    All run ids, loose and archived.
+    """
+    ids = {run_id for run_id, _ in list_loose_runs(out_dir)}
+    ids.update(archived_run_ids(out_dir))
+    return sorted(ids)
+
+
+def load_run(out_dir: str, run_id: str, store: ContentStore | None = None) -> dict[str, Any]:
+    """
+    Read one run by id. Archived runs are decompressed transparently and
+    payload references are resolved when a store is given.
+    """
+    path = os.path.join(out_dir, f"{run_id}{RUN_SUFFIX}")
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    else:
+        payload = read_archived_run(out_dir, run_id)
+        if payload is None:
+            raise KeyError(f"run not found: {run_id}")
+    if store is not None:
+        payload = resolve_payloads(payload, store)
+    return payload
+
+
+def iter_runs(out_dir: str, store: ContentStore | None = None) -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    Stream (run_id, payload) over archived segments first, then loose files.
+    A run that exists in both places (interrupted archive pass) is yielded once.
+    """
+    loose = list_loose_runs(out_dir)
+    loose_ids = {run_id for run_id, _ in loose}
+    for run_id, payload in iter_archived_runs(out_dir):
+        if run_id not in loose_ids:
+            yield run_id, resolve_payloads(payload, store) if store else payload
+    for run_id, path in loose:
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        yield run_id, resolve_payloads(payload, store) if store else payload
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from multiprocessing import Pool
+from typing import Any, Iterable, Iterator
+
+from app.config import AppConfig
+from core.persistence import list_loose_runs
+from core.run_archive import archived_run_ids, iter_segment, list_segments
+
+# A shard is either one archive segment or a batch of loose run files.
+Shard = tuple[str, str, Any]
+
+
+class RunAggregates:
+    """
+    Mergeable counters for one or more shards.
+    """
+
+    def __init__(self) -> None:
+        self.runs = 0
+        self.inferred_fields: Counter[str] = Counter()
+        self.gate_choices: dict[str, Counter[str]] = {}
+        self.answers: dict[str, Counter[str]] = {}
+
+    def add_run(self, run: dict[str, Any]) -> None:
+        data = run.get("data")
+        if not isinstance(data, dict):
+            return
+        self.runs += 1
+
+        fields = data.get("inferred_fields")
+        if isinstance(fields, list):
+            self.inferred_fields.update(f for f in fields if isinstance(f, str))
+
+        choices = data.get("gate_choices")
+        if isinstance(choices, dict):
+            for option, entry in choices.items():
+                choice = entry.get("choice") if isinstance(entry, dict) else None
+                self.gate_choices.setdefault(option, Counter())[str(choice or "None")] += 1
+
+        for key in ("part1_answers", "part2_answers"):
+            for a in _answer_entries(data.get(key)):
+                self.answers.setdefault(a[0], Counter())[a[1]] += 1
+
+    def merge(self, other: RunAggregates) -> None:
+        self.runs += other.runs
+        self.inferred_fields.update(other.inferred_fields)
+        for option, c in other.gate_choices.items():
+            self.gate_choices.setdefault(option, Counter()).update(c)
+        for prompt, c in other.answers.items():
+            self.answers.setdefault(prompt, Counter()).update(c)
+
+    def to_dict(self, top: int = 10) -> dict[str, Any]:
+        gates: dict[str, Any] = {}
+        for option, c in sorted(self.gate_choices.items()):
+            decided = c["Yes"] + c["No"]
+            gates[option] = {
+                "yes": c["Yes"],
+                "no": c["No"],
+                "undecided": c["None"],
+                "yes_rate": round(c["Yes"] / decided, 3) if decided else None,
+            }
+        return {
+            "runs": self.runs,
+            "inferred_fields": dict(self.inferred_fields.most_common()),
+            "gate_choices": gates,
+            "answers": {p: dict(c.most_common(top)) for p, c in sorted(self.answers.items())},
+        }
+
+
+def _answer_entries(answers: Any) -> Iterator[tuple[str, str]]:
+    if not isinstance(answers, list):
+        return
+    for a in answers:
+        if isinstance(a, dict) and isinstance(a.get("prompt"), str):
+            yield a["prompt"], str(a.get("answer"))
+
+
+def plan_shards(out_dir: str, files_per_shard: int = 256) -> list[Shard]:
+    shards: list[Shard] = [("segment", out_dir, seg) for seg in list_segments(out_dir)]
+    # A run archived after its file was written but before the file was
+    # removed exists in both places; the segment copy is the one counted.
+    archived = set(archived_run_ids(out_dir))
+    loose = [path for run_id, path in list_loose_runs(out_dir) if run_id not in archived]
+    for i in range(0, len(loose), files_per_shard):
+        shards.append(("files", out_dir, loose[i:i + files_per_shard]))
+    return shards
+
+
+def iter_shard(shard: Shard) -> Iterator[dict[str, Any]]:
+    kind, out_dir, arg = shard
+    if kind == "segment":
+        for _, run in iter_segment(out_dir, arg):
+            yield run
+        return
+    for path in arg:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                yield json.load(f)
+        except (OSError, ValueError):
+            # File archived or half-written while we were reading; skip it.
+            continue
+
+
+def aggregate_shard(shard: Shard) -> RunAggregates:
+    agg = RunAggregates()
+    for run in iter_shard(shard):
+        if isinstance(run, dict):
+            agg.add_run(run)
+    return agg
+
+
+def aggregate(shards: Iterable[Shard], workers: int = 1) -> RunAggregates:
+    total = RunAggregates()
+    if workers <= 1:
+        for shard in shards:
+            total.merge(aggregate_shard(shard))
+        return total
+    with Pool(processes=workers) as pool:
+        for part in pool.imap_unordered(aggregate_shard, shards):
+            total.merge(part)
+    return total
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    print("Inferred fields:")
+    for name, n in report["inferred_fields"].items():
+        print(f"  {n:8d}  {name}")
+    print("Gate choices:")
+    for option, g in report["gate_choices"].items():
+        rate = "-" if g["yes_rate"] is None else f"{g['yes_rate']:.1%}"
+        print(f"  {option}: yes={g['yes']} no={g['no']} undecided={g['undecided']} yes_rate={rate}")
+    print("Answers per prompt:")
+    for prompt, hist in report["answers"].items():
+        print(f"  {prompt}")
+        for ans, n in hist.items():
+            print(f"    {n:8d}  {ans}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Aggregate saved Career Quest Map runs.")
+    parser.add_argument("out_dir", nargs="?", default=AppConfig().save_dir)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--files-per-shard", type=int, default=256)
+    parser.add_argument("--top", type=int, default=10, help="answers shown per prompt")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    shards = plan_shards(args.out_dir, args.files_per_shard)
+    agg = aggregate(shards, workers=min(args.workers, max(1, len(shards))))
+    elapsed = time.perf_counter() - start
+
+    report = agg.to_dict(top=args.top)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        _print_report(report)
+    rate = agg.runs / elapsed if elapsed > 0 else 0.0
+    # stderr keeps --json output parseable
+    print(f"{agg.runs} runs from {len(shards)} shard(s) in {elapsed:.2f}s ({rate:,.0f} runs/s)",
+          file=sys.stderr if args.json else sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import os
+import time
+from datetime import datetime
+from typing import Any, Callable, Iterator
+
+from app.config import AppConfig
+
+try:
+    import zstandard
+except ImportError:  # optional: falls back to gzip
+    zstandard = None
+
+
+ARCHIVE_DIRNAME = "archive"
+INDEX_NAME = "index.json"
+
+ZSTD_LEVEL = 10
+# Runs share most of their structure and wording, which one small frame per
+# run cannot exploit; a dictionary trained on the runs being packed can.
+DICT_SIZE = 64 * 1024
+# Fixed cover parameters: letting zstd search for them makes training
+# ~25x slower for about 1% smaller segments.
+DICT_K = 1024
+DICT_D = 8
+DICT_MIN_SAMPLES = 64
+DICT_MAX_SAMPLES = 2000
+
+# index path -> (mtime, parsed index)
+_index_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+# dictionary path -> loaded dictionary
+_dict_cache: dict[str, Any] = {}
+
+
+def archive_dir(out_dir: str) -> str:
+    return os.path.join(out_dir, ARCHIVE_DIRNAME)
+
+
+def default_codec() -> str:
+    return "zstd" if zstandard is not None else "gzip"
+
+
+def _compressor(codec: str, zdict: Any = None) -> Callable[[bytes], bytes]:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd codec requested but 'zstandard' is not installed")
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=zdict).compress
+    if codec == "gzip":
+        return lambda data: gzip.compress(data, compresslevel=9)
+    raise ValueError(f"unknown archive codec: {codec}")
+
+
+def _decompressor(codec: str, zdict: Any = None) -> Callable[[bytes], bytes]:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("archive uses zstd but 'zstandard' is not installed")
+        return zstandard.ZstdDecompressor(dict_data=zdict).decompress
+    if codec == "gzip":
+        return gzip.decompress
+    raise ValueError(f"unknown archive codec: {codec}")
+
+
+def _train_dict(samples: list[bytes]) -> Any:
+    """
+    zstd dictionary trained on `samples`, or None when there are too few
+    of them or training fails.
+    """
+    if zstandard is None or len(samples) < DICT_MIN_SAMPLES:
+        return None
+    try:
+        return zstandard.train_dictionary(DICT_SIZE, samples, k=DICT_K, d=DICT_D, level=ZSTD_LEVEL)
+    except zstandard.ZstdError:
+        return None
+
+
+def _load_dict(out_dir: str, index: dict[str, Any], dict_id: int | None) -> Any:
+    if dict_id is None:
+        return None
+    if zstandard is None:
+        raise RuntimeError("archive uses zstd but 'zstandard' is not installed")
+    path = os.path.join(archive_dir(out_dir), index["dicts"][str(dict_id)])
+    zdict = _dict_cache.get(path)
+    if zdict is None:
+        with open(path, "rb") as f:
+            zdict = zstandard.ZstdCompressionDict(f.read())
+        _dict_cache[path] = zdict
+    return zdict
+
+
+def load_index(out_dir: str) -> dict[str, Any]:
+    """
+    Index format:
+    {"runs": {run_id: {"segment": str, "offset": int, "length": int, "codec": str, "mtime": float,
+                       "dict": int (zstd dictionary id, when the frame uses one)}},
+     "dicts": {str(dict_id): file name in the archive dir}}
+    Cached per process and re-read only when the file changes.
+    """
+    path = os.path.join(archive_dir(out_dir), INDEX_NAME)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return {"runs": {}, "dicts": {}}
+    cached = _index_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path, "r", encoding="utf-8") as f:
+        obj = json.load(f)
+    if not isinstance(obj, dict) or not isinstance(obj.get("runs"), dict):
+        raise ValueError(f"{path}: archive index must be a JSON object with 'runs'")
+    obj.setdefault("dicts", {})
+    _index_cache[path] = (mtime, obj)
+    return obj
+
+
+def _read_compact(path: str) -> bytes:
+    with open(path, "r", encoding="utf-8") as f:
+        payload = json.load(f)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _write_bytes_atomic(path: str, data: bytes) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _write_index(out_dir: str, index: dict[str, Any]) -> None:
+    path = os.path.join(archive_dir(out_dir), INDEX_NAME)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+    _index_cache.pop(path, None)
+
+
+def archive_old_runs(out_dir: str, older_than_days: float = 30, codec: str | None = None, now: float | None = None) -> str | None:
+    """
+    Pack loose run files older than `older_than_days` into one compressed segment.
+
+    Every run is compressed as its own frame and appended to the segment, so a
+    single run can be read back with one seek + one small decompress. With
+    zstd the frames share a dictionary trained on this pass's runs (or the
+    newest existing one when the pass is too small to train on), saved next
+    to the segments and recorded in the index.
+    Loose files are removed only after the dictionary, segment and index
+    are on disk.
+    Returns the segment path, or None when nothing was old enough.
+    """
+    from core.persistence import list_loose_runs
+
+    codec = codec or default_codec()
+    cutoff = (now if now is not None else time.time()) - older_than_days * 86400
+
+    candidates: list[tuple[str, str, float]] = []
+    for run_id, path in list_loose_runs(out_dir):
+        mtime = os.path.getmtime(path)
+        if mtime <= cutoff:
+            candidates.append((run_id, path, mtime))
+    if not candidates:
+        return None
+
+    os.makedirs(archive_dir(out_dir), exist_ok=True)
+    index = load_index(out_dir)
+    runs: dict[str, Any] = dict(index["runs"])
+    dicts: dict[str, str] = dict(index["dicts"])
+
+    pending: list[tuple[str, str, float]] = []
+    packed: list[str] = []
+    for run_id, path, mtime in sorted(candidates):
+        if run_id in runs:
+            # Already archived by an earlier (interrupted) pass.
+            packed.append(path)
+        else:
+            pending.append((run_id, path, mtime))
+
+    zdict = None
+    if codec == "zstd":
+        step = max(1, len(pending) // DICT_MAX_SAMPLES)
+        zdict = _train_dict([_read_compact(path) for _, path, _ in pending[::step]])
+        if zdict is not None:
+            name = f"dict_{zdict.dict_id()}.zdict"
+            _write_bytes_atomic(os.path.join(archive_dir(out_dir), name), zdict.as_bytes())
+            dicts[str(zdict.dict_id())] = name
+        elif dicts:
+            # dicts keeps insertion order, so the last one is the newest
+            zdict = _load_dict(out_dir, {"dicts": dicts}, int(next(reversed(dicts))))
+    compress = _compressor(codec, zdict)
+
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    ext = "zst" if codec == "zstd" else "gz"
+    segment = f"segment_{stamp}.jsonl.{ext}"
+    n = 1
+    while os.path.exists(os.path.join(archive_dir(out_dir), segment)):
+        n += 1
+        segment = f"segment_{stamp}_{n}.jsonl.{ext}"
+    seg_path = os.path.join(archive_dir(out_dir), segment)
+
+    offset = 0
+    with open(seg_path, "wb") as seg:
+        for run_id, path, mtime in pending:
+            frame = compress(_read_compact(path))
+            seg.write(frame)
+            runs[run_id] = {"segment": segment, "offset": offset,
+                            "length": len(frame), "codec": codec, "mtime": mtime}
+            if zdict is not None:
+                runs[run_id]["dict"] = zdict.dict_id()
+            offset += len(frame)
+            packed.append(path)
+
+    if offset == 0:
+        os.remove(seg_path)
+        seg_path = None
+    _write_index(out_dir, {"runs": runs, "dicts": dicts})
+
+    for path in packed:
+        os.remove(path)
+    return seg_path
+
+
+def archived_run_ids(out_dir: str) -> list[str]:
+    return sorted(load_index(out_dir)["runs"])
+
+
+def read_archived_run(out_dir: str, run_id: str) -> dict[str, Any] | None:
+    index = load_index(out_dir)
+    entry = index["runs"].get(run_id)
+    if entry is None:
+        return None
+    seg_path = os.path.join(archive_dir(out_dir), entry["segment"])
+    with open(seg_path, "rb") as f:
+        f.seek(entry["offset"])
+        frame = f.read(entry["length"])
+    decompress = _decompressor(entry["codec"], _load_dict(out_dir, index, entry.get("dict")))
+    return json.loads(decompress(frame))
+
+
+def _entries_by_segment(out_dir: str) -> dict[str, list[tuple[int, str, dict[str, Any]]]]:
+    by_segment: dict[str, list[tuple[int, str, dict[str, Any]]]] = {}
+    for run_id, entry in load_index(out_dir)["runs"].items():
+        by_segment.setdefault(entry["segment"], []).append((entry["offset"], run_id, entry))
+    return by_segment
+
+
+def list_segments(out_dir: str) -> list[str]:
+    return sorted(_entries_by_segment(out_dir))
+
+
+def iter_segment(out_dir: str, segment: str) -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    Stream the runs of one segment in file order (one open, sequential reads).
+    """
+    index = load_index(out_dir)
+    entries = sorted(_entries_by_segment(out_dir).get(segment, []), key=lambda e: e[0])
+    # One decompressor per (codec, dictionary); a segment normally uses one.
+    decompressors: dict[tuple[str, int | None], Callable[[bytes], bytes]] = {}
+    with open(os.path.join(archive_dir(out_dir), segment), "rb") as f:
+        for offset, run_id, entry in entries:
+            key = (entry["codec"], entry.get("dict"))
+            if key not in decompressors:
+                decompressors[key] = _decompressor(key[0], _load_dict(out_dir, index, key[1]))
+            f.seek(offset)
+            frame = f.read(entry["length"])
+            yield run_id, json.loads(decompressors[key](frame))
+
+
+def iter_archived_runs(out_dir: str) -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    Stream archived runs segment by segment.
+    """
+    for segment in list_segments(out_dir):
+        yield from iter_segment(out_dir, segment)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Pack old Career Quest Map runs into compressed segments.")
+    parser.add_argument("out_dir", nargs="?", default=AppConfig().save_dir)
+    parser.add_argument("--older-than-days", type=float, default=30)
+    parser.add_argument("--codec", choices=["zstd", "gzip"], default=None)
+    args = parser.parse_args(argv)
+
+    seg = archive_old_runs(args.out_dir, args.older_than_days, args.codec)
+    if seg is None:
+        print("Nothing to archive.")
+    else:
+        print(f"Archived into {seg}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from typing import Any, Iterable, Iterator
+
+from app.config import AppConfig
+from core.persistence import iter_runs
+
+try:
+    import numpy as np
+except ImportError:  # optional: only needed for columnar export
+    np = None
+
+
+# Dense column widths (matches the engine schemas: 12 Part 2 questions,
+# 5 strength tags, 3 suggested options).
+PART2_WIDTH = 12
+STRENGTH_WIDTH = 5
+SUGGESTED_WIDTH = 3
+
+QTYPE_CODES = {"mcq": 1, "slider": 2, "rating": 3, "text": 4}
+MISSING = -1
+
+DICTIONARY_NAME = "dictionary.json"
+MANIFEST_NAME = "manifest.json"
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("Columnar export needs numpy. Install it with 'uv add numpy'.")
+
+
+class StringDictionary:
+    """
+    Append-only string -> int32 code table shared by all chunks of an export.
+    """
+
+    def __init__(self, values: list[str] | None = None):
+        self.values: list[str] = list(values or [])
+        self.codes: dict[str, int] = {v: i for i, v in enumerate(self.values)}
+
+    def encode(self, value: Any) -> int:
+        if not isinstance(value, str):
+            return MISSING
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self.codes[value] = code
+        return code
+
+
+class _ChunkBuilder:
+    def __init__(self, rows: int):
+        self.rows = rows
+        self.n = 0
+        self.run_id: list[str] = []
+        self.education_status = np.full(rows, MISSING, dtype=np.int32)
+        self.part2_value = np.full((rows, PART2_WIDTH), MISSING, dtype=np.int16)
+        self.part2_type = np.zeros((rows, PART2_WIDTH), dtype=np.int8)
+        self.strength_tags = np.full((rows, STRENGTH_WIDTH), MISSING, dtype=np.int32)
+        self.suggested_options = np.full((rows, SUGGESTED_WIDTH), MISSING, dtype=np.int32)
+
+    def add(self, run_id: str, run: dict[str, Any], strings: StringDictionary) -> None:
+        i = self.n
+        profile = run.get("profile") if isinstance(run.get("profile"), dict) else {}
+        data = run.get("data") if isinstance(run.get("data"), dict) else {}
+
+        self.run_id.append(run_id)
+        self.education_status[i] = strings.encode(profile.get("education_status"))
+
+        answers = data.get("part2_answers")
+        if isinstance(answers, list):
+            for j, a in enumerate(answers[:PART2_WIDTH]):
+                if not isinstance(a, dict):
+                    continue
+                self.part2_type[i, j] = QTYPE_CODES.get(a.get("type"), 0)
+                v = a.get("answer")
+                if isinstance(v, (int, float)) and not isinstance(v, bool):
+                    self.part2_value[i, j] = int(v)
+
+        for col, key, width in ((self.strength_tags, "strength_tags", STRENGTH_WIDTH),
+                                (self.suggested_options, "suggested_options", SUGGESTED_WIDTH)):
+            values = data.get(key)
+            if isinstance(values, list):
+                for j, v in enumerate(values[:width]):
+                    col[i, j] = strings.encode(v)
+        self.n += 1
+
+    def full(self) -> bool:
+        return self.n >= self.rows
+
+    def columns(self) -> dict[str, Any]:
+        n = self.n
+        return {
+            "run_id": np.array(self.run_id, dtype=str),
+            "education_status": self.education_status[:n],
+            "part2_value": self.part2_value[:n],
+            "part2_type": self.part2_type[:n],
+            "strength_tags": self.strength_tags[:n],
+            "suggested_options": self.suggested_options[:n],
+        }
+
+
+def export_columnar(runs: Iterable[tuple[str, dict[str, Any]]], dest_dir: str, chunk_rows: int = 65536) -> dict[str, Any]:
+    """
+    Stream runs into fixed-size .npz row groups under dest_dir.
+
+    Memory is bounded by one chunk (chunk_rows rows) plus the string dictionary,
+    whatever the history size. Strings are dictionary-encoded into int32 codes,
+    -1 marks missing values and part2_value only holds slider/rating answers.
+    """
+    _require_numpy()
+    os.makedirs(dest_dir, exist_ok=True)
+
+    strings = StringDictionary()
+    chunks: list[str] = []
+    total = 0
+    builder = _ChunkBuilder(chunk_rows)
+
+    def flush() -> None:
+        nonlocal builder, total
+        if builder.n == 0:
+            return
+        name = f"chunk_{len(chunks):05d}.npz"
+        np.savez_compressed(os.path.join(dest_dir, name), **builder.columns())
+        chunks.append(name)
+        total += builder.n
+        builder = _ChunkBuilder(chunk_rows)
+
+    for run_id, run in runs:
+        if not isinstance(run, dict):
+            continue
+        builder.add(run_id, run, strings)
+        if builder.full():
+            flush()
+    flush()
+
+    with open(os.path.join(dest_dir, DICTIONARY_NAME), "w", encoding="utf-8") as f:
+        json.dump(strings.values, f, ensure_ascii=False)
+    manifest = {
+        "rows": total,
+        "chunks": chunks,
+        "qtype_codes": QTYPE_CODES,
+        "missing": MISSING,
+    }
+    with open(os.path.join(dest_dir, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def load_dictionary(dest_dir: str) -> list[str]:
+    with open(os.path.join(dest_dir, DICTIONARY_NAME), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def iter_chunks(dest_dir: str) -> Iterator[dict[str, Any]]:
+    """
+    Yield one row group at a time as {column: ndarray}.
+    """
+    _require_numpy()
+    with open(os.path.join(dest_dir, MANIFEST_NAME), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    for name in manifest["chunks"]:
+        with np.load(os.path.join(dest_dir, name)) as z:
+            yield {k: z[k] for k in z.files}
+
+
+def summarize(dest_dir: str) -> dict[str, Any]:
+    """
+    Vectorized aggregates over an export, accumulated chunk by chunk.
+    """
+    _require_numpy()
+    strings = load_dictionary(dest_dir)
+    n_strings = len(strings)
+
+    rows = 0
+    value_sum = np.zeros(PART2_WIDTH, dtype=np.float64)
+    value_sq = np.zeros(PART2_WIDTH, dtype=np.float64)
+    value_n = np.zeros(PART2_WIDTH, dtype=np.int64)
+    strength_counts = np.zeros(n_strings, dtype=np.int64)
+    suggested_counts = np.zeros(n_strings, dtype=np.int64)
+
+    for cols in iter_chunks(dest_dir):
+        rows += len(cols["run_id"])
+        vals = cols["part2_value"].astype(np.float64)
+        mask = cols["part2_value"] != MISSING
+        value_sum += np.where(mask, vals, 0.0).sum(axis=0)
+        value_sq += np.where(mask, vals * vals, 0.0).sum(axis=0)
+        value_n += mask.sum(axis=0)
+        for counts, col in ((strength_counts, cols["strength_tags"]),
+                            (suggested_counts, cols["suggested_options"])):
+            codes = col[col != MISSING]
+            counts += np.bincount(codes, minlength=n_strings)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = value_sum / value_n
+        std = np.sqrt(value_sq / value_n - mean * mean)
+
+    def top(counts: Any, k: int = 10) -> list[tuple[str, int]]:
+        order = np.argsort(counts)[::-1][:k]
+        return [(strings[i], int(counts[i])) for i in order if counts[i] > 0]
+
+    return {
+        "rows": rows,
+        "part2_mean": [None if np.isnan(x) else round(float(x), 3) for x in mean],
+        "part2_std": [None if np.isnan(x) else round(float(x), 3) for x in std],
+        "part2_answered": value_n.tolist(),
+        "top_strength_tags": top(strength_counts),
+        "top_suggested_options": top(suggested_counts),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Export saved runs to dense .npz columns.")
+    parser.add_argument("dest_dir")
+    parser.add_argument("--runs-dir", default=AppConfig().save_dir)
+    parser.add_argument("--chunk-rows", type=int, default=65536)
+    args = parser.parse_args(argv)
+
+    manifest = export_columnar(iter_runs(args.runs_dir), args.dest_dir, args.chunk_rows)
+    print(f"Exported {manifest['rows']} runs in {len(manifest['chunks'])} chunk(s) to {args.dest_dir}")
+    print(json.dumps(summarize(args.dest_dir), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
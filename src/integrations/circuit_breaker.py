@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Raised instead of calling a backend the breaker considers down.
+    """
+
+
+class CircuitBreaker:
+    """
+    Error-rate and latency circuit breaker for the LLM backend.
+
+    Every attempt is recorded with record(ok, seconds) into a rolling window
+    of the last `window` attempts. Once at least `min_calls` are in, the
+    circuit opens when the failure rate reaches `failure_rate` or the share
+    of attempts slower than `slow_call_s` reaches `slow_rate`. While open,
+    allow() is False, so callers skip the backend (ContentEngine serves its
+    fallback content). After `open_s` the circuit goes half-open: allow()
+    lets `probes` attempts through; a fast success closes the circuit, a
+    failure or slow call opens it again for another `open_s`.
+
+    One breaker is shared by every LLMClient in the process (see shared()),
+    since they all talk to the same deployment.
+    """
+
+    _shared: Optional["CircuitBreaker"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        window: int = 20,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        slow_call_s: float = 10.0,
+        slow_rate: float = 0.8,
+        open_s: float = 15.0,
+        probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_s = slow_call_s
+        self.slow_rate = slow_rate
+        self.open_s = open_s
+        self.probes = probes
+        self.clock = clock
+        self.state = CLOSED
+        self._window: deque[tuple[bool, bool]] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probing = 0
+        self._lock = threading.Lock()
+        self._stats = {"opened": 0, "rejected": 0, "probes": 0}
+
+    @classmethod
+    def shared(cls, **kwargs: Any) -> "CircuitBreaker":
+        """
+        The process-wide breaker, created with these settings on first use.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(**kwargs)
+            return cls._shared
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == OPEN and self.clock() - self._opened_at >= self.open_s:
+                self.state = HALF_OPEN
+                self._probing = 0
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and self._probing < self.probes:
+                self._probing += 1
+                self._stats["probes"] += 1
+                return True
+            self._stats["rejected"] += 1
+            return False
+
+    def abandon(self) -> None:
+        """
+        An allowed attempt never reached the backend (e.g. it timed out in
+        the rate limiter queue): give back its half-open probe slot.
+        """
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probing = max(0, self._probing - 1)
+
+    def record(self, ok: bool, seconds: float) -> None:
+        slow = seconds >= self.slow_call_s
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probing = max(0, self._probing - 1)
+                if ok and not slow:
+                    self.state = CLOSED
+                    self._window.clear()
+                else:
+                    self._open()
+                return
+            if self.state == OPEN:
+                # A call admitted before the circuit opened; its outcome
+                # belongs to the window that already tripped
+                return
+            self._window.append((ok, slow))
+            if len(self._window) >= self.min_calls:
+                failures, slows = self._rates()
+                if failures >= self.failure_rate or slows >= self.slow_rate:
+                    self._open()
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self._opened_at = self.clock()
+        self._stats["opened"] += 1
+
+    def _rates(self) -> tuple[float, float]:
+        n = len(self._window)
+        if not n:
+            return 0.0, 0.0
+        return (sum(1 for ok, _ in self._window if not ok) / n,
+                sum(1 for _, slow in self._window if slow) / n)
+
+    def retry_in(self) -> float:
+        """
+        Seconds until an open circuit lets a probe through (0 otherwise).
+        """
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, self.open_s - (self.clock() - self._opened_at))
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            failures, slows = self._rates()
+            out: dict[str, Any] = dict(self._stats)
+            out.update(state=self.state, failure_rate=failures, slow_rate=slows, window=len(self._window))
+        out["retry_in_s"] = self.retry_in()
+        return out
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Any, Optional
+
+# Histogram bucket upper bounds (s): 10 ms growing by 15% per bucket, up
+# to ~150 s; a final open-ended bucket follows.
+BUCKETS_S = tuple(0.01 * 1.15 ** i for i in range(70))
+
+
+class LatencyHistogram:
+    """
+    Bucketed latency histogram that slowly forgets: once it holds 2 *
+    `window` samples every count is halved, so quantiles track the
+    backend's recent behaviour rather than the whole session.
+    """
+
+    def __init__(self, window: int = 500):
+        self.window = window
+        self.counts = [0.0] * (len(BUCKETS_S) + 1)
+        self.total = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS_S, seconds)] += 1
+        self.total += 1
+        if self.total >= 2 * self.window:
+            self.counts = [c / 2 for c in self.counts]
+            self.total /= 2
+
+    def quantile(self, q: float) -> float:
+        """
+        Upper bound of the bucket holding the q-quantile (0.0 if empty).
+        """
+        if not self.total:
+            return 0.0
+        target = q * self.total
+        seen = 0.0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target:
+                return BUCKETS_S[min(i, len(BUCKETS_S) - 1)]
+        return BUCKETS_S[-1]
+
+
+class HedgePolicy:
+    """
+    When to send a duplicate ("hedge") of a slow LLM request.
+
+    Latencies are learned per request kind (ContentEngine stage), since a
+    Part 2 answer is several times longer than a gate scene. A request
+    still running after its kind's `quantile` latency gets one hedge, as
+    long as hedges stay within `budget` (share of primary requests, plus
+    `burst`) and the kind has `min_samples` observations.
+    """
+
+    def __init__(self, quantile: float = 0.95, budget: float = 0.1, burst: int = 2,
+                 min_samples: int = 20, min_delay_s: float = 0.05):
+        self.quantile = quantile
+        self.budget = budget
+        self.burst = burst
+        self.min_samples = min_samples
+        self.min_delay_s = min_delay_s
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "hedges": 0, "hedge_wins": 0, "denied": 0}
+
+    def observe(self, kind: str, seconds: float) -> None:
+        with self._lock:
+            hist = self.histograms.get(kind)
+            if hist is None:
+                hist = self.histograms[kind] = LatencyHistogram()
+            hist.add(seconds)
+
+    def delay(self, kind: str) -> Optional[float]:
+        """
+        Seconds after which to hedge a new `kind` request, or None while
+        there is not enough history. Counts the request toward the budget.
+        """
+        with self._lock:
+            self._stats["requests"] += 1
+            hist = self.histograms.get(kind)
+            if hist is None or hist.total < self.min_samples:
+                return None
+            return max(self.min_delay_s, hist.quantile(self.quantile))
+
+    def try_hedge(self) -> bool:
+        """
+        Spend one hedge from the budget if any is left.
+        """
+        with self._lock:
+            if self._stats["hedges"] >= self.budget * self._stats["requests"] + self.burst:
+                self._stats["denied"] += 1
+                return False
+            self._stats["hedges"] += 1
+            return True
+
+    def won(self) -> None:
+        with self._lock:
+            self._stats["hedge_wins"] += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            out: dict[str, Any] = dict(self._stats)
+            out["thresholds_s"] = {k: h.quantile(self.quantile) for k, h in self.histograms.items()
+                                   if h.total >= self.min_samples}
+        out["extra_share"] = out["hedges"] / out["requests"] if out["requests"] else 0.0
+        return out
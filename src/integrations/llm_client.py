@@ -1,11 +1,28 @@
 # FILE: src/integrations/llm_client.py
 from __future__ import annotations
 
+import copy
+import hashlib
 import json
+import queue
+import threading
+import time
 from typing import Any, Optional
 
 from langchain_openai import AzureChatOpenAI
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from integrations.circuit_breaker import CircuitBreaker, CircuitOpenError
+from integrations.hedging import HedgePolicy
+from integrations.rate_limiter import (
+    PRIORITY_PREFETCH,
+    RateLimiter,
+    backoff_delay,
+    estimate_tokens,
+    is_retryable,
+    retry_after_seconds,
+    status_code,
+)
 
 
 class LLMClient:
@@ -15,14 +32,59 @@ class LLMClient:
     Important:
     Some Azure deployments only support the default temperature (1).
     So we do NOT set temperature at all.
+
+    Every invoke_json call is counted (attempts, failures, latency, token
+    usage as reported by the API) in process-wide totals, see metrics(),
+    and per calling thread, see thread_usage(), so a driver running one
+    playthrough per thread can attribute usage to each stage.
+
+    Retries are ours, not the SDK's (max_retries=0 on the Azure client):
+    every attempt is admitted by the optional RateLimiter (prompt tokens
+    estimated from the prompt text plus expected_completion_tokens), a
+    transport error backs off with jitter (honoring Retry-After, which on a
+    429 also pauses the limiter for everyone), a non-retryable HTTP error
+    fails at once, and a malformed JSON answer is retried immediately.
+
+    A call never takes much longer than max_wait_s: each attempt gets what
+    is left of that budget as its HTTP timeout (at most request_timeout),
+    and backoff and limiter waits are cut to the deadline. With a
+    CircuitBreaker, each attempt's outcome and latency is recorded and no
+    attempt is made while the circuit is open: the call raises
+    CircuitOpenError at once (ContentEngine then serves fallback content).
+
+    With a HedgePolicy, an attempt still unanswered at its kind's learned
+    p95 latency gets a duplicate request (within the policy's budget, and
+    only if the rate limiter has room right now). The first complete answer
+    wins. The hedge runs as a stream, so when the primary wins (the usual
+    case) the hedge's connection is closed, cancelling it on the server; a
+    primary that loses is not streamed (streaming costs client CPU on every
+    call) and is discarded when it completes. Token usage counts the
+    winner only.
+
+    With coalesce (the default), concurrent calls with the same prompt are
+    single-flighted: the first caller makes the request, the others wait
+    for it and get a deep copy of its result (or its error). Many players
+    with the same profile reaching the house together cost one gen_part1
+    request. Followers count as calls with coalesced=1 and no tokens.
     """
 
+    _METRICS = ("calls", "attempts", "failures", "prompt_tokens", "completion_tokens", "latency_s",
+                "rate_limited", "backoff_s", "queued_s", "short_circuited", "hedges", "hedge_wins",
+                "coalesced")
+
     def __init__(
         self,
         azure_endpoint: str | None,
         api_key: str | None,
         api_version: str | None,
         deployment_name: str | None,
+        limiter: RateLimiter | None = None,
+        breaker: CircuitBreaker | None = None,
+        hedge: HedgePolicy | None = None,
+        coalesce: bool = True,
+        request_timeout: float = 20.0,
+        max_wait_s: float = 30.0,
+        expected_completion_tokens: int = 600,
     ):
         self.enabled = bool(
             azure_endpoint and api_key and api_version and deployment_name)
@@ -34,26 +96,329 @@ class LLMClient:
                 api_key=api_key,
                 api_version=api_version,
                 deployment_name=deployment_name,
+                max_retries=0,
                 # Do not set temperature here.
             )
+        self.limiter = limiter
+        self.breaker = breaker
+        self.hedge = hedge
+        self.coalesce = coalesce
+        self._inflight: dict[str, _Flight] = {}
+        self.request_timeout = request_timeout
+        self.max_wait_s = max_wait_s
+        self.expected_completion_tokens = expected_completion_tokens
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._totals = dict.fromkeys(self._METRICS, 0)
 
-    def invoke_json(self, system_rules: str, user_prompt: str, max_retries: int = 2) -> dict[str, Any]:
+    @classmethod
+    def from_config(cls, cfg: Any) -> "LLMClient":
+        """
+        Client for the AppConfig deployment, sharing the process-wide rate
+        limiter and circuit breaker.
+        """
+        return cls(
+            cfg.azure_endpoint,
+            cfg.azure_api_key,
+            cfg.azure_api_version,
+            cfg.azure_deployment,
+            limiter=RateLimiter.shared(cfg.llm_rpm, cfg.llm_tpm, cfg.llm_max_in_flight),
+            breaker=CircuitBreaker.shared(),
+            hedge=HedgePolicy() if cfg.llm_hedge else None,
+            request_timeout=cfg.llm_request_timeout,
+            max_wait_s=cfg.llm_max_wait,
+        )
+
+    def invoke_json(self, system_rules: str, user_prompt: str, max_retries: int = 2,
+                    kind: str = "default") -> dict[str, Any]:
+        """
+        `kind` names the request type (ContentEngine passes its stage) for
+        per-kind latency learning when hedging.
+        """
         if not self.enabled or not self._llm:
             raise RuntimeError(
                 "LLM is not configured. Check .env / AppConfig.")
+        if not self.coalesce:
+            return self._invoke_json(system_rules, user_prompt, max_retries, kind)
+
+        key = hashlib.sha256(f"{system_rules}\0{user_prompt}".encode("utf-8")).hexdigest()
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+            else:
+                flight.followers += 1
+        if not leader:
+            return self._follow(flight)
+        result = None
+        try:
+            result = self._invoke_json(system_rules, user_prompt, max_retries, kind)
+            return result
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                followers = flight.followers
+            if result is not None and followers:
+                # Snapshot before the leader's caller can mutate its payload;
+                # followers copy the snapshot, which nobody else holds
+                flight.result = copy.deepcopy(result)
+            flight.done.set()
 
+    def _follow(self, flight: "_Flight") -> dict[str, Any]:
+        """
+        Wait for another thread's identical request and share its outcome.
+        """
+        usage = dict.fromkeys(self._METRICS, 0)
+        usage["calls"] = usage["coalesced"] = 1
+        start = time.perf_counter()
+        flight.done.wait()
+        usage["latency_s"] = time.perf_counter() - start
+        usage["failures"] = int(flight.error is not None)
+        self._record(usage)
+        if flight.error is not None:
+            raise flight.error
+        # Payloads get mutated downstream: every follower gets its own copy
+        return copy.deepcopy(flight.result)
+
+    def _invoke_json(self, system_rules: str, user_prompt: str, max_retries: int, kind: str) -> dict[str, Any]:
         messages = [
             SystemMessage(content=system_rules),
             HumanMessage(content=user_prompt),
         ]
 
+        usage = dict.fromkeys(self._METRICS, 0)
+        usage["calls"] = 1
+        estimate = estimate_tokens(system_rules) + estimate_tokens(user_prompt) + self.expected_completion_tokens
+        start = time.perf_counter()
+        deadline = start + self.max_wait_s
         last_err: Exception | None = None
-        for _ in range(max_retries + 1):
+        try:
+            for attempt in range(max_retries + 1):
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                if self.breaker is not None and not self.breaker.allow():
+                    usage["short_circuited"] = 1
+                    last_err = CircuitOpenError(
+                        f"LLM circuit open (next probe in {self.breaker.retry_in():.1f} s)")
+                    break
+                usage["attempts"] += 1
+                if self.limiter is not None:
+                    try:
+                        usage["queued_s"] += self.limiter.acquire(estimate, timeout=remaining)
+                    except TimeoutError as e:
+                        if self.breaker is not None:
+                            self.breaker.abandon()
+                        last_err = e
+                        break
+                    remaining = deadline - time.perf_counter()
+                delay = 0.0
+                ok = True
+                sent = time.perf_counter()
+                try:
+                    # _send releases this attempt's limiter slot itself, once
+                    # the primary request has really finished
+                    res = self._send(messages, max(0.1, min(self.request_timeout, remaining)), kind, estimate, usage)
+                    tokens = getattr(res, "usage_metadata", None) or {}
+                    usage["prompt_tokens"] += tokens.get("input_tokens", 0)
+                    usage["completion_tokens"] += tokens.get("output_tokens", 0)
+                    text = (res.content or "").strip()
+                    return json.loads(text)
+                except ValueError as e:
+                    # Malformed JSON: the backend is healthy, ask again now
+                    last_err = e
+                except Exception as e:
+                    ok = False
+                    last_err = e
+                    if not is_retryable(e):
+                        break
+                    retry_after = retry_after_seconds(e)
+                    delay = backoff_delay(attempt, retry_after=retry_after)
+                    if status_code(e) == 429:
+                        usage["rate_limited"] += 1
+                        if self.limiter is not None:
+                            self.limiter.throttle(delay)
+                finally:
+                    if self.breaker is not None:
+                        self.breaker.record(ok, time.perf_counter() - sent)
+                delay = min(delay, deadline - time.perf_counter())
+                if delay > 0 and attempt < max_retries:
+                    usage["backoff_s"] += delay
+                    time.sleep(delay)
+
+            usage["failures"] = 1
+            if isinstance(last_err, CircuitOpenError):
+                raise last_err
+            raise RuntimeError(f"LLM JSON invoke failed: {last_err or 'deadline exceeded'}")
+        finally:
+            usage["latency_s"] = time.perf_counter() - start
+            self._record(usage)
+
+    def _send(self, messages: list[Any], timeout: float, kind: str, estimate: int,
+              usage: dict[str, float]) -> Any:
+        """
+        One attempt, hedged when the policy allows; returns the message.
+
+        Releases the attempt's limiter slot (taken by invoke_json) when the
+        primary request finishes, even if a hedge won long before, so the
+        in-flight cap counts every request still on the wire. Only the
+        primary's own latency teaches the policy: a hedged call's latency
+        is cut short by the hedge and would drag the threshold down.
+        """
+        assert self._llm is not None
+        delay = self.hedge.delay(kind) if self.hedge is not None else None
+        if delay is None or delay >= timeout:
+            return self._primary(messages, timeout, kind, estimate)
+
+        results: queue.Queue[tuple[int, Any, Exception | None]] = queue.Queue()
+        cancels: list[threading.Event] = []
+
+        def race(idx: int, cancelled: threading.Event, budget: float) -> None:
             try:
-                res = self._llm.invoke(messages)
-                text = (res.content or "").strip()
-                return json.loads(text)
+                if idx == 0:
+                    results.put((idx, self._primary(messages, budget, kind, estimate), None))
+                    return
+                out = None
+                try:
+                    out = self._stream(messages, budget, cancelled)
+                finally:
+                    self._release(estimate, out)
+                results.put((idx, out, None))
             except Exception as e:
-                last_err = e
+                results.put((idx, None, e))
+
+        def launch(budget: float) -> None:
+            cancels.append(threading.Event())
+            threading.Thread(target=race, args=(len(cancels) - 1, cancels[-1], budget),
+                             name="llm-hedge", daemon=True).start()
+
+        started = time.perf_counter()
+        launch(timeout)
+        pending = 1
+        hedged = False
+        first_err: Exception | None = None
+        try:
+            while pending:
+                wait = None if hedged else max(0.0, started + delay - time.perf_counter())
+                try:
+                    idx, res, err = results.get(timeout=wait)
+                except queue.Empty:
+                    hedged = True
+                    remaining = timeout - (time.perf_counter() - started)
+                    if remaining > 0 and self._admit_hedge(estimate):
+                        usage["hedges"] += 1
+                        launch(remaining)
+                        pending += 1
+                    continue
+                pending -= 1
+                if err is None:
+                    if idx > 0:
+                        usage["hedge_wins"] += 1
+                        self.hedge.won()
+                    return res
+                first_err = first_err or err
+            assert first_err is not None
+            raise first_err
+        finally:
+            for cancelled in cancels:
+                cancelled.set()
+
+    def _primary(self, messages: list[Any], timeout: float, kind: str, estimate: int) -> Any:
+        sent = time.perf_counter()
+        res = None
+        try:
+            res = self._llm.invoke(messages, timeout=timeout)
+        finally:
+            self._release(estimate, res)
+        if self.hedge is not None:
+            self.hedge.observe(kind, time.perf_counter() - sent)
+        return res
+
+    def _release(self, estimate: int, res: Any) -> None:
+        if self.limiter is not None:
+            tokens = getattr(res, "usage_metadata", None) or {}
+            self.limiter.release(estimate, tokens.get("total_tokens") if tokens else None)
+
+    def _admit_hedge(self, estimate: int) -> bool:
+        if self.limiter is not None:
+            try:
+                self.limiter.acquire(estimate, PRIORITY_PREFETCH, timeout=0)
+            except TimeoutError:
+                return False
+        if self.hedge.try_hedge():
+            return True
+        if self.limiter is not None:
+            self.limiter.release(estimate)
+        return False
+
+    def _stream(self, messages: list[Any], timeout: float, cancelled: threading.Event) -> Any:
+        """
+        Streamed request that stops (closing the connection) once
+        `cancelled` is set; returns the aggregated message or None.
+        """
+        stream = self._llm.stream(messages, timeout=timeout, stream_usage=True)
+        parts: list[str] = []
+        tokens = None
+        try:
+            for chunk in stream:
+                if cancelled.is_set():
+                    return None
+                # Collect text rather than summing chunks (quadratic merge)
+                if isinstance(chunk.content, str):
+                    parts.append(chunk.content)
+                tokens = chunk.usage_metadata or tokens
+        finally:
+            stream.close()
+        return AIMessage(content="".join(parts), usage_metadata=tokens)
+
+    def _record(self, usage: dict[str, float]) -> None:
+        local = self._local.__dict__
+        with self._lock:
+            for k, v in usage.items():
+                self._totals[k] += v
+                local[k] = local.get(k, 0) + v
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Process-wide totals since construction (or reset_metrics()), plus
+        the circuit breaker's state and counters as breaker_* and the hedge
+        policy's budget use and learned thresholds as hedge_*.
+        """
+        with self._lock:
+            out: dict[str, Any] = dict(self._totals)
+        out["total_tokens"] = out["prompt_tokens"] + out["completion_tokens"]
+        out["mean_latency_s"] = out["latency_s"] / out["calls"] if out["calls"] else 0.0
+        if self.breaker is not None:
+            out.update({f"breaker_{k}": v for k, v in self.breaker.stats().items()})
+        if self.hedge is not None:
+            hedge = self.hedge.stats()
+            out.update({f"hedge_{k}": hedge[k] for k in ("requests", "denied", "extra_share", "thresholds_s")})
+        return out
+
+    def thread_usage(self) -> dict[str, float]:
+        """
+        Running totals for calls made from the current thread.
+        """
+        local = self._local.__dict__
+        return {k: local.get(k, 0) for k in self._METRICS}
+
+    def reset_metrics(self) -> None:
+        with self._lock:
+            self._totals = dict.fromkeys(self._METRICS, 0)
+
+
+class _Flight:
+    """
+    One in-flight request that identical concurrent calls wait on.
+    """
 
-        raise RuntimeError(f"LLM JSON invoke failed: {last_err}")
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: dict[str, Any] | None = None
+        self.error: Exception | None = None
+        self.followers = 0
@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import email.utils
+import heapq
+import itertools
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+# Lower value = served first. Requests for something the player is waiting
+# on run at INTERACTIVE; speculative work (ScreenManager.preload prefetches)
+# runs at PREFETCH, so it never delays a gate the player just walked into.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_PREFETCH = 10
+
+# HTTP statuses worth retrying; other 4xx (bad request, auth, not found)
+# fail the same way every time.
+RETRYABLE_STATUS = (408, 409, 429)
+
+_context = threading.local()
+
+
+class PriorityScope:
+    """
+    A priority level that can be raised after requests were queued with it.
+
+    Run a background task under priority(scope); if the player starts
+    waiting on that task, promote() moves its requests already queued in a
+    RateLimiter ahead of the remaining prefetches.
+    """
+
+    def __init__(self, level: int):
+        self.level = level
+        self._queued: set[RateLimiter] = set()
+        self._lock = threading.Lock()
+
+    def promote(self, level: int = PRIORITY_INTERACTIVE) -> None:
+        with self._lock:
+            if level >= self.level:
+                return
+            self.level = level
+            limiters = list(self._queued)
+        for limiter in limiters:
+            limiter._reorder()
+
+
+@contextmanager
+def priority(level: int | PriorityScope) -> Iterator[None]:
+    """
+    Run LLM calls made by this thread inside the block at `level` (or at
+    the scope's level, which may be promoted while they wait).
+    """
+    prev = getattr(_context, "level", PRIORITY_INTERACTIVE)
+    _context.level = level
+    try:
+        yield
+    finally:
+        _context.level = prev
+
+
+def current_priority() -> int:
+    level = getattr(_context, "level", PRIORITY_INTERACTIVE)
+    return level.level if isinstance(level, PriorityScope) else level
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count (~4 characters per token), good enough for budgeting.
+    """
+    return max(1, len(text) // 4)
+
+
+def status_code(err: BaseException) -> Optional[int]:
+    status = getattr(err, "status_code", None)
+    if status is None:
+        status = getattr(getattr(err, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_retryable(err: BaseException) -> bool:
+    """
+    Transport errors without a status (timeouts, connection resets), 5xx
+    and RETRYABLE_STATUS are retried; other HTTP errors are not.
+    """
+    status = status_code(err)
+    return status is None or status >= 500 or status in RETRYABLE_STATUS
+
+
+def retry_after_seconds(err: BaseException) -> Optional[float]:
+    """
+    Server-requested wait from retry-after-ms / Retry-After (seconds or an
+    HTTP date) on the error's response, if any.
+    """
+    headers = getattr(getattr(err, "response", None), "headers", None)
+    if not headers:
+        return None
+    ms = headers.get("retry-after-ms")
+    if ms:
+        try:
+            return max(0.0, float(ms) / 1000.0)
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0,
+                  retry_after: Optional[float] = None, rng: Any = random) -> float:
+    """
+    Full-jitter exponential backoff for retry number `attempt` (0-based).
+    A server Retry-After is a floor; jitter on top keeps clients that were
+    throttled together from retrying together.
+    """
+    if retry_after is not None:
+        return min(cap, retry_after) + rng.uniform(0.0, base)
+    return rng.uniform(0.0, min(cap, base * 2 ** attempt))
+
+
+class _Bucket:
+    """
+    Token bucket refilled continuously at per_minute / 60 per second.
+    """
+
+    def __init__(self, per_minute: float, now: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.at = now
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.at) * self.rate)
+        self.at = now
+
+    def wait_for(self, amount: float) -> float:
+        # A request larger than the whole bucket waits for a full bucket
+        # instead of forever
+        amount = min(amount, self.capacity)
+        return 0.0 if self.level >= amount else (amount - self.level) / self.rate
+
+
+class RateLimiter:
+    """
+    Admission control for LLM requests: requests per minute, tokens per
+    minute and a cap on requests in flight (0 disables each limit).
+
+    acquire(tokens) blocks until the request fits every limit, then counts
+    it in flight; release() must follow once the response (or error) is
+    in, with the actual token usage when known so the bucket is corrected
+    for the estimate. Waiters are served strictly by (priority, arrival),
+    so an interactive request overtakes queued prefetches; a waiter queued
+    under a PriorityScope is re-ranked when the scope is promoted. throttle() pauses
+    all admissions, e.g. for a 429's Retry-After.
+
+    One limiter is shared by every LLMClient in the process (see shared()),
+    since the Azure quota is per deployment, not per client.
+    """
+
+    _shared: Optional["RateLimiter"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, rpm: float = 0, tpm: float = 0, max_in_flight: int = 0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        now = clock()
+        self.requests = _Bucket(rpm, now) if rpm else None
+        self.tokens = _Bucket(tpm, now) if tpm else None
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+        # [level, seq, scope] entries; level is rewritten on promotion
+        self._queue: list[list[Any]] = []
+        self._seq = itertools.count()
+        self._stats = {"granted": 0, "queued_s": 0.0, "max_queued_s": 0.0, "throttled": 0, "max_queue": 0}
+
+    @classmethod
+    def shared(cls, rpm: float = 0, tpm: float = 0, max_in_flight: int = 0) -> "RateLimiter":
+        """
+        The process-wide limiter, created with these limits on first use.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(rpm, tpm, max_in_flight)
+            return cls._shared
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.requests or self.tokens or self.max_in_flight)
+
+    def acquire(self, tokens: int, level: Optional[int] = None, timeout: Optional[float] = None) -> float:
+        """
+        Wait for admission; returns the seconds spent queued. Raises
+        TimeoutError if not admitted within `timeout`.
+        """
+        scope = getattr(_context, "level", None) if level is None else None
+        scope = scope if isinstance(scope, PriorityScope) else None
+        ticket = [current_priority() if level is None else level, next(self._seq), scope]
+        start = self.clock()
+        with self._cond:
+            heapq.heappush(self._queue, ticket)
+            self._stats["max_queue"] = max(self._stats["max_queue"], len(self._queue))
+            if scope is not None:
+                with scope._lock:
+                    scope._queued.add(self)
+                # promoted between reading its level and queueing
+                ticket[0] = min(ticket[0], scope.level)
+                heapq.heapify(self._queue)
+            try:
+                while True:
+                    now = self.clock()
+                    wait = self._wait_time(now, tokens) if self._queue[0] is ticket else None
+                    if wait is not None and wait <= 0:
+                        heapq.heappop(self._queue)
+                        self._admit(tokens)
+                        self._cond.notify_all()
+                        queued = now - start
+                        self._stats["queued_s"] += queued
+                        self._stats["max_queued_s"] = max(self._stats["max_queued_s"], queued)
+                        return queued
+                    if timeout is not None:
+                        remaining = timeout - (now - start)
+                        if remaining <= 0:
+                            raise TimeoutError(f"rate limiter: not admitted within {timeout:.1f} s")
+                        wait = remaining if wait is None else min(wait, remaining)
+                    self._cond.wait(wait)
+            except BaseException:
+                if ticket in self._queue:
+                    self._queue.remove(ticket)
+                    heapq.heapify(self._queue)
+                    self._cond.notify_all()
+                raise
+            finally:
+                if scope is not None and not any(t[2] is scope for t in self._queue):
+                    with scope._lock:
+                        scope._queued.discard(self)
+
+    def _reorder(self) -> None:
+        """
+        Re-rank queued requests after a PriorityScope was promoted.
+        """
+        with self._cond:
+            for ticket in self._queue:
+                if ticket[2] is not None:
+                    ticket[0] = min(ticket[0], ticket[2].level)
+            heapq.heapify(self._queue)
+            self._cond.notify_all()
+
+    def _wait_time(self, now: float, tokens: int) -> Optional[float]:
+        """
+        Seconds until the head request fits, or None to wait for a release.
+        """
+        if self.max_in_flight and self.in_flight >= self.max_in_flight:
+            return None
+        waits = [self._paused_until - now]
+        for bucket, amount in ((self.requests, 1), (self.tokens, tokens)):
+            if bucket is not None:
+                bucket.refill(now)
+                waits.append(bucket.wait_for(amount))
+        return max(waits)
+
+    def _admit(self, tokens: int) -> None:
+        if self.requests is not None:
+            self.requests.level -= 1
+        if self.tokens is not None:
+            self.tokens.level -= min(tokens, self.tokens.capacity)
+        self.in_flight += 1
+        self._stats["granted"] += 1
+
+    def release(self, estimated: int = 0, actual: Optional[int] = None) -> None:
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            if self.tokens is not None and actual is not None:
+                # Charge (or refund) the difference between real usage and
+                # the estimate taken at admission
+                self.tokens.refill(self.clock())
+                self.tokens.level = min(self.tokens.capacity, self.tokens.level - (actual - estimated))
+            self._cond.notify_all()
+
+    def throttle(self, seconds: float) -> None:
+        """
+        Admit nothing for `seconds` (server asked us to back off).
+        """
+        with self._cond:
+            self._paused_until = max(self._paused_until, self.clock() + seconds)
+            self._stats["throttled"] += 1
+            self._cond.notify_all()
+
+    def stats(self) -> dict[str, float]:
+        with self._cond:
+            out = dict(self._stats)
+            out["in_flight"] = self.in_flight
+            out["queued"] = len(self._queue)
+            now = self.clock()
+            for name, bucket in (("requests", self.requests), ("tokens", self.tokens)):
+                if bucket is not None:
+                    bucket.refill(now)
+                    out[f"{name}_available"] = bucket.level
+        return out
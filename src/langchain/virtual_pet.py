@@ -157,24 +157,48 @@ def llm_worker(user_input: str):
 # ---------------- UI HELPERS ----------------
 
 
+_wrap_cache = {}
+_word_widths = {}
+
+
+def _word_width(font, word):
+    key = (font, word)
+    w = _word_widths.get(key)
+    if w is None:
+        # Bounded like _wrap_cache: a long chat keeps adding new words
+        if len(_word_widths) >= 8192:
+            _word_widths.clear()
+        w = _word_widths[key] = font.size(word)[0]
+    return w
+
+
 def wrap_text(text, font, max_width):
-    """Wrap text to fit within max_width."""
-    words = text.split(" ")
+    """Wrap text to fit within max_width (memoized per text/font/width)."""
+    key = (text, font, max_width)
+    if key in _wrap_cache:
+        return _wrap_cache[key]
+
+    space = _word_width(font, " ")
     lines = []
     line = []
+    line_w = 0
 
-    for word in words:
-        test_line = line + [word]
-        if font.size(" ".join(test_line))[0] <= max_width:
+    for word in text.split(" "):
+        w = _word_width(font, word)
+        if not line or line_w + space + w <= max_width:
+            line_w = w if not line else line_w + space + w
             line.append(word)
         else:
-            if line:
-                lines.append(" ".join(line))
+            lines.append(" ".join(line))
             line = [word]
+            line_w = w
 
     if line:
         lines.append(" ".join(line))
 
+    if len(_wrap_cache) > 512:
+        _wrap_cache.clear()
+    _wrap_cache[key] = lines
     return lines
 
 
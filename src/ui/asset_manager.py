@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Optional
+
+import pygame
+
+UI_ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+Size = tuple[int, int]
+
+
+def ui_asset(filename: str) -> str:
+    return os.path.join(UI_ASSETS_DIR, filename)
+
+
+class AssetManager:
+    """
+    Process-wide image cache.
+
+    Each file is decoded once, converted to the display format once
+    (convert_alpha for sprites, convert for opaque backgrounds) and every
+    caller gets the same surface back; scaled variants are cached per size.
+    Conversion needs a display mode, so load images after
+    pygame.display.set_mode. Returned surfaces are shared and must be treated
+    as read-only.
+
+    Loading is lazy: nothing is read until a screen asks for it. A screen can
+    also call preload(name) for the next screen in SCREEN_ASSETS, which
+    decodes those files on a background thread; the conversion itself always
+    happens on the main thread on first use.
+    """
+
+    def __init__(self, workers: int = 2):
+        self.workers = workers
+        self._pending: dict[str, Future] = {}
+        self._missing: set[str] = set()
+        self._surfaces: dict[tuple[str, Optional[Size], bool], pygame.Surface] = {}
+        self._manifest: dict[str, list[str]] = {}
+        self._atlas_index: str | None = None
+        self._atlas = None
+        self._pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.decodes = 0
+        self.preloaded = 0
+        self.decode_seconds = 0.0
+
+    @staticmethod
+    def _path(path: str) -> str:
+        return os.path.abspath(path)
+
+    def _decode(self, path: str) -> Optional[pygame.Surface]:
+        start = time.perf_counter()
+        try:
+            img = pygame.image.load(path)
+        except (pygame.error, OSError):
+            img = None
+        with self._lock:
+            self.decodes += 1
+            self.decode_seconds += time.perf_counter() - start
+        return img
+
+    def _raw(self, path: str) -> Optional[pygame.Surface]:
+        if path in self._missing:
+            return None
+        fut = self._pending.pop(path, None)
+        img = fut.result() if fut is not None else self._decode(path)
+        if img is None:
+            self._missing.add(path)
+        return img
+
+    def image(self, path: str, size: Optional[Size] = None, alpha: bool = True) -> Optional[pygame.Surface]:
+        """
+        Shared surface for path (optionally scaled to size), or None if the
+        file is missing or unreadable.
+        """
+        path = self._path(path)
+        size = (int(size[0]), int(size[1])) if size else None
+        key = (path, size, alpha)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        if size is not None and alpha and self._atlas_index is not None:
+            surf = self._from_atlas(path, size)
+            if surf is not None:
+                self._surfaces[key] = surf
+                return surf
+
+        base = self._surfaces.get((path, None, alpha))
+        if base is None:
+            raw = self._raw(path)
+            if raw is None:
+                return None
+            if pygame.display.get_surface() is not None:
+                base = raw.convert_alpha() if alpha else raw.convert()
+            else:
+                base = raw
+            self._surfaces[(path, None, alpha)] = base
+
+        if size is None or base.get_size() == size:
+            surf = base
+        else:
+            surf = pygame.transform.scale(base, size)
+        self._surfaces[key] = surf
+        return surf
+
+    def load(self, path: str, size: Optional[Size] = None, alpha: bool = True) -> pygame.Surface:
+        """
+        Like image() but raises for a missing file, matching pygame.image.load.
+        """
+        surf = self.image(path, size, alpha)
+        if surf is None:
+            raise FileNotFoundError(path)
+        return surf
+
+    def use_atlas(self, index_path: str) -> None:
+        """
+        Serve (path, size) sprites from a ui.atlas sheet when it has them.
+        The sheet is loaded on the first sprite request; without an index
+        file every sprite comes from its own file as before.
+        """
+        self._atlas_index = self._path(index_path)
+        self._atlas = None
+
+    def _from_atlas(self, path: str, size: Size) -> Optional[pygame.Surface]:
+        if self._atlas is None:
+            if not os.path.exists(self._atlas_index):
+                self._atlas_index = None
+                return None
+            from ui.atlas import Atlas
+
+            self._atlas = Atlas.load(self._atlas_index, self)
+        return self._atlas.get(path, size)
+
+    def register(self, name: str, paths: Iterable[str]) -> None:
+        self._manifest[name] = list(paths)
+
+    def preload(self, name: str) -> int:
+        """
+        Start decoding the files listed for name in the background.
+        Returns how many files were queued.
+        """
+        queued = 0
+        for path in self._manifest.get(name, ()):
+            path = self._path(path)
+            if (
+                path in self._pending
+                or path in self._missing
+                or (path, None, True) in self._surfaces
+                or (path, None, False) in self._surfaces
+            ):
+                continue
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="assets")
+            self._pending[path] = self._pool.submit(self._decode, path)
+            queued += 1
+        self.preloaded += queued
+        return queued
+
+    def clear(self) -> None:
+        for fut in self._pending.values():
+            fut.cancel()
+        self._pending.clear()
+        self._missing.clear()
+        self._surfaces.clear()
+        self._atlas = None
+
+    def stats(self) -> dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "surfaces": len(self._surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "decodes": self.decodes,
+            "preloaded": self.preloaded,
+            "decode_ms": self.decode_seconds * 1000.0,
+        }
+
+
+# Files each screen needs, so the previous screen can preload them.
+# Legacy paths (images/...) are relative to src/, like app/main.py.
+SCREEN_ASSETS: dict[str, list[str]] = {
+    "training_map": [
+        ui_asset(name)
+        for name in (
+            "background.png",
+            "warrior_up.png",
+            "warrior_down.png",
+            "warrior_left.png",
+            "warrior_right.png",
+            "wise_man.png",
+            "house.png",
+            "gate.png",
+        )
+    ],
+    "gate_scene": [
+        ui_asset("gate_background.png"),
+        ui_asset("wise_man_gate.png"),
+        ui_asset("dragon_warrior.png"),
+    ],
+    "chapter1": [
+        "images/background.png",
+        "images/home_bg.png",
+        "images/house.png",
+        "images/gate.png",
+        "images/wiseman/west.png",
+    ]
+    + [f"images/{who}/{d}.png" for who in ("warrior", "fedora", "wiseman") for d in ("north", "south", "west", "east")],
+    "chapter2": [
+        "images/chapter2_bg.png",
+        "images/portal.png",
+        "images/home.png",
+        "images/heart.png",
+    ],
+}
+
+_assets = AssetManager()
+for _name, _paths in SCREEN_ASSETS.items():
+    _assets.register(_name, _paths)
+
+
+def asset_manager() -> AssetManager:
+    return _assets
+
+
+def load_image(path: str, size: Optional[Size] = None, alpha: bool = True) -> Optional[pygame.Surface]:
+    return _assets.image(path, size, alpha)
@@ -0,0 +1,170 @@
+"""
+Sprite atlas: an offline packer and the runtime lookup used by AssetManager.
+
+The builder scales every sprite to the size it is drawn at, packs them into
+one or a few sheets with a shelf packer and writes a JSON index next to the
+sheets. At runtime the sheet is loaded (and converted) once and each sprite
+is a subsurface of it, so blits read from shared sheet pixels and startup
+opens one PNG instead of one per sprite.
+
+Rebuild after changing any sprite, from src/:
+    python -m ui.atlas
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from typing import Iterable, Optional
+
+import pygame
+
+from ui.asset_manager import AssetManager, Size, asset_manager
+
+ATLAS_DIR = os.path.join("images", "atlas")
+ATLAS_INDEX = os.path.join(ATLAS_DIR, "sprites.json")
+
+# (path, drawn size) of the app/main.py sprites; paths are relative to src/.
+LEGACY_SPRITES: list[tuple[str, Size]] = [
+    (f"images/{who}/{d}.png", (100, 100))
+    for who in ("warrior", "fedora", "wiseman")
+    for d in ("north", "south", "west", "east")
+] + [
+    ("images/house.png", (200, 200)),
+    ("images/gate.png", (100, 100)),
+    ("images/portal.png", (100, 100)),
+    ("images/home.png", (100, 100)),
+    ("images/heart.png", (100, 100)),
+]
+
+
+def sprite_key(path: str, size: Size) -> str:
+    path = os.path.normpath(path).replace(os.sep, "/")
+    return f"{path}@{int(size[0])}x{int(size[1])}"
+
+
+def pack_shelves(sizes: list[Size], max_size: int = 1024, padding: int = 1) -> list[tuple[int, int, int]]:
+    """
+    (page, x, y) for each size, in input order. Tallest sprites are placed
+    first; each shelf is as tall as its first sprite and a new page starts
+    when a shelf no longer fits.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    out: list[tuple[int, int, int]] = [(0, 0, 0)] * len(sizes)
+    page = x = y = shelf_h = 0
+    for i in order:
+        w, h = sizes[i]
+        if w + padding > max_size or h + padding > max_size:
+            raise ValueError(f"sprite {w}x{h} does not fit a {max_size}px sheet")
+        if x + w + padding > max_size:
+            x, y, shelf_h = 0, y + shelf_h, 0
+        if y + h + padding > max_size:
+            page, x, y, shelf_h = page + 1, 0, 0, 0
+        out[i] = (page, x, y)
+        x += w + padding
+        shelf_h = max(shelf_h, h + padding)
+    return out
+
+
+def build_atlas(
+    sprites: Iterable[tuple[str, Size]],
+    out_dir: str = ATLAS_DIR,
+    name: str = "sprites",
+    max_size: int = 1024,
+    padding: int = 1,
+) -> str:
+    """
+    Pack sprites into out_dir/<name>_<page>.png plus out_dir/<name>.json.
+    Returns the index path.
+    """
+    sprites = list(dict.fromkeys((os.path.normpath(p), (int(s[0]), int(s[1]))) for p, s in sprites))
+    images = [pygame.transform.scale(pygame.image.load(p), s) for p, s in sprites]
+    places = pack_shelves([s for _, s in sprites], max_size, padding)
+
+    pages: list[list[int]] = []
+    for (page, x, y), img in zip(places, images):
+        while len(pages) <= page:
+            pages.append([0, 0])
+        pages[page][0] = max(pages[page][0], x + img.get_width())
+        pages[page][1] = max(pages[page][1], y + img.get_height())
+
+    sheets = [pygame.Surface((w, h), pygame.SRCALPHA) for w, h in pages]
+    entries: dict[str, dict] = {}
+    for (path, size), (page, x, y), img in zip(sprites, places, images):
+        sheets[page].blit(img, (x, y))
+        entries[sprite_key(path, size)] = {"page": page, "rect": [x, y, size[0], size[1]]}
+
+    os.makedirs(out_dir, exist_ok=True)
+    files = []
+    for i, sheet in enumerate(sheets):
+        fname = f"{name}_{i}.png"
+        pygame.image.save(sheet, os.path.join(out_dir, fname))
+        files.append(fname)
+
+    index_path = os.path.join(out_dir, f"{name}.json")
+    tmp = index_path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"pages": files, "sprites": entries}, f, indent=2, sort_keys=True)
+    os.replace(tmp, index_path)
+    return index_path
+
+
+class Atlas:
+    """
+    Runtime view of a built atlas. get() returns a subsurface of the sheet
+    for a (path, size) that was packed, or None so callers fall back to the
+    individual file.
+    """
+
+    def __init__(self, pages: list[pygame.Surface], rects: dict[tuple[str, Size], tuple[int, pygame.Rect]]):
+        self.pages = pages
+        self._rects = rects
+        self._subsurfaces: dict[tuple[str, Size], pygame.Surface] = {}
+
+    @classmethod
+    def load(cls, index_path: str, assets: Optional[AssetManager] = None) -> "Atlas":
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        base = os.path.dirname(index_path)
+        assets = assets or asset_manager()
+        pages = [assets.load(os.path.join(base, name)) for name in index["pages"]]
+        # Sprite paths are relative to src/ like the rest of the legacy assets
+        rects = {}
+        for key, v in index["sprites"].items():
+            path, _, size = key.rpartition("@")
+            w, h = size.split("x")
+            rects[(os.path.abspath(path), (int(w), int(h)))] = (int(v["page"]), pygame.Rect(v["rect"]))
+        return cls(pages, rects)
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def get(self, path: str, size: Size) -> Optional[pygame.Surface]:
+        key = (os.path.abspath(path), (int(size[0]), int(size[1])))
+        surf = self._subsurfaces.get(key)
+        if surf is not None:
+            return surf
+        entry = self._rects.get(key)
+        if entry is None:
+            return None
+        page, rect = entry
+        surf = self.pages[page].subsurface(rect)
+        self._subsurfaces[key] = surf
+        return surf
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Pack the legacy game sprites into an atlas.")
+    parser.add_argument("--out", default=ATLAS_DIR)
+    parser.add_argument("--max-size", type=int, default=1024)
+    parser.add_argument("--padding", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    path = build_atlas(LEGACY_SPRITES, args.out, max_size=args.max_size, padding=args.padding)
+    with open(path, "r", encoding="utf-8") as f:
+        index = json.load(f)
+    print(f"wrote {path}: {len(index['sprites'])} sprites on {len(index['pages'])} page(s)")
+
+
+if __name__ == "__main__":
+    main()
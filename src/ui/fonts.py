@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import time
+from typing import Callable, Optional
+
+import pygame
+
+FontKey = tuple[Optional[str], int, bool, bool]
+
+
+class FontRegistry:
+    """
+    Process-wide font cache keyed by (family, size, bold, italic).
+
+    family=None means pygame's default font (pygame.font.Font(None, size)),
+    any other value goes through SysFont. Fonts are created on first use and
+    shared by every screen and widget afterwards.
+    """
+
+    def __init__(self) -> None:
+        self._fonts: dict[FontKey, pygame.font.Font] = {}
+        self._on_reload: list[Callable[[], None]] = []
+        self.hits = 0
+        self.misses = 0
+        self.load_seconds = 0.0
+
+    def get(self, family: Optional[str], size: int, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+        key = (family, int(size), bold, italic)
+        font = self._fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+
+        self.misses += 1
+        start = time.perf_counter()
+        if not pygame.font.get_init():
+            pygame.font.init()
+        if family is None:
+            font = pygame.font.Font(None, key[1])
+            font.set_bold(bold)
+            font.set_italic(italic)
+        else:
+            font = pygame.font.SysFont(family, key[1], bold=bold, italic=italic)
+        self.load_seconds += time.perf_counter() - start
+        self._fonts[key] = font
+        return font
+
+    def add_reload_listener(self, fn: Callable[[], None]) -> None:
+        """
+        fn is called after clear(), e.g. to drop caches keyed by font objects.
+        """
+        self._on_reload.append(fn)
+
+    def clear(self) -> None:
+        """
+        Drop every loaded font (needed after pygame.font.quit() or a font change).
+        """
+        self._fonts.clear()
+        for fn in self._on_reload:
+            fn()
+
+    def stats(self) -> dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "fonts": len(self._fonts),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "load_ms": self.load_seconds * 1000.0,
+        }
+
+
+_registry = FontRegistry()
+
+
+def font_registry() -> FontRegistry:
+    return _registry
+
+
+def get_font(family: Optional[str], size: int, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+    return _registry.get(family, size, bold, italic)
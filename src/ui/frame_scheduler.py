@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import time
+
+import pygame
+
+
+class FrameScheduler:
+    """
+    Adaptive frame pacing for the main loops.
+
+    While the game is active it behaves like clock.tick(fps) followed by
+    pygame.event.get(). When the caller reports the current screen as idle
+    (nothing animating), no key is held and there has been no input for
+    idle_after seconds, it blocks in pygame.event.wait instead, waking on the
+    next event or after 1/idle_fps seconds. Any input returns to full rate
+    immediately.
+
+    dt is real elapsed time, except on the frame that input wakes up from an
+    idle wait, where it is capped at one active frame so held-key movement
+    does not jump.
+    """
+
+    def __init__(self, fps: int = 60, idle_fps: float = 4.0, idle_after: float = 0.5):
+        self.fps = fps
+        self.idle_fps = idle_fps
+        self.idle_after = idle_after
+        self.clock = pygame.time.Clock()
+        self._last_input = time.perf_counter()
+        self._last_frame = time.perf_counter()
+        self.frames = 0
+        self.idle_frames = 0
+
+    def _input_seen(self, events: list[pygame.event.Event]) -> None:
+        for event in events:
+            if event.type in (
+                pygame.KEYDOWN,
+                pygame.KEYUP,
+                pygame.MOUSEBUTTONDOWN,
+                pygame.MOUSEBUTTONUP,
+                pygame.MOUSEMOTION,
+                pygame.MOUSEWHEEL,
+                pygame.TEXTINPUT,
+            ):
+                self._last_input = time.perf_counter()
+                return
+
+    def can_idle(self) -> bool:
+        if time.perf_counter() - self._last_input < self.idle_after:
+            return False
+        return not any(pygame.key.get_pressed())
+
+    def next_frame(self, idle: bool) -> tuple[float, list[pygame.event.Event]]:
+        """
+        Wait for the next frame and return (dt seconds, events).
+        idle: the current screen has nothing to animate.
+        """
+        self.frames += 1
+        if idle and self.can_idle():
+            self.idle_frames += 1
+            first = pygame.event.wait(int(1000 / self.idle_fps))
+            events = [] if first.type == pygame.NOEVENT else [first] + pygame.event.get()
+            self.clock.tick()  # restart the active-rate baseline
+            now = time.perf_counter()
+            dt = now - self._last_frame
+            self._last_frame = now
+            self._input_seen(events)
+            if events:
+                dt = min(dt, 1.0 / self.fps)
+            return dt, events
+
+        self.clock.tick(self.fps)
+        now = time.perf_counter()
+        dt = now - self._last_frame
+        self._last_frame = now
+        events = pygame.event.get()
+        self._input_seen(events)
+        return dt, events
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "frames": self.frames,
+            "idle_frames": self.idle_frames,
+            "idle_ratio": self.idle_frames / self.frames if self.frames else 0.0,
+        }
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+
+import pygame
+
+Color = tuple[int, int, int]
+
+
+class PanelCache:
+    """
+    Pre-composited translucent panels keyed by
+    (size, fill, alpha, radius, border, border_color).
+
+    A panel is built once on an SRCALPHA surface (rounded fill plus border)
+    and afterwards costs a single blit, so steady-state frames allocate no
+    surfaces. Returned surfaces are shared and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._panels: OrderedDict[tuple[Any, ...], pygame.Surface] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def panel(
+        self,
+        size: tuple[int, int],
+        fill: Color,
+        alpha: int = 255,
+        radius: int = 0,
+        border: int = 0,
+        border_color: Color = (255, 255, 255),
+    ) -> pygame.Surface:
+        key = ((int(size[0]), int(size[1])), tuple(fill), int(alpha), int(radius), int(border), tuple(border_color))
+        surf = self._panels.get(key)
+        if surf is not None:
+            self._panels.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = pygame.Surface(key[0], pygame.SRCALPHA)
+        rect = surf.get_rect()
+        pygame.draw.rect(surf, (*fill, alpha), rect, border_radius=radius)
+        if border > 0:
+            pygame.draw.rect(surf, border_color, rect, border, border_radius=radius)
+        self._panels[key] = surf
+        if len(self._panels) > self.max_entries:
+            self._panels.popitem(last=False)
+        return surf
+
+    def clear(self) -> None:
+        self._panels.clear()
+
+    def stats(self) -> dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "panels": len(self._panels),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+_panels = PanelCache()
+
+
+def panel_cache() -> PanelCache:
+    return _panels
+
+
+def draw_panel(
+    surface: pygame.Surface,
+    rect: pygame.Rect,
+    fill: Color,
+    alpha: int = 255,
+    radius: int = 0,
+    border: int = 0,
+    border_color: Color = (255, 255, 255),
+) -> None:
+    surface.blit(_panels.panel(rect.size, fill, alpha, radius, border, border_color), rect.topleft)
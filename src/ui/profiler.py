@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+import pygame
+
+from ui.fonts import get_font
+from ui.panels import draw_panel
+
+PHASES = ("handle_event", "update", "draw", "flip")
+
+# Histogram bucket upper bounds in ms (a final open-ended bucket follows)
+BUCKETS_MS = (0.5, 1.0, 2.0, 4.0, 8.0, 16.7, 33.3, 66.7)
+
+
+def percentile(samples: Any, q: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+class FrameProfiler:
+    """
+    Per-phase frame timings for the game loop.
+
+    The loop wraps each phase in phase(scope, name), where scope is the
+    screen (or legacy state) and name one of PHASES, and brackets the
+    frame's work with begin_frame()/end_frame(). The last `window` samples
+    per (scope, phase) and per frame are kept, so percentiles and
+    histogram() are rolling. Time spent waiting for the next frame is not
+    frame work: p99 covers only begin_frame..end_frame, while FPS comes
+    from the begin-to-begin interval.
+
+    draw_overlay() shows FPS, p99 frame time and the slowest phase while
+    overlay_visible is set (F3 in ScreenManager and app/main.py). Every
+    phase is also recorded as a Chrome trace event ("X" duration events,
+    bounded to trace_events), which dump_trace() writes for
+    chrome://tracing or https://ui.perfetto.dev.
+    """
+
+    def __init__(self, window: int = 600, trace_events: int = 200_000):
+        self.window = window
+        self.frames: deque[float] = deque(maxlen=window)
+        self.intervals: deque[float] = deque(maxlen=window)
+        self.samples: dict[tuple[str, str], deque[float]] = {}
+        self.trace: deque[dict[str, Any]] | None = deque(maxlen=trace_events) if trace_events else None
+        self.overlay_visible = False
+        self.refresh = 0.25  # s between overlay text updates
+        self._t0 = time.perf_counter()
+        self._frame_start: float | None = None
+        self._lines: list[pygame.Surface] = []
+        self._lines_at = 0.0
+
+    # ---------------- recording ----------------
+
+    @contextmanager
+    def phase(self, scope: str, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(scope, name, start, time.perf_counter())
+
+    def record(self, scope: str, name: str, start: float, end: float) -> None:
+        key = (scope, name)
+        samples = self.samples.get(key)
+        if samples is None:
+            samples = self.samples[key] = deque(maxlen=self.window)
+        samples.append((end - start) * 1000.0)
+        self._trace(f"{scope}.{name}", name, start, end)
+
+    def begin_frame(self) -> None:
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self.intervals.append((now - self._frame_start) * 1000.0)
+        self._frame_start = now
+
+    def end_frame(self) -> None:
+        if self._frame_start is None:
+            return
+        end = time.perf_counter()
+        self.frames.append((end - self._frame_start) * 1000.0)
+        self._trace("frame", "frame", self._frame_start, end)
+
+    def _trace(self, name: str, cat: str, start: float, end: float) -> None:
+        if self.trace is not None:
+            self.trace.append({
+                "name": name, "cat": cat, "ph": "X", "pid": os.getpid(), "tid": 0,
+                "ts": round((start - self._t0) * 1e6, 1), "dur": round((end - start) * 1e6, 1),
+            })
+
+    # ---------------- reporting ----------------
+
+    def fps(self) -> float:
+        if not self.intervals:
+            return 0.0
+        mean = sum(self.intervals) / len(self.intervals)
+        return 1000.0 / mean if mean > 0 else 0.0
+
+    def histogram(self, scope: str, name: str) -> list[int]:
+        """
+        Counts per BUCKETS_MS bucket (plus the open-ended last one) over
+        the rolling window; scope="frame" gives whole frames.
+        """
+        samples = self.frames if scope == "frame" else self.samples.get((scope, name), ())
+        counts = [0] * (len(BUCKETS_MS) + 1)
+        for ms in samples:
+            i = 0
+            while i < len(BUCKETS_MS) and ms > BUCKETS_MS[i]:
+                i += 1
+            counts[i] += 1
+        return counts
+
+    def slowest_phase(self) -> tuple[str, str, float] | None:
+        """
+        (scope, phase, mean ms) with the highest mean over the window.
+        """
+        best = None
+        for (scope, name), samples in self.samples.items():
+            if samples:
+                mean = sum(samples) / len(samples)
+                if best is None or mean > best[2]:
+                    best = (scope, name, mean)
+        return best
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        out: dict[str, dict[str, float]] = {}
+        rows = [("frame", self.frames)] + [(f"{s}.{n}", d) for (s, n), d in sorted(self.samples.items())]
+        for key, samples in rows:
+            if samples:
+                out[key] = {
+                    "count": len(samples),
+                    "mean_ms": sum(samples) / len(samples),
+                    "p50_ms": percentile(samples, 0.50),
+                    "p99_ms": percentile(samples, 0.99),
+                    "max_ms": max(samples),
+                }
+        return out
+
+    def dump_trace(self, path: str) -> int:
+        """
+        Write the recorded events as Chrome trace JSON; returns the count.
+        """
+        events = list(self.trace or ())
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return len(events)
+
+    # ---------------- overlay ----------------
+
+    def toggle_overlay(self) -> None:
+        self.overlay_visible = not self.overlay_visible
+        self._lines_at = 0.0
+
+    def draw_overlay(self, surface: pygame.Surface) -> pygame.Rect | None:
+        if not self.overlay_visible:
+            return None
+        now = time.perf_counter()
+        if now - self._lines_at >= self.refresh:
+            self._lines_at = now
+            self._lines = [self._render(t) for t in self._overlay_text()]
+
+        width = max(s.get_width() for s in self._lines) + 16
+        height = sum(s.get_height() for s in self._lines) + 12
+        rect = pygame.Rect(surface.get_width() - width - 8, 8, width, height)
+        draw_panel(surface, rect, (0, 0, 0), alpha=180, radius=6)
+        y = rect.y + 6
+        for line in self._lines:
+            surface.blit(line, (rect.x + 8, y))
+            y += line.get_height()
+        return rect
+
+    def _overlay_text(self) -> list[str]:
+        lines = [f"FPS {self.fps():5.1f}   frame p99 {percentile(self.frames, 0.99):5.2f} ms"]
+        slowest = self.slowest_phase()
+        if slowest is not None:
+            scope, name, mean = slowest
+            p99 = percentile(self.samples[(scope, name)], 0.99)
+            lines.append(f"slowest {scope}.{name} {mean:.2f} ms (p99 {p99:.2f})")
+        return lines
+
+    @staticmethod
+    def _render(text: str) -> pygame.Surface:
+        # Numbers change every refresh: render directly instead of filling
+        # the shared text cache with one-off strings
+        return get_font(None, 20).render(text, True, (235, 235, 245))
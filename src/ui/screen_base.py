@@ -7,3 +7,41 @@ class Screen(Protocol):
     def handle_event(self, event: pygame.event.Event) -> None: ...
     def update(self, dt: float) -> None: ...
     def draw(self, surface: pygame.Surface) -> None: ...
+
+
+class DirtyRects:
+    """
+    Opt-in dirty-rectangle mode for mostly static screens.
+
+    A screen mixing this in calls invalidate(rect) whenever something it
+    draws changes (invalidate() with no rect means the whole screen).
+    ScreenManager.present then skips draw() entirely while nothing is dirty
+    and pushes only the changed regions with pygame.display.update(rects).
+    Screens without this mixin keep the full draw + flip every frame.
+    """
+
+    _dirty: list[pygame.Rect]
+    _dirty_full: bool
+
+    def invalidate(self, rect: pygame.Rect | None = None) -> None:
+        if rect is None:
+            self._dirty_full = True
+        else:
+            self.__dict__.setdefault("_dirty", []).append(pygame.Rect(rect))
+
+    def is_idle(self) -> bool:
+        """
+        Nothing is waiting to be drawn, so the loop may sleep until input
+        (see ui.frame_scheduler.FrameScheduler).
+        """
+        return not self.__dict__.get("_dirty_full") and not self.__dict__.get("_dirty")
+
+    def dirty_rects(self, bounds: pygame.Rect) -> list[pygame.Rect]:
+        """
+        Regions to present this frame (clipped to bounds); clears the list.
+        """
+        full = self.__dict__.pop("_dirty_full", False)
+        rects = self.__dict__.pop("_dirty", [])
+        if full:
+            return [pygame.Rect(bounds)]
+        return [r.clip(bounds) for r in rects if r.colliderect(bounds)]
@@ -1,31 +1,331 @@
 # FILE: src/ui/screen_manager.py
 
 from __future__ import annotations
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import nullcontext
+from typing import Any, Callable, Hashable
 import pygame
 from ui.screen_base import Screen
+from ui.frame_scheduler import FrameScheduler
+from ui.timestep import FixedTimestep
+from ui.transition import Transition, TransitionScreen, run_in_background
+from ui.profiler import FrameProfiler
+from integrations.rate_limiter import PRIORITY_INTERACTIVE, PRIORITY_PREFETCH, PriorityScope, priority
+
+
+def _key_part(value: Any) -> Hashable:
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        # Unhashable args (AppState, dicts) are keyed by identity
+        return ("id", id(value))
 
 
 class ScreenManager:
     """
-    Minimal screen router.
+    Stack-based screen router.
 
     Your app loop should call:
     - sm.handle_event(event)
     - sm.update(dt)
-    - sm.draw(surface)
+    - sm.present(surface)   (or sm.draw(surface) + pygame.display.flip())
+
+    or just sm.run(surface), which does all of the above with a fixed
+    timestep: update() always receives timestep.step seconds, and
+    sm.alpha tells draw() how far the frame is between the last two steps
+    (1.0 outside run(), i.e. draw the latest state).
+
+    The top of the stack is current. set() replaces it, push() covers it
+    and pop()/pop_to() go back to a screen that was kept alive underneath.
+    A screen becoming current gets on_enter() called if it defines one.
+
+    cached(factory, *args, **kwargs) returns a constructed screen from a
+    bounded LRU keyed by (factory, args), so revisiting costs nothing;
+    such screens should reset per-visit state in on_enter(). preload()
+    with the same arguments prepares one ahead of time: the factory's
+    prefetch(*args, **kwargs) (slow, display-free work such as LLM content)
+    runs on a background thread at PRIORITY_PREFETCH and returns extra
+    constructor kwargs; the screen itself is then built on the main thread
+    during update(). push_cached() enters such a screen without blocking:
+    while its prefetch is still running a TransitionScreen is shown instead,
+    and the prefetch is promoted to PRIORITY_INTERACTIVE.
+
+    With a profiler (run() creates one if needed) handle_event, update,
+    draw and the flip are timed per screen; F3 toggles its overlay.
     """
 
-    def __init__(self, start_screen: Screen):
-        self.current: Screen = start_screen
+    def __init__(self, start_screen: Screen | None, max_cached: int = 8, profiler: FrameProfiler | None = None):
+        self.stack: list[Screen] = [start_screen] if start_screen is not None else []
+        self.running = False
+        self._presented: Screen | None = None
+        self.scheduler: FrameScheduler | None = None
+        self.timestep = FixedTimestep()
+        self.alpha = 1.0
+        self.max_cached = max_cached
+        self._cache: OrderedDict[tuple, Screen] = OrderedDict()
+        self._preloading: dict[tuple, tuple[Callable[..., Screen], tuple, dict, Future | None, PriorityScope]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.preloaded = 0
+        self.profiler = profiler
+
+    @property
+    def current(self) -> Screen | None:
+        return self.stack[-1] if self.stack else None
+
+    def _entered(self) -> None:
+        on_enter = getattr(self.current, "on_enter", None)
+        if on_enter is not None:
+            on_enter()
 
     def set(self, screen: Screen) -> None:
-        self.current = screen
+        if self.stack:
+            self.stack[-1] = screen
+        else:
+            self.stack.append(screen)
+        self._entered()
+
+    def push(self, screen: Screen) -> None:
+        self.stack.append(screen)
+        self._entered()
+
+    def pop(self) -> Screen | None:
+        """
+        Drop the current screen and return to the one below (the last
+        screen is never popped). Returns the new current screen.
+        """
+        if len(self.stack) > 1:
+            self.stack.pop()
+            self._entered()
+        return self.current
+
+    def pop_to(self, screen: Screen) -> None:
+        """
+        Return to screen: pop down to it if it is on the stack, otherwise
+        replace the current screen with it.
+        """
+        if screen in self.stack[:-1]:
+            del self.stack[self.stack.index(screen) + 1:]
+            self._entered()
+        elif screen is not self.current:
+            self.set(screen)
+
+    # ---------------- screen cache ----------------
+
+    @staticmethod
+    def _key(factory: Callable[..., Screen], args: tuple, kwargs: dict) -> tuple:
+        return (factory, tuple(_key_part(a) for a in args),
+                tuple(sorted((k, _key_part(v)) for k, v in kwargs.items())))
+
+    def cached(self, factory: Callable[..., Screen], *args: Any, **kwargs: Any) -> Screen:
+        """
+        Screen for factory(*args, **kwargs), built at most once while it
+        stays in the cache. Waits for a pending preload of the same key
+        (use push_cached() from the game loop to avoid that).
+        """
+        key = self._key(factory, args, kwargs)
+        screen = self._cache.get(key)
+        if screen is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return screen
+
+        self.misses += 1
+        pending = self._preloading.pop(key, None)
+        if pending is not None:
+            pending[4].promote(PRIORITY_INTERACTIVE)
+            screen = self._build(*pending[:4])
+        else:
+            screen = factory(*args, **kwargs)
+        self._store(key, screen)
+        return screen
+
+    def push_cached(self, factory: Callable[..., Screen], *args: Any, title: str = "Loading...",
+                    **kwargs: Any) -> None:
+        """
+        push(cached(factory, *args, **kwargs)) without blocking the main
+        thread: if the screen is not ready and its factory has a prefetch
+        still to run (or running as a preload), push a TransitionScreen
+        that waits for it in the background and then replaces itself with
+        the built screen.
+        """
+        key = self._key(factory, args, kwargs)
+        pending = self._preloading.get(key)
+        prefetch = getattr(factory, "prefetch", None)
+        ready = pending is not None and (pending[3] is None or pending[3].done())
+        if key in self._cache or ready or prefetch is None:
+            self.push(self.cached(factory, *args, **kwargs))
+            return
+
+        self.misses += 1
+        self._preloading.pop(key, None)
+        fut = pending[3] if pending is not None else None
+        if pending is not None:
+            # The player is waiting on it now: overtake the other preloads
+            pending[4].promote(PRIORITY_INTERACTIVE)
+
+        def wait() -> dict:
+            if fut is not None:
+                try:
+                    return fut.result() or {}
+                except Exception:
+                    pass  # retry below, still off the main thread
+            with priority(PRIORITY_INTERACTIVE):
+                return prefetch(*args, **kwargs) or {}
+
+        def build(extra: dict) -> Screen:
+            screen = factory(*args, **kwargs, **extra)
+            self._store(key, screen)
+            return screen
+
+        self.push(TransitionScreen(self, Transition(
+            title, wait, build, on_error=lambda exc: build({}))))
+
+    def preload(self, factory: Callable[..., Screen], *args: Any, **kwargs: Any) -> None:
+        key = self._key(factory, args, kwargs)
+        if key in self._cache or key in self._preloading:
+            return
+        prefetch = getattr(factory, "prefetch", None)
+        scope = PriorityScope(PRIORITY_PREFETCH)
+
+        def task() -> dict:
+            with priority(scope):
+                return prefetch(*args, **kwargs)
+
+        fut = run_in_background(task) if prefetch is not None else None
+        self._preloading[key] = (factory, args, kwargs, fut, scope)
+
+    def _build(self, factory: Callable[..., Screen], args: tuple, kwargs: dict, fut: Future | None) -> Screen:
+        extra = {}
+        if fut is not None:
+            try:
+                extra = fut.result() or {}
+            except Exception:
+                extra = {}  # constructor does the work itself
+        return factory(*args, **kwargs, **extra)
+
+    def _store(self, key: tuple, screen: Screen) -> None:
+        self._cache[key] = screen
+        for old in list(self._cache):
+            if len(self._cache) <= self.max_cached:
+                break
+            if self._cache[old] not in self.stack:
+                del self._cache[old]
+
+    def _finish_preloads(self) -> None:
+        for key, pending in list(self._preloading.items()):
+            fut = pending[3]
+            if fut is None or fut.done():
+                del self._preloading[key]
+                self._store(key, self._build(*pending[:4]))
+                self.preloaded += 1
+                return  # at most one construction per update
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+        self._preloading.clear()
+
+    def stats(self) -> dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "stack": len(self.stack),
+            "cached": len(self._cache),
+            "preloading": len(self._preloading),
+            "preloaded": self.preloaded,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def _timed(self, phase: str):
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.phase(type(self.current).__name__, phase)
 
     def handle_event(self, event: pygame.event.Event) -> None:
-        self.current.handle_event(event)
+        if self.profiler is not None and event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.profiler.toggle_overlay()
+            # Full frame next present(), so a hidden overlay is drawn over
+            # even on a screen that reports no dirty regions
+            self._presented = None
+            return
+        with self._timed("handle_event"):
+            self.current.handle_event(event)
 
     def update(self, dt: float) -> None:
-        self.current.update(dt)
+        if self._preloading:
+            self._finish_preloads()
+        with self._timed("update"):
+            self.current.update(dt)
 
     def draw(self, surface: pygame.Surface) -> None:
-        self.current.draw(surface)
+        with self._timed("draw"):
+            self.current.draw(surface)
+        if self.profiler is not None:
+            self.profiler.draw_overlay(surface)
+
+    def present(self, surface: pygame.Surface) -> None:
+        """
+        Draw the current screen and push it to the display.
+
+        Screens with dirty_rects() (see ui.screen_base.DirtyRects) get one
+        full draw + flip when they become current; after that they are only
+        redrawn when they report changed regions, and only those regions
+        are updated on the display. The profiler overlay forces full frames
+        while it is shown, and once more after it is hidden.
+        """
+        screen = self.current
+        dirty_rects = getattr(screen, "dirty_rects", None)
+        bounds = surface.get_rect()
+        overlay = self.profiler is not None and self.profiler.overlay_visible
+
+        if dirty_rects is None or screen is not self._presented or overlay:
+            self.draw(surface)
+            with self._timed("flip"):
+                pygame.display.flip()
+            self._presented = screen
+            if dirty_rects is not None:
+                dirty_rects(bounds)  # already fully drawn
+            return
+
+        rects = dirty_rects(bounds)
+        if not rects:
+            return
+        self.draw(surface)
+        with self._timed("flip"):
+            pygame.display.update(rects)
+
+    def is_idle(self) -> bool:
+        if self.current is not self._presented:
+            return False
+        if self.profiler is not None and self.profiler.overlay_visible:
+            return False
+        is_idle = getattr(self.current, "is_idle", None)
+        return bool(is_idle and is_idle())
+
+    def run(self, surface: pygame.Surface, fps: int = 60) -> None:
+        """
+        Main loop for the screen flow. Returns on pygame.QUIT.
+        Screens reporting is_idle() let the loop sleep until input.
+        """
+        self.scheduler = FrameScheduler(fps)
+        if self.profiler is None:
+            self.profiler = FrameProfiler()
+        self.running = True
+        while self.running:
+            dt, events = self.scheduler.next_frame(self.is_idle())
+            self.profiler.begin_frame()
+            for event in events:
+                if event.type == pygame.QUIT:
+                    self.running = False
+                    break
+                self.handle_event(event)
+            if not self.running:
+                break
+            for _ in range(self.timestep.advance(dt)):
+                self.update(self.timestep.step)
+            self.alpha = self.timestep.alpha
+            self.present(surface)
+            self.profiler.end_frame()
@@ -1,13 +1,17 @@
 from __future__ import annotations
 import pygame
 from ui.screen_manager import ScreenManager
+from ui.screen_base import DirtyRects
 from app.state import AppState
 from core.content_engine import ContentEngine
+from core.content_store import ContentStore
 from core.persistence import save_run
 from app.config import AppConfig
+from ui.fonts import get_font
+from ui.text_cache import render_text
 
 
-class DragonSceneScreen:
+class DragonSceneScreen(DirtyRects):
     def __init__(self, sm: ScreenManager, state: AppState, width: int, height: int, engine: ContentEngine, option_name: str, gate_payload: dict):
         self.sm = sm
         self.state = state
@@ -16,8 +20,8 @@ class DragonSceneScreen:
         self.engine = engine
         self.option_name = option_name
 
-        self.font = pygame.font.Font(None, 26)
-        self.font_small = pygame.font.Font(None, 22)
+        self.font = get_font(None, 26)
+        self.font_small = get_font(None, 22)
 
         # Extract dragon quests
         dragon = gate_payload["dragon"]
@@ -32,15 +36,18 @@ class DragonSceneScreen:
             "Resources: " + ", ".join(self.state.data.dragon_resources[:4]),
             "Press Enter to finish."
         ]
+        self.box = pygame.Rect(30, 30, self.w - 60, 170)
         self.i = 0
         self.saved_path: str | None = None
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN and event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
             self.i += 1
+            self.invalidate(self.box)
             if self.i >= len(self.lines):
                 cfg = AppConfig()
-                self.saved_path = save_run(self.state, cfg.save_dir)
+                self.saved_path = save_run(
+                    self.state, cfg.save_dir, ContentStore(cfg.content_store_dir))
                 from ui.screens.end_screen import EndScreen
                 self.sm.set(EndScreen(self.sm, self.state,
                             self.w, self.h, self.saved_path))
@@ -54,13 +61,13 @@ class DragonSceneScreen:
         pygame.draw.rect(surface, (230, 220, 235),
                          pygame.Rect(0, 0, self.w, self.h), 0)
 
-        box = pygame.Rect(30, 30, self.w - 60, 170)
+        box = self.box
         pygame.draw.rect(surface, (255, 255, 255), box, border_radius=12)
         pygame.draw.rect(surface, (190, 190, 200), box, 2, border_radius=12)
 
         idx = min(self.i, len(self.lines)-1)
         line = self.lines[idx]
-        surface.blit(self.font.render(
+        surface.blit(render_text(self.font,
             line[:70], True, (30, 30, 40)), (box.x + 12, box.y + 18))
-        surface.blit(self.font_small.render("Press Enter", True,
+        surface.blit(render_text(self.font_small, "Press Enter", True,
                      (120, 120, 130)), (box.right - 140, box.bottom - 26))
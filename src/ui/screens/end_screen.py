@@ -1,18 +1,21 @@
 from __future__ import annotations
 import pygame
 from ui.screen_manager import ScreenManager
+from ui.screen_base import DirtyRects
 from app.state import AppState
+from ui.fonts import get_font
+from ui.text_cache import render_text
 
 
-class EndScreen:
+class EndScreen(DirtyRects):
     def __init__(self, sm: ScreenManager, state: AppState, width: int, height: int, saved_path: str | None):
         self.sm = sm
         self.state = state
         self.w = width
         self.h = height
         self.saved_path = saved_path
-        self.font = pygame.font.Font(None, 36)
-        self.font_small = pygame.font.Font(None, 22)
+        self.font = get_font(None, 36)
+        self.font_small = get_font(None, 22)
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
@@ -23,12 +26,12 @@ class EndScreen:
 
     def draw(self, surface: pygame.Surface) -> None:
         surface.fill((245, 245, 250))
-        surface.blit(self.font.render(
+        surface.blit(render_text(self.font,
             "Run Complete", True, (30, 30, 40)), (30, 60))
         if self.saved_path:
-            surface.blit(self.font_small.render(
+            surface.blit(render_text(self.font_small,
                 "Saved to:", True, (80, 80, 95)), (30, 120))
-            surface.blit(self.font_small.render(
+            surface.blit(render_text(self.font_small,
                 self.saved_path, True, (80, 80, 95)), (30, 150))
-        surface.blit(self.font_small.render(
+        surface.blit(render_text(self.font_small,
             "Press Esc to quit.", True, (120, 120, 130)), (30, 220))
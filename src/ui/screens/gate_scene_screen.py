@@ -9,14 +9,19 @@ from typing import Optional, Tuple, Any
 import pygame
 
 from ui.screen_manager import ScreenManager
+from ui.screen_base import DirtyRects
 from app.state import AppState
 from app.config import AppConfig
 
 from core.content_engine import ContentEngine
+from core.content_store import ContentStore
 from integrations.llm_client import LLMClient
+from ui.fonts import get_font
+from ui.text_cache import render_text
+from ui.asset_manager import asset_manager
 
 
-class GateSceneScreen:
+class GateSceneScreen(DirtyRects):
     """
     Gate scene (non top-down).
     - Shows wise man dialog with course/career info from ContentEngine.gen_gate_scene
@@ -33,6 +38,8 @@ class GateSceneScreen:
         height: int,
         back_screen,
         option_name: str,
+        engine: Optional[ContentEngine] = None,
+        payload: Optional[dict[str, Any]] = None,
     ):
         self.sm = sm
         self.state = state
@@ -42,17 +49,17 @@ class GateSceneScreen:
         self.option_name = option_name
 
         self.cfg = AppConfig()
-        self.engine = self._build_content_engine()
+        self.engine = engine or self._build_content_engine()
 
-        self.font_title = pygame.font.Font(None, 40)
-        self.font = pygame.font.Font(None, 26)
-        self.font_small = pygame.font.Font(None, 22)
+        self.font_title = get_font(None, 40)
+        self.font = get_font(None, 26)
+        self.font_small = get_font(None, 22)
 
         base_assets = os.path.join(os.path.dirname(__file__), "..", "assets")
         self.assets_dir = os.path.abspath(base_assets)
 
         self.bg_img = self._safe_load_image(
-            "gate_background.png", scale=(self.w, self.h)
+            "gate_background.png", scale=(self.w, self.h), alpha=False
         )  # Put gate_background.png here
 
         self.wise_man_img = self._safe_load_image(
@@ -62,34 +69,20 @@ class GateSceneScreen:
             "dragon_warrior.png", scale=(90, 90)
         )  # Put dragon_warrior.png here
 
-        self.toast: Optional[str] = None
-        self.toast_until = 0.0
-
-        edu = getattr(self.state.profile,
-                      "education_status", "Secondary School")
-        poly_choice = getattr(self.state.profile, "poly_path_choice", None)
-        self.work_path = bool(edu == "Poly" and poly_choice == "Work")
+        self.work_path = self._is_work_path(state)
 
         # IMPORTANT: match ContentEngine.gen_gate_scene(option_name, work_path)
-        self.payload = self.engine.gen_gate_scene(
-            option_name=self.option_name,
-            work_path=self.work_path,
-        )
-
-        if not hasattr(self.state, "gate_choices") or not isinstance(getattr(self.state, "gate_choices"), dict):
-            setattr(self.state, "gate_choices", {})
-        self.state.gate_choices[self.option_name] = {"choice": None}
-
-        self.phase = "info"  # info -> ask -> dragon -> done
+        if payload is None:
+            payload = self.engine.gen_gate_scene(
+                option_name=self.option_name,
+                work_path=self.work_path,
+            )
+        self.payload = payload
         self.lines: list[str] = self._build_info_lines(
             self.payload, self.option_name)
-        self.line_idx = 0
 
-        self.dragon_lines: list[str] = []
-
-        self.player_x = 80
         self.player_y = self.h - 140
-        self.player_speed = 3
+        self.player_speed = 180  # px/s (was 3 px per frame at 60 FPS)
 
         self.wise_x = self.w - 220
         self.wise_y = self.h - 170
@@ -98,7 +91,51 @@ class GateSceneScreen:
         self.dragon_y = self.h - 170
 
         self.right_wall_x = self.w - 120
+        # Only reset the view here: the gate is recorded in the run data by
+        # on_enter(), i.e. when the player actually enters it (preloaded
+        # gates are built while the training map is still showing)
+        self._reset_visit()
+
+    @staticmethod
+    def prefetch(sm, state: AppState, width: int, height: int, back_screen, option_name: str,
+                 engine: Optional[ContentEngine] = None, payload: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        """
+        Display-free part of construction for ScreenManager.preload: fetch
+        the gate content on a background thread. The caller sets the
+        priority (ScreenManager runs preloads at PRIORITY_PREFETCH and
+        promotes the gate the player enters).
+        """
+        if payload is not None or engine is None:
+            return {}
+        work_path = GateSceneScreen._is_work_path(state)
+        return {"payload": engine.gen_gate_scene(option_name=option_name, work_path=work_path)}
+
+    def on_enter(self) -> None:
+        """
+        Reset per-visit state (the instance is cached by ScreenManager and
+        reused when the same gate is entered again).
+        """
+        self.state.data.gate_payloads[self.option_name] = self.payload
+        self.state.data.gate_choices[self.option_name] = {"choice": None}
+        self._reset_visit()
+
+    def _reset_visit(self) -> None:
+        self.phase = "info"  # info -> ask -> dragon -> done
+        self.line_idx = 0
+        self.dragon_lines: list[str] = []
+
+        self.toast: Optional[str] = None
+        self.toast_until = 0.0
+
+        self.player_x = 80.0
         self.can_go_right = False
+        self.invalidate()
+
+    @staticmethod
+    def _is_work_path(state: AppState) -> bool:
+        edu = state.profile.education_status
+        poly_choice = state.profile.poly_path_choice
+        return bool(edu == "Poly" and poly_choice == "Work")
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.QUIT:
@@ -106,6 +143,7 @@ class GateSceneScreen:
             raise SystemExit
 
         if event.type == pygame.KEYDOWN:
+            self.invalidate()
             if event.key == pygame.K_ESCAPE:
                 self._return_to_map()
                 return
@@ -128,10 +166,11 @@ class GateSceneScreen:
 
         dx = 0
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            dx -= self.player_speed
+            dx -= self.player_speed * dt
         elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            dx += self.player_speed
+            dx += self.player_speed * dt
 
+        old_x = self.player_x
         self.player_x += dx
 
         if self.player_x < 20:
@@ -142,13 +181,23 @@ class GateSceneScreen:
         if self.can_go_right and self.player_x > self.w - 60:
             self.player_x = self.w - 60
 
+        if self.player_x != old_x:
+            self.invalidate(self._player_rect(old_x).union(self._player_rect(self.player_x)))
+        if self.toast and time.time() >= self.toast_until:
+            self.toast = None
+            self.invalidate()
+
+    def _player_rect(self, x: float) -> pygame.Rect:
+        # Drawn at the latest step (no interpolation) so dirty rects stay exact
+        return pygame.Rect(round(x), self.player_y, 36, 44)
+
     def draw(self, surface: pygame.Surface) -> None:
         if self.bg_img:
             surface.blit(self.bg_img, (0, 0))
         else:
             surface.fill((245, 245, 250))
 
-        title = self.font_title.render(self.option_name, True, (25, 25, 35))
+        title = render_text(self.font_title, self.option_name, True, (25, 25, 35))
         surface.blit(title, (self.w // 2 - title.get_width() // 2, 26))
 
         if self.wise_man_img:
@@ -168,8 +217,8 @@ class GateSceneScreen:
             pygame.draw.rect(surface, (80, 80, 90), pygame.Rect(
                 self.right_wall_x, 0, 8, self.h))
 
-        pygame.draw.rect(surface, (0, 132, 255), pygame.Rect(
-            self.player_x, self.player_y, 36, 44), border_radius=8)
+        pygame.draw.rect(surface, (0, 132, 255),
+                         self._player_rect(self.player_x), border_radius=8)
 
         self._draw_dialog(surface)
 
@@ -198,7 +247,7 @@ class GateSceneScreen:
             return
 
     def _choose_no(self) -> None:
-        self.state.gate_choices[self.option_name]["choice"] = "No"
+        self.state.data.gate_choices[self.option_name]["choice"] = "No"
         self._toast("No worries. Try another gate.", seconds=2.0)
 
         if hasattr(self.back_screen, "gates_zone_active"):
@@ -207,7 +256,7 @@ class GateSceneScreen:
         self._return_to_map()
 
     def _choose_yes(self) -> None:
-        self.state.gate_choices[self.option_name]["choice"] = "Yes"
+        self.state.data.gate_choices[self.option_name]["choice"] = "Yes"
         self.can_go_right = True
 
         dragon = self.payload.get("dragon", {}) if isinstance(
@@ -233,11 +282,11 @@ class GateSceneScreen:
             self.dragon_lines.append("Resources:")
             self.dragon_lines.extend(res_lines)
 
-        if "quests" not in self.state.gate_choices[self.option_name]:
-            self.state.gate_choices[self.option_name]["quests"] = {}
-        self.state.gate_choices[self.option_name]["quests"]["micro_quest_1_week"] = micro
-        self.state.gate_choices[self.option_name]["quests"]["mini_project_1_month"] = mini
-        self.state.gate_choices[self.option_name]["quests"]["resources"] = res_lines
+        if "quests" not in self.state.data.gate_choices[self.option_name]:
+            self.state.data.gate_choices[self.option_name]["quests"] = {}
+        self.state.data.gate_choices[self.option_name]["quests"]["micro_quest_1_week"] = micro
+        self.state.data.gate_choices[self.option_name]["quests"]["mini_project_1_month"] = mini
+        self.state.data.gate_choices[self.option_name]["quests"]["resources"] = res_lines
 
         self.phase = "dragon"
         self.line_idx = 0
@@ -264,17 +313,17 @@ class GateSceneScreen:
             line = "Return to the gates. Press Enter or ESC."
             hint = "Enter or ESC"
 
-        head = self.font_small.render(speaker, True, (255, 255, 255))
+        head = render_text(self.font_small, speaker, True, (255, 255, 255))
         surface.blit(head, (box.x + 14, box.y + 10))
 
         wrapped = self._wrap(line, 62)
         y = box.y + 36
         for w in wrapped[:3]:
-            txt = self.font.render(w, True, (235, 235, 245))
+            txt = render_text(self.font, w, True, (235, 235, 245))
             surface.blit(txt, (box.x + 14, y))
             y += 28
 
-        hint_s = self.font_small.render(hint, True, (180, 180, 200))
+        hint_s = render_text(self.font_small, hint, True, (180, 180, 200))
         surface.blit(
             hint_s, (box.right - hint_s.get_width() - 14, box.bottom - 26))
 
@@ -300,13 +349,9 @@ class GateSceneScreen:
         return lines
 
     def _build_content_engine(self) -> ContentEngine:
-        llm = LLMClient(
-            self.cfg.azure_endpoint,
-            self.cfg.azure_api_key,
-            self.cfg.azure_api_version,
-            self.cfg.azure_deployment,
-        )
-        return ContentEngine(llm)
+        llm = LLMClient.from_config(self.cfg)
+        store = ContentStore(self.cfg.content_store_dir) if self.cfg.content_cache else None
+        return ContentEngine(llm, store=store)
 
     def _toast(self, text: str, seconds: float = 2.0) -> None:
         self.toast = text
@@ -314,7 +359,7 @@ class GateSceneScreen:
 
     def _draw_toast(self, surface: pygame.Surface, text: str) -> None:
         padding = 10
-        surf = self.font_small.render(text, True, (255, 255, 255))
+        surf = render_text(self.font_small, text, True, (255, 255, 255))
         w = surf.get_width() + padding * 2
         h = surf.get_height() + padding * 2
         x = (self.w - w) // 2
@@ -341,17 +386,9 @@ class GateSceneScreen:
             lines.append(" ".join(line))
         return lines
 
-    def _safe_load_image(self, filename: str, scale: Optional[Tuple[int, int]] = None) -> Optional[pygame.Surface]:
-        try:
-            path = os.path.join(self.assets_dir, filename)
-            if not os.path.exists(path):
-                return None
-            img = pygame.image.load(path).convert_alpha()
-            if scale:
-                img = pygame.transform.scale(img, scale)
-            return img
-        except Exception:
-            return None
+    def _safe_load_image(self, filename: str, scale: Optional[Tuple[int, int]] = None, alpha: bool = True) -> Optional[pygame.Surface]:
+        # Shared, display-converted surface (None if the file is missing)
+        return asset_manager().image(os.path.join(self.assets_dir, filename), scale, alpha)
 
     def _return_to_map(self) -> None:
         if hasattr(self.back_screen, "gates_zone_active"):
@@ -361,4 +398,4 @@ class GateSceneScreen:
                 self.back_screen.on_gate_exit()
             except Exception:
                 pass
-        self.sm.set(self.back_screen)
+        self.sm.pop_to(self.back_screen)
@@ -4,6 +4,9 @@ import math
 from ui.screen_manager import ScreenManager
 from app.state import AppState
 from core.content_engine import ContentEngine
+from ui.fonts import get_font
+from ui.text_cache import render_text
+from ui.timestep import lerp
 
 
 class GatesScreen:
@@ -14,10 +17,12 @@ class GatesScreen:
         self.h = height
         self.engine = engine
 
-        self.font = pygame.font.Font(None, 26)
-        self.font_small = pygame.font.Font(None, 22)
+        self.font = get_font(None, 26)
+        self.font_small = get_font(None, 22)
 
         self.player = pygame.Rect(80, 360, 32, 32)
+        self.pos = pygame.Vector2(self.player.topleft)
+        self.prev_pos = pygame.Vector2(self.pos)
         self.gates: list[pygame.Rect] = [
             pygame.Rect(260, 260, 90, 120),
             pygame.Rect(420, 260, 90, 120),
@@ -29,22 +34,30 @@ class GatesScreen:
     def handle_event(self, event: pygame.event.Event) -> None:
         pass
 
+    def on_gate_exit(self) -> None:
+        # Back at the start so the gate is not re-entered straight away
+        self.pos.update(80, 360)
+        self.prev_pos.update(self.pos)
+        self.player.topleft = (80, 360)
+
     def update(self, dt: float) -> None:
         keys = pygame.key.get_pressed()
         speed = 240 * dt
-        self.player.x += int((keys[pygame.K_RIGHT] -
-                             keys[pygame.K_LEFT]) * speed)
-        self.player.y += int((keys[pygame.K_DOWN] - keys[pygame.K_UP]) * speed)
-        self.player.x = max(0, min(self.w - self.player.width, self.player.x))
-        self.player.y = max(0, min(self.h - self.player.height, self.player.y))
+        self.prev_pos.update(self.pos)
+        self.pos.x += (keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]) * speed
+        self.pos.y += (keys[pygame.K_DOWN] - keys[pygame.K_UP]) * speed
+        self.pos.x = max(0, min(self.w - self.player.width, self.pos.x))
+        self.pos.y = max(0, min(self.h - self.player.height, self.pos.y))
+        self.player.topleft = (round(self.pos.x), round(self.pos.y))
 
         for i, g in enumerate(self.gates):
             if self.player.colliderect(g):
                 option = self.state.data.suggested_options[i]
                 self.state.data.chosen_gate = option
                 from ui.screens.gate_scene_screen import GateSceneScreen
-                self.sm.set(GateSceneScreen(self.sm, self.state,
-                            self.w, self.h, self.engine, option))
+                self.sm.push_cached(
+                    GateSceneScreen, self.sm, self.state, self.w, self.h,
+                    back_screen=self, option_name=option, engine=self.engine)
                 return
 
         if self.banner_timer > 0:
@@ -55,9 +68,9 @@ class GatesScreen:
     def draw(self, surface: pygame.Surface) -> None:
         surface.fill((230, 238, 245))
 
-        surface.blit(self.font.render(
+        surface.blit(render_text(self.font,
             "Three Gates", True, (30, 30, 40)), (30, 30))
-        surface.blit(self.font_small.render(
+        surface.blit(render_text(self.font_small,
             "Top-down view. Use arrow keys.", True, (80, 80, 95)), (30, 62))
 
         labels = self.state.data.suggested_options or [
@@ -65,14 +78,17 @@ class GatesScreen:
         for i, g in enumerate(self.gates):
             pygame.draw.rect(surface, (150, 150, 160), g, border_radius=10)
             pygame.draw.rect(surface, (90, 90, 100), g, 2, border_radius=10)
-            txt = self.font_small.render(labels[i], True, (20, 20, 30))
+            txt = render_text(self.font_small, labels[i], True, (20, 20, 30))
             surface.blit(txt, (g.centerx - txt.get_width()//2, g.y - 24))
 
-        pygame.draw.rect(surface, (40, 90, 200), self.player, border_radius=8)
+        a = self.sm.alpha
+        drawn = self.player.move(round(lerp(self.prev_pos.x, self.pos.x, a)) - self.player.x,
+                                 round(lerp(self.prev_pos.y, self.pos.y, a)) - self.player.y)
+        pygame.draw.rect(surface, (40, 90, 200), drawn, border_radius=8)
 
         if self.banner:
             b = pygame.Rect(30, self.h - 70, self.w - 60, 42)
             pygame.draw.rect(surface, (255, 255, 255), b, border_radius=10)
             pygame.draw.rect(surface, (190, 190, 200), b, 2, border_radius=10)
-            surface.blit(self.font.render(self.banner, True,
+            surface.blit(render_text(self.font, self.banner, True,
                          (30, 30, 40)), (b.x + 12, b.y + 10))
@@ -8,13 +8,16 @@ import pygame
 from ui.widgets import Button
 from ui.screens.question_modal import QuestionModal
 from ui.screen_manager import ScreenManager
+from ui.screen_base import DirtyRects
 from app.state import AppState
+from ui.fonts import get_font
+from ui.text_cache import render_text
 
 
-class HouseQuestionsScreen:
+class HouseQuestionsScreen(DirtyRects):
     """
     Minimal Part 1 runner.
-    - Reads state.part1_payload
+    - Reads state.data.part1_payload
     - Shows questions one by one
     - Collects answers (simple text for now)
     - Calls back to TrainingMapScreen.on_part1_completed(...)
@@ -27,11 +30,11 @@ class HouseQuestionsScreen:
         self.h = height
         self.back_screen = back_screen
 
-        self.font_title = pygame.font.Font(None, 40)
-        self.font = pygame.font.Font(None, 26)
-        self.font_small = pygame.font.Font(None, 22)
+        self.font_title = get_font(None, 40)
+        self.font = get_font(None, 26)
+        self.font_small = get_font(None, 22)
 
-        payload = getattr(self.state, "part1_payload", {"questions": []})
+        payload = self.state.data.part1_payload or {"questions": []}
         self.questions = payload.get(
             "questions", []) if isinstance(payload, dict) else []
         self.idx = 0
@@ -39,9 +42,9 @@ class HouseQuestionsScreen:
         self.modal = QuestionModal(self.w, self.h)
 
         self.btn_next = Button(pygame.Rect(
-            self.w - 200, self.h - 90, 160, 50), "Next", pygame.font.Font(None, 32))
+            self.w - 200, self.h - 90, 160, 50), "Next", get_font(None, 32))
         self.btn_back = Button(pygame.Rect(
-            40, self.h - 90, 160, 50), "Back", pygame.font.Font(None, 32))
+            40, self.h - 90, 160, 50), "Back", get_font(None, 32))
 
         self.answers: list[dict[str, Any]] = []
 
@@ -53,8 +56,13 @@ class HouseQuestionsScreen:
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.MOUSEMOTION:
-            self.btn_next.handle_mouse(event.pos)
-            self.btn_back.handle_mouse(event.pos)
+            for btn in (self.btn_next, self.btn_back):
+                was = btn.hover
+                btn.handle_mouse(event.pos)
+                if btn.hover != was:
+                    self.invalidate(btn.rect)
+        elif event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+            self.invalidate()
 
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.btn_back.clicked(event.pos):
@@ -72,18 +80,20 @@ class HouseQuestionsScreen:
             return
 
     def update(self, dt: float) -> None:
-        pass
+        if self.toast and time.time() >= self.toast_until:
+            self.toast = None
+            self.invalidate()
 
     def draw(self, surface: pygame.Surface) -> None:
         surface.fill((245, 245, 250))
 
-        title = self.font_title.render(
+        title = render_text(self.font_title,
             "Part 1: House Questions", True, (25, 25, 35))
         surface.blit(title, (self.w // 2 - title.get_width() // 2, 40))
 
         if not self.questions:
-            msg = self.font.render(
-                "No questions found in state.part1_payload.", True, (60, 60, 80))
+            msg = render_text(self.font,
+                "No questions found in state.data.part1_payload.", True, (60, 60, 80))
             surface.blit(msg, (60, 140))
             self.btn_back.draw(surface)
             return
@@ -93,14 +103,14 @@ class HouseQuestionsScreen:
         qtype = str(q.get("type", "text"))
         qid = str(q.get("id", f"q{self.idx+1}"))
 
-        meta = self.font_small.render(
+        meta = render_text(self.font_small,
             f"{self.idx+1}/{len(self.questions)}   id={qid}   type={qtype}", True, (90, 90, 110))
         surface.blit(meta, (60, 110))
 
         prompt_lines = self._wrap(prompt, 60)
         y = 150
         for line in prompt_lines:
-            s = self.font.render(line, True, (40, 40, 55))
+            s = render_text(self.font, line, True, (40, 40, 55))
             surface.blit(s, (60, y))
             y += 30
 
@@ -109,8 +119,6 @@ class HouseQuestionsScreen:
 
         if self.toast and time.time() < self.toast_until:
             self._draw_toast(surface, self.toast)
-        elif self.toast and time.time() >= self.toast_until:
-            self.toast = None
 
         self.modal.draw(surface)
 
@@ -172,7 +180,7 @@ class HouseQuestionsScreen:
 
     def _draw_toast(self, surface: pygame.Surface, text: str) -> None:
         padding = 10
-        surf = self.font_small.render(text, True, (255, 255, 255))
+        surf = render_text(self.font_small, text, True, (255, 255, 255))
         w = surf.get_width() + padding * 2
         h = surf.get_height() + padding * 2
         x = (self.w - w) // 2
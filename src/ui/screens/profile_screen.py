@@ -6,6 +6,9 @@ import pygame
 from ui.widgets import Button, TextInput, ChoiceGroup
 from ui.screen_manager import ScreenManager
 from app.state import AppState
+from ui.fonts import get_font
+from ui.text_cache import render_text
+from ui.asset_manager import asset_manager
 
 
 class ProfileScreen:
@@ -15,13 +18,16 @@ class ProfileScreen:
         self.w = width
         self.h = height
 
-        self.font_title = pygame.font.Font(None, 44)
-        self.font = pygame.font.Font(None, 26)
-        self.font_hint = pygame.font.Font(None, 22)
+        self.font_title = get_font(None, 44)
+        self.font = get_font(None, 26)
+        self.font_hint = get_font(None, 22)
+
+        # Decode the training map art while the player fills in the form
+        asset_manager().preload("training_map")
 
         self.name_input = TextInput(
             pygame.Rect(260, 150, 380, 44),
-            pygame.font.Font(None, 28),
+            get_font(None, 28),
             "Your name",
         )
 
@@ -29,19 +35,19 @@ class ProfileScreen:
             260,
             240,
             ["Secondary School", "JC", "Poly"],
-            pygame.font.Font(None, 26),
+            get_font(None, 26),
         )
 
         self.confirm = Button(
             pygame.Rect(width // 2 - 90, height - 120, 180, 50),
             "Confirm",
-            pygame.font.Font(None, 32),
+            get_font(None, 32),
         )
 
         self.ask_poly_course = False
         self.poly_input = TextInput(
             pygame.Rect(260, 360, 380, 44),
-            pygame.font.Font(None, 28),
+            get_font(None, 28),
             "Current poly course",
         )
 
@@ -107,13 +113,13 @@ class ProfileScreen:
     def draw(self, surface: pygame.Surface) -> None:
         surface.fill((245, 245, 250))
 
-        title = self.font_title.render("Your Profile", True, (25, 25, 35))
+        title = render_text(self.font_title, "Your Profile", True, (25, 25, 35))
         surface.blit(title, (self.w // 2 - title.get_width() // 2, 60))
 
-        surface.blit(self.font.render("Name", True, (40, 40, 50)), (260, 120))
+        surface.blit(render_text(self.font, "Name", True, (40, 40, 50)), (260, 120))
         self.name_input.draw(surface)
 
-        surface.blit(self.font.render("Education status",
+        surface.blit(render_text(self.font, "Education status",
                      True, (40, 40, 50)), (260, 210))
         self.edu_group.draw(surface)
 
@@ -123,14 +129,14 @@ class ProfileScreen:
 
         if self.ask_poly_course:
             surface.blit(
-                self.font.render(
+                render_text(self.font,
                     "If Poly, what course are you in?", True, (40, 40, 50)),
                 (260, 330),
             )
             self.poly_input.draw(surface)
 
         if self.error_msg and (pygame.time.get_ticks() / 1000.0) < self.error_until:
-            err = self.font_hint.render(self.error_msg, True, (180, 60, 60))
+            err = render_text(self.font_hint, self.error_msg, True, (180, 60, 60))
             surface.blit(err, (260, self.h - 170))
         else:
             self.error_msg = None
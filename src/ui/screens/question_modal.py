@@ -1,14 +1,18 @@
 from __future__ import annotations
 import pygame
 from typing import Any
+from ui.fonts import get_font
+from ui.text_cache import render_text
+from ui.text_layout import wrap_lines
+from ui.panels import draw_panel
 
 
 class QuestionModal:
     def __init__(self, width: int, height: int):
         self.w = width
         self.h = height
-        self.font = pygame.font.Font(None, 26)
-        self.font_big = pygame.font.Font(None, 30)
+        self.font = get_font(None, 26)
+        self.font_big = get_font(None, 30)
         self.active = False
 
         self.q: dict[str, Any] | None = None
@@ -95,16 +99,14 @@ class QuestionModal:
         if not self.active or not self.q:
             return
 
-        overlay = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 120))
-        surface.blit(overlay, (0, 0))
+        draw_panel(surface, pygame.Rect(0, 0, self.w, self.h), (0, 0, 0), alpha=120)
 
         panel = pygame.Rect(self.w//2 - 320, self.h//2 - 170, 640, 340)
         pygame.draw.rect(surface, (255, 255, 255), panel, border_radius=14)
         pygame.draw.rect(surface, (190, 190, 200), panel, 2, border_radius=14)
 
         prompt = self.q["prompt"]
-        title = self.font_big.render("Question", True, (30, 30, 40))
+        title = render_text(self.font_big, "Question", True, (30, 30, 40))
         surface.blit(title, (panel.x + 20, panel.y + 18))
 
         self._blit_wrap(surface, prompt, panel.x + 20,
@@ -117,10 +119,10 @@ class QuestionModal:
             opts = self.q.get("options", [])
             for i, opt in enumerate(opts):
                 prefix = ">" if i == self.mcq_index else " "
-                line = self.font.render(f"{prefix} {opt}", True, (30, 30, 40))
+                line = render_text(self.font, f"{prefix} {opt}", True, (30, 30, 40))
                 surface.blit(line, (panel.x + 30, y))
                 y += 32
-            hint = self.font.render(
+            hint = render_text(self.font,
                 "Up/Down, Enter to select", True, (120, 120, 130))
             surface.blit(hint, (panel.x + 20, panel.bottom - 34))
 
@@ -135,25 +137,25 @@ class QuestionModal:
             knob_x = int(bar.x + k * bar.width)
             pygame.draw.circle(surface, (30, 120, 220),
                                (knob_x, bar.y + 5), 10)
-            surface.blit(self.font.render(min_label, True,
+            surface.blit(render_text(self.font, min_label, True,
                          (90, 90, 105)), (bar.x, bar.y + 18))
-            surface.blit(self.font.render(max_label, True, (90, 90, 105)),
-                         (bar.right - 10 - self.font.size(max_label)[0], bar.y + 18))
-            surface.blit(self.font.render(
+            max_surf = render_text(self.font, max_label, True, (90, 90, 105))
+            surface.blit(max_surf, (bar.right - 10 - max_surf.get_width(), bar.y + 18))
+            surface.blit(render_text(self.font,
                 f"Value: {self.slider_value}", True, (30, 30, 40)), (panel.x + 20, y - 34))
-            hint = self.font.render(
+            hint = render_text(self.font,
                 "Left/Right, Enter to confirm", True, (120, 120, 130))
             surface.blit(hint, (panel.x + 20, panel.bottom - 34))
 
         if t == "rating":
-            surface.blit(self.font.render(
+            surface.blit(render_text(self.font,
                 f"Rating: {self.rating_value}/5", True, (30, 30, 40)), (panel.x + 20, y - 10))
             for i in range(1, 6):
                 col = (30, 120, 220) if i <= self.rating_value else (
                     200, 200, 210)
                 pygame.draw.circle(
                     surface, col, (panel.x + 60 + i*60, y + 40), 14)
-            hint = self.font.render(
+            hint = render_text(self.font,
                 "Left/Right, Enter to confirm", True, (120, 120, 130))
             surface.blit(hint, (panel.x + 20, panel.bottom - 34))
 
@@ -165,24 +167,14 @@ class QuestionModal:
             shown = self.text_value if self.text_value else self.q.get(
                 "placeholder", "")
             col = (40, 40, 40) if self.text_value else (150, 150, 160)
-            surface.blit(self.font.render(shown, True, col),
+            surface.blit(render_text(self.font, shown, True, col),
                          (box.x + 10, box.y + 12))
-            hint = self.font.render(
+            hint = render_text(self.font,
                 "Type, Enter to submit", True, (120, 120, 130))
             surface.blit(hint, (panel.x + 20, panel.bottom - 34))
 
     def _blit_wrap(self, surface: pygame.Surface, text: str, x: int, y: int, w: int) -> None:
-        words = text.split(" ")
-        line = ""
         yy = y
-        for word in words:
-            test = (line + " " + word).strip()
-            if self.font.size(test)[0] <= w:
-                line = test
-            else:
-                surface.blit(self.font.render(
-                    line, True, (30, 30, 40)), (x, yy))
-                yy += 26
-                line = word
-        if line:
-            surface.blit(self.font.render(line, True, (30, 30, 40)), (x, yy))
+        for line in wrap_lines(text, self.font, w):
+            surface.blit(render_text(self.font, line, True, (30, 30, 40)), (x, yy))
+            yy += 26
@@ -14,7 +14,13 @@ from ui.screen_manager import ScreenManager
 
 from app.config import AppConfig
 from core.content_engine import ContentEngine
+from core.content_store import ContentStore
 from integrations.llm_client import LLMClient
+from ui.fonts import get_font
+from ui.text_cache import render_text
+from ui.asset_manager import asset_manager
+from ui.timestep import lerp
+from ui.transition import Transition, TransitionScreen
 
 
 @dataclass
@@ -47,14 +53,14 @@ class TrainingMapScreen:
 
         self.bg_color = (245, 245, 250)
         self.ui_text_color = (40, 40, 55)
-        self.font = pygame.font.Font(None, 24)
-        self.font_small = pygame.font.Font(None, 20)
+        self.font = get_font(None, 24)
+        self.font_small = get_font(None, 20)
 
         base_assets = os.path.join(os.path.dirname(__file__), "..", "assets")
         self.assets_dir = os.path.abspath(base_assets)
 
         self.bg_img = self._safe_load_image("background.png", scale=(
-            self.w, self.h))  # Put background.png here
+            self.w, self.h), alpha=False)  # Put background.png here
 
         self.warrior_up = self._safe_load_image(
             "warrior_up.png", scale=(40, 40))      # Add warrior-up here
@@ -72,8 +78,11 @@ class TrainingMapScreen:
         self.gate_img = self._safe_load_image("gate.png", scale=(
             72, 88))              # Add gate.png here (optional)
 
-        self.player_speed = 3
+        self.player_speed = 180  # px/s (was 3 px per frame at 60 FPS)
         self.player_rect = pygame.Rect(60, 260, 40, 40)
+        # Float position; player_rect is its rounded copy for collisions
+        self.player_pos = pygame.Vector2(self.player_rect.topleft)
+        self.player_prev = pygame.Vector2(self.player_pos)
         self.player_dir = "down"
 
         self.house = RectObject(pygame.Rect(220, 180, 96, 96), "house")
@@ -108,20 +117,26 @@ class TrainingMapScreen:
 
     def update(self, dt: float) -> None:
         keys = pygame.key.get_pressed()
-        dx, dy = 0, 0
+        dx, dy = 0.0, 0.0
+        step = self.player_speed * dt
+
+        # player_rect moved by a flow trigger (teleport): restart from there
+        if self.player_rect.topleft != (round(self.player_pos.x), round(self.player_pos.y)):
+            self.player_pos.update(self.player_rect.topleft)
+        self.player_prev.update(self.player_pos)
 
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            dx -= self.player_speed
+            dx -= step
             self.player_dir = "left"
         elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            dx += self.player_speed
+            dx += step
             self.player_dir = "right"
 
         if keys[pygame.K_UP] or keys[pygame.K_w]:
-            dy -= self.player_speed
+            dy -= step
             self.player_dir = "up"
         elif keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            dy += self.player_speed
+            dy += step
             self.player_dir = "down"
 
         if dx or dy:
@@ -173,11 +188,12 @@ class TrainingMapScreen:
 
         # Player
         player_img = self._get_player_img()
+        drawn = self._interpolated_player_rect()
         if player_img:
-            surface.blit(player_img, self.player_rect.topleft)
+            surface.blit(player_img, drawn.topleft)
         else:
             pygame.draw.rect(surface, (0, 120, 255),
-                             self.player_rect, border_radius=8)
+                             drawn, border_radius=8)
 
         if self.toast_text and time.time() < self.toast_until:
             self._draw_toast(surface, self.toast_text)
@@ -188,21 +204,22 @@ class TrainingMapScreen:
 
     def _enter_house_start_part1(self) -> None:
         self.part1_started = True
-        self._toast("Entering the house...", seconds=1.0)
 
-        edu = getattr(self.state.profile,
-                      "education_status", "Secondary School")
-        poly_course = getattr(self.state.profile, "poly_course_of_study", None)
+        edu = self.state.profile.education_status
+        poly_course = self.state.profile.poly_course_of_study
 
-        payload = self.engine.gen_part1(edu, poly_course)
-        setattr(self.state, "part1_payload", payload)
+        def enter(payload):
+            self.state.data.part1_payload = payload
+            from ui.screens.house_questions_screen import HouseQuestionsScreen
+            return HouseQuestionsScreen(
+                self.sm, self.state, self.w, self.h, back_screen=self)
 
-        from ui.screens.house_questions_screen import HouseQuestionsScreen
-        self.sm.set(HouseQuestionsScreen(
-            self.sm, self.state, self.w, self.h, back_screen=self))
+        # LLM call runs behind the loading overlay instead of freezing the loop
+        self.sm.set(TransitionScreen(self.sm, Transition(
+            "Entering the house...", lambda: self.engine.gen_part1(edu, poly_course), enter)))
 
     def on_part1_completed(self, part1_answers: list[dict[str, Any]]) -> None:
-        setattr(self.state, "part1_answers", part1_answers)
+        self.state.data.part1_answers = part1_answers
         self.part1_done = True
 
         # Move outside house
@@ -213,28 +230,38 @@ class TrainingMapScreen:
     def _start_part2(self) -> None:
         self.part2_started = True
 
-        edu = getattr(self.state.profile,
-                      "education_status", "Secondary School")
-        part1_answers = getattr(self.state, "part1_answers", [])
+        edu = self.state.profile.education_status
+        part1_answers = self.state.data.part1_answers
 
-        payload = self.engine.gen_part2(edu, part1_answers)
-        setattr(self.state, "part2_payload", payload)
+        def enter(payload):
+            self.state.data.part2_payload = payload
+            from ui.screens.wise_man_questions_screen import WiseManQuestionsScreen
+            return WiseManQuestionsScreen(
+                self.sm, self.state, self.w, self.h, back_screen=self)
 
-        from ui.screens.wise_man_questions_screen import WiseManQuestionsScreen
-        self.sm.set(WiseManQuestionsScreen(
-            self.sm, self.state, self.w, self.h, back_screen=self))
+        self.sm.set(TransitionScreen(self.sm, Transition(
+            "The wise man is listening...", lambda: self.engine.gen_part2(edu, part1_answers), enter)))
 
     def on_part2_completed(self, inferred_fields: list[str], part2_answers: list[dict[str, Any]], poly_path_choice: Optional[str] = None):
-        setattr(self.state, "inferred_fields", inferred_fields)
-        setattr(self.state, "part2_answers", part2_answers)
+        self.state.data.inferred_fields = inferred_fields
+        self.state.data.part2_answers = part2_answers
 
         if poly_path_choice:
             self.state.profile.poly_path_choice = poly_path_choice  # type: ignore
 
+        edu = self.state.profile.education_status
+        poly_choice = self.state.profile.poly_path_choice
+
+        def enter(payload):
+            from ui.screens.wise_man_screen import WiseManScreen
+            return WiseManScreen(self.sm, self.state,
+                                 self.w, self.h, self.engine, back_screen=self, payload=payload)
+
         # Show analysis screen before gates
-        from ui.screens.wise_man_screen import WiseManScreen
-        return WiseManScreen(self.sm, self.state,
-                             self.w, self.h, self.engine, back_screen=self)
+        return TransitionScreen(self.sm, Transition(
+            "The wise man reflects...",
+            lambda: self.engine.gen_analysis(edu, poly_choice, inferred_fields, part2_answers),
+            enter, on_error=lambda exc: self))
 
     def on_analysis_completed(self) -> None:
         self.part2_done = True
@@ -243,7 +270,7 @@ class TrainingMapScreen:
     # ---------------- gates ----------------
 
     def _spawn_gates_from_analysis(self) -> None:
-        analysis = getattr(self.state, "analysis_payload", None)
+        analysis = self.state.data.analysis_payload
         if not isinstance(analysis, dict):
             self._toast("No analysis payload found.", seconds=2.5)
             return
@@ -271,6 +298,14 @@ class TrainingMapScreen:
 
         self.gates_spawned = True
         self.gates_zone_active = True
+        asset_manager().preload("gate_scene")
+
+        # Build the three gate scenes (content included) while the player walks over
+        from ui.screens.gate_scene_screen import GateSceneScreen
+        for name in self.gate_names:
+            self.sm.preload(
+                GateSceneScreen, self.sm, self.state, self.w, self.h,
+                back_screen=self, option_name=name, engine=self.engine)
 
         # Optional: teleport player closer so they can see gates fast
         self.player_rect.center = (self.w // 2, self.h // 2)
@@ -280,11 +315,12 @@ class TrainingMapScreen:
         self.gates_zone_active = False
 
         # Store which gate is being explored
-        setattr(self.state, "current_gate_option", option_name)
+        self.state.world.current_gate_option = option_name
 
         from ui.screens.gate_scene_screen import GateSceneScreen
-        self.sm.set(GateSceneScreen(self.sm, self.state, self.w,
-                    self.h, back_screen=self, option_name=option_name))
+        self.sm.push_cached(
+            GateSceneScreen, self.sm, self.state, self.w, self.h,
+            back_screen=self, option_name=option_name, engine=self.engine)
 
     def on_gate_exit(self) -> None:
         # Move player away from gates and add a short cooldown to avoid instant re-entry
@@ -294,18 +330,25 @@ class TrainingMapScreen:
     # ---------------- helpers ----------------
 
     def _build_content_engine(self) -> ContentEngine:
-        llm = LLMClient(
-            self.cfg.azure_endpoint,
-            self.cfg.azure_api_key,
-            self.cfg.azure_api_version,
-            self.cfg.azure_deployment,
-        )
-        return ContentEngine(llm)
-
-    def _move_player(self, dx: int, dy: int) -> None:
-        self.player_rect.x += dx
-        self.player_rect.y += dy
+        llm = LLMClient.from_config(self.cfg)
+        store = ContentStore(self.cfg.content_store_dir) if self.cfg.content_cache else None
+        return ContentEngine(llm, store=store)
+
+    def _move_player(self, dx: float, dy: float) -> None:
+        self.player_pos.x += dx
+        self.player_pos.y += dy
+        self.player_rect.topleft = (round(self.player_pos.x), round(self.player_pos.y))
         self.player_rect = self._clamp_to_bounds(self.player_rect)
+        if self.player_rect.topleft != (round(self.player_pos.x), round(self.player_pos.y)):
+            self.player_pos.update(self.player_rect.topleft)
+
+    def _interpolated_player_rect(self) -> pygame.Rect:
+        if self.player_rect.topleft != (round(self.player_pos.x), round(self.player_pos.y)):
+            return self.player_rect  # teleported since the last step
+        a = self.sm.alpha
+        x = round(lerp(self.player_prev.x, self.player_pos.x, a))
+        y = round(lerp(self.player_prev.y, self.player_pos.y, a))
+        return self.player_rect.move(x - self.player_rect.x, y - self.player_rect.y)
 
     def _clamp_to_bounds(self, r: pygame.Rect) -> pygame.Rect:
         if r.left < self.screen_rect.left:
@@ -329,7 +372,7 @@ class TrainingMapScreen:
 
     def _draw_toast(self, surface: pygame.Surface, text: str) -> None:
         padding = 10
-        surf = self.font.render(text, True, (255, 255, 255))
+        surf = render_text(self.font, text, True, (255, 255, 255))
         w, h = surf.get_width() + padding * 2, surf.get_height() + padding * 2
         x = (self.w - w) // 2
         y = self.h - h - 14
@@ -338,7 +381,7 @@ class TrainingMapScreen:
         surface.blit(surf, (x + padding, y + padding))
 
     def _draw_text(self, surface: pygame.Surface, text: str, pos: Tuple[int, int]) -> None:
-        surf = self.font.render(text, True, self.ui_text_color)
+        surf = render_text(self.font, text, True, self.ui_text_color)
         surface.blit(surf, pos)
 
     def _draw_object(self, surface: pygame.Surface, obj: RectObject, img: Optional[pygame.Surface], fallback_color=(200, 200, 200)) -> None:
@@ -361,7 +404,7 @@ class TrainingMapScreen:
 
         # Label above gate
         label = gate.label
-        text = self.font_small.render(label, True, (20, 20, 30))
+        text = render_text(self.font_small, label, True, (20, 20, 30))
         surface.blit(text, (gate.rect.centerx -
                      text.get_width() // 2, gate.rect.y - 22))
 
@@ -376,14 +419,6 @@ class TrainingMapScreen:
             return self.warrior_right
         return self.warrior_down
 
-    def _safe_load_image(self, filename: str, scale: Optional[Tuple[int, int]] = None) -> Optional[pygame.Surface]:
-        try:
-            path = os.path.join(self.assets_dir, filename)
-            if not os.path.exists(path):
-                return None
-            img = pygame.image.load(path).convert_alpha()
-            if scale:
-                img = pygame.transform.scale(img, scale)
-            return img
-        except Exception:
-            return None
+    def _safe_load_image(self, filename: str, scale: Optional[Tuple[int, int]] = None, alpha: bool = True) -> Optional[pygame.Surface]:
+        # Shared, display-converted surface (None if the file is missing)
+        return asset_manager().image(os.path.join(self.assets_dir, filename), scale, alpha)
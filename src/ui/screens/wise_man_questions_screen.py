@@ -6,13 +6,16 @@ import pygame
 from ui.widgets import Button
 from ui.screens.question_modal import QuestionModal
 from ui.screen_manager import ScreenManager
+from ui.screen_base import DirtyRects
 from app.state import AppState
+from ui.fonts import get_font
+from ui.text_cache import render_text
 
 
-class WiseManQuestionsScreen:
+class WiseManQuestionsScreen(DirtyRects):
     """
     Minimal Part 2 runner.
-    - Reads state.part2_payload
+    - Reads state.data.part2_payload
     - Shows 12 questions one by one
     - If poly_extra_question exists, ask it at the end
     - Collect answers as text for now
@@ -26,12 +29,12 @@ class WiseManQuestionsScreen:
         self.h = height
         self.back_screen = back_screen
 
-        self.font_title = pygame.font.Font(None, 40)
-        self.font = pygame.font.Font(None, 26)
-        self.font_small = pygame.font.Font(None, 22)
+        self.font_title = get_font(None, 40)
+        self.font = get_font(None, 26)
+        self.font_small = get_font(None, 22)
 
-        payload = getattr(self.state, "part2_payload", {
-                          "inferred_fields": [], "questions": [], "poly_extra_question": None})
+        payload = self.state.data.part2_payload or {
+            "inferred_fields": [], "questions": [], "poly_extra_question": None}
         self.inferred_fields = payload.get(
             "inferred_fields", []) if isinstance(payload, dict) else []
         self.questions = payload.get(
@@ -49,9 +52,9 @@ class WiseManQuestionsScreen:
         self.modal = QuestionModal(self.w, self.h)
 
         self.btn_next = Button(pygame.Rect(
-            self.w - 200, self.h - 90, 160, 50), "Next", pygame.font.Font(None, 32))
+            self.w - 200, self.h - 90, 160, 50), "Next", get_font(None, 32))
         self.btn_back = Button(pygame.Rect(
-            40, self.h - 90, 160, 50), "Back", pygame.font.Font(None, 32))
+            40, self.h - 90, 160, 50), "Back", get_font(None, 32))
 
         if self.questions:
             self._open_current()
@@ -61,8 +64,13 @@ class WiseManQuestionsScreen:
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.MOUSEMOTION:
-            self.btn_next.handle_mouse(event.pos)
-            self.btn_back.handle_mouse(event.pos)
+            for btn in (self.btn_next, self.btn_back):
+                was = btn.hover
+                btn.handle_mouse(event.pos)
+                if btn.hover != was:
+                    self.invalidate(btn.rect)
+        elif event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+            self.invalidate()
 
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.btn_back.clicked(event.pos):
@@ -85,18 +93,18 @@ class WiseManQuestionsScreen:
     def draw(self, surface: pygame.Surface) -> None:
         surface.fill((245, 245, 250))
 
-        title = self.font_title.render(
+        title = render_text(self.font_title,
             "Part 2: Wise Man Questions", True, (25, 25, 35))
         surface.blit(title, (self.w // 2 - title.get_width() // 2, 40))
 
         fields_text = ", ".join([str(x) for x in self.inferred_fields[:3]])
-        meta = self.font_small.render(
+        meta = render_text(self.font_small,
             f"Fields: {fields_text}", True, (90, 90, 110))
         surface.blit(meta, (60, 95))
 
         if not self.questions and not self.poly_extra:
-            msg = self.font.render(
-                "No Part 2 questions found in state.part2_payload.", True, (60, 60, 80))
+            msg = render_text(self.font,
+                "No Part 2 questions found in state.data.part2_payload.", True, (60, 60, 80))
             surface.blit(msg, (60, 160))
             self.btn_back.draw(surface)
             return
@@ -115,13 +123,13 @@ class WiseManQuestionsScreen:
         qtype = str(q.get("type", "text"))
         qid = str(q.get("id", f"q{current}"))
 
-        step = self.font_small.render(
+        step = render_text(self.font_small,
             f"{current}/{total}   id={qid}   type={qtype}", True, (90, 90, 110))
         surface.blit(step, (60, 125))
 
         y = 165
         for line in self._wrap(prompt, 60):
-            surface.blit(self.font.render(line, True, (40, 40, 55)), (60, y))
+            surface.blit(render_text(self.font, line, True, (40, 40, 55)), (60, y))
             y += 30
 
         self.btn_back.draw(surface)
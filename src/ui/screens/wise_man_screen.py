@@ -1,12 +1,15 @@
 from __future__ import annotations
 import pygame
 from ui.screen_manager import ScreenManager
+from ui.screen_base import DirtyRects
 from app.state import AppState
 from core.content_engine import ContentEngine
+from ui.fonts import get_font
+from ui.text_cache import render_text
 
 
-class WiseManScreen:
-    def __init__(self, sm: ScreenManager, state: AppState, width: int, height: int, engine: ContentEngine, back_screen):
+class WiseManScreen(DirtyRects):
+    def __init__(self, sm: ScreenManager, state: AppState, width: int, height: int, engine: ContentEngine, back_screen, payload: dict | None = None):
         self.sm = sm
         self.state = state
         self.w = width
@@ -14,25 +17,28 @@ class WiseManScreen:
         self.engine = engine
         self.back_screen = back_screen
 
-        self.font = pygame.font.Font(None, 28)
-        self.font_small = pygame.font.Font(None, 22)
+        self.font = get_font(None, 28)
+        self.font_small = get_font(None, 22)
 
+        self.box = pygame.Rect(30, 110, self.w - 60, 170)
         self.step = 0
         self.lines: list[str] = []
-        self._build_analysis()
+        self._build_analysis(payload)
 
-    def _build_analysis(self) -> None:
-        edu = self.state.profile.education_status
-        poly_choice = self.state.profile.poly_path_choice
-        inferred_fields = getattr(self.state, "inferred_fields", self.state.data.inferred_fields)
-        part2_answers = getattr(self.state, "part2_answers", self.state.data.part2_answers)
-        payload = self.engine.gen_analysis(
-            edu, poly_choice, inferred_fields, part2_answers)
+    def _build_analysis(self, payload: dict | None = None) -> None:
+        # payload may already have been fetched (e.g. behind a Transition)
+        if payload is None:
+            edu = self.state.profile.education_status
+            poly_choice = self.state.profile.poly_path_choice
+            inferred_fields = self.state.data.inferred_fields
+            part2_answers = self.state.data.part2_answers
+            payload = self.engine.gen_analysis(
+                edu, poly_choice, inferred_fields, part2_answers)
         self.state.data.strength_tags = payload["strength_tags"]
         self.state.data.work_style_tags = payload["work_style_tags"]
         self.state.data.feedback_lines = payload["feedback_lines"]
         self.state.data.suggested_options = payload["suggested_options"]
-        setattr(self.state, "analysis_payload", payload)
+        self.state.data.analysis_payload = payload
 
         self.lines = []
         self.lines.append("Strength tags: " +
@@ -47,6 +53,7 @@ class WiseManScreen:
 
         if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
             self.step += 1
+            self.invalidate(self.box)
             if self.step >= len(self.lines):
                 if hasattr(self.back_screen, "on_analysis_completed"):
                     self.back_screen.on_analysis_completed()
@@ -58,18 +65,18 @@ class WiseManScreen:
     def draw(self, surface: pygame.Surface) -> None:
         surface.fill((245, 245, 250))
 
-        title = self.font.render("Wise Man", True, (30, 30, 40))
+        title = render_text(self.font, "Wise Man", True, (30, 30, 40))
         surface.blit(title, (30, 30))
 
-        box = pygame.Rect(30, 110, self.w - 60, 170)
+        box = self.box
         pygame.draw.rect(surface, (255, 255, 255), box, border_radius=12)
         pygame.draw.rect(surface, (190, 190, 200), box, 2, border_radius=12)
 
         idx = min(self.step, len(self.lines)-1)
         line = self.lines[idx] if self.lines else ""
-        surface.blit(self.font.render(line, True, (30, 30, 40)),
+        surface.blit(render_text(self.font, line, True, (30, 30, 40)),
                      (box.x + 16, box.y + 18))
 
-        hint = self.font_small.render("Press Enter", True, (120, 120, 130))
+        hint = render_text(self.font_small, "Press Enter", True, (120, 120, 130))
         surface.blit(
             hint, (box.right - hint.get_width() - 16, box.bottom - 28))
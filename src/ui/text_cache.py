@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+
+import pygame
+
+from ui.fonts import font_registry
+
+
+class TextCache:
+    """
+    Bounded LRU of rendered text surfaces keyed by (font, text, color, antialias).
+
+    Static labels then cost one blit per frame instead of a glyph
+    rasterization. Entries hold a reference to their font, so a key can never
+    be confused with a newer font that reuses the same id. Callers must treat
+    returned surfaces as read-only since they are shared.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._surfaces: OrderedDict[tuple[Any, ...], pygame.Surface] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color: Any) -> pygame.Surface:
+        key = (font, text, tuple(color), bool(antialias))
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surf
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+    def stats(self) -> dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+_cache = TextCache()
+font_registry().add_reload_listener(_cache.clear)
+
+
+def text_cache() -> TextCache:
+    return _cache
+
+
+def render_text(font: pygame.font.Font, text: str, antialias: bool, color: Any) -> pygame.Surface:
+    """
+    Drop-in replacement for font.render(text, antialias, color).
+    """
+    return _cache.render(font, text, antialias, color)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+
+import pygame
+
+from ui.fonts import font_registry
+
+
+class TextLayout:
+    """
+    Word-wrap engine with two caches:
+    - wrapped lines per (text, font, max_width), bounded LRU
+    - pixel width per (font, word), so a new prompt measures each distinct word once
+
+    A line's width is the sum of its word widths plus one space width per gap,
+    instead of re-measuring every growing prefix with font.size().
+    """
+
+    def __init__(self, max_layouts: int = 256, max_words: int = 8192):
+        self.max_layouts = max_layouts
+        self.max_words = max_words
+        self._layouts: OrderedDict[tuple[Any, ...], tuple[str, ...]] = OrderedDict()
+        self._widths: dict[tuple[Any, str], int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.measure_calls = 0
+
+    def _width(self, font: pygame.font.Font, word: str) -> int:
+        key = (font, word)
+        w = self._widths.get(key)
+        if w is None:
+            if len(self._widths) >= self.max_words:
+                self._widths.clear()
+            self.measure_calls += 1
+            w = font.size(word)[0]
+            self._widths[key] = w
+        return w
+
+    def wrap(self, text: str, font: pygame.font.Font, max_width: int) -> tuple[str, ...]:
+        key = (text, font, int(max_width))
+        lines = self._layouts.get(key)
+        if lines is not None:
+            self._layouts.move_to_end(key)
+            self.hits += 1
+            return lines
+
+        self.misses += 1
+        space = self._width(font, " ")
+        out: list[str] = []
+        cur: list[str] = []
+        cur_w = 0
+        for word in text.split(" "):
+            if not word:
+                continue
+            ww = self._width(font, word)
+            if not cur:
+                cur, cur_w = [word], ww
+            elif cur_w + space + ww <= max_width:
+                cur.append(word)
+                cur_w += space + ww
+            else:
+                out.append(" ".join(cur))
+                cur, cur_w = [word], ww
+        if cur:
+            out.append(" ".join(cur))
+
+        lines = tuple(out)
+        self._layouts[key] = lines
+        if len(self._layouts) > self.max_layouts:
+            self._layouts.popitem(last=False)
+        return lines
+
+    def clear(self) -> None:
+        self._layouts.clear()
+        self._widths.clear()
+
+    def stats(self) -> dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "layouts": len(self._layouts),
+            "words": len(self._widths),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "measure_calls": self.measure_calls,
+        }
+
+
+_layout = TextLayout()
+font_registry().add_reload_listener(_layout.clear)
+
+
+def text_layout() -> TextLayout:
+    return _layout
+
+
+def wrap_lines(text: str, font: pygame.font.Font, max_width: int) -> tuple[str, ...]:
+    return _layout.wrap(text, font, max_width)
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+SIM_HZ = 60
+
+
+class FixedTimestep:
+    """
+    Fixed-timestep accumulator.
+
+    Each rendered frame feeds its real dt to advance(), which returns how
+    many fixed steps of `step` seconds to simulate. The remainder carries
+    over, and alpha (0..1) says how far the frame sits between the last two
+    simulated states, for render interpolation. Gameplay speed no longer
+    depends on the frame rate, and rendering can be throttled without
+    changing the simulation.
+
+    dt is clamped to max_frame so a long stall (window drag, idle wait)
+    runs a bounded number of catch-up steps instead of spiralling.
+    """
+
+    def __init__(self, step: float = 1.0 / SIM_HZ, max_frame: float = 0.25):
+        self.step = step
+        self.max_frame = max_frame
+        self.accumulator = 0.0
+        self.alpha = 1.0
+        self.steps = 0
+
+    def advance(self, dt: float) -> int:
+        self.accumulator += min(max(dt, 0.0), self.max_frame)
+        n = int(self.accumulator / self.step)
+        self.accumulator -= n * self.step
+        self.alpha = self.accumulator / self.step
+        self.steps += n
+        return n
+
+
+def lerp(a: float, b: float, t: float) -> float:
+    return a + (b - a) * t
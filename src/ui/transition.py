@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+import pygame
+
+from ui.fonts import get_font
+from ui.text_cache import render_text
+
+Color = tuple[int, int, int]
+
+
+def run_in_background(task: Callable[[], Any]) -> Future:
+    """
+    Run task on a daemon thread and return its Future.
+
+    Daemon rather than a ThreadPoolExecutor worker: executors join their
+    threads at interpreter exit, so quitting during a slow LLM call would
+    hang until the call returned.
+    """
+    fut: Future = Future()
+
+    def work() -> None:
+        if not fut.set_running_or_notify_cancel():
+            return
+        try:
+            fut.set_result(task())
+        except BaseException as exc:
+            fut.set_exception(exc)
+
+    threading.Thread(target=work, name="transition", daemon=True).start()
+    return fut
+
+
+class Transition:
+    """
+    Fade-to-black loading overlay covering a location/screen change.
+
+    The optional task runs on a background thread while the caller keeps
+    its loop going (events pumped, update(dt) + draw(surface) each frame),
+    so the window stays responsive. The overlay lasts as long as the task
+    needs, but at least min_duration so the title is readable; a task-less
+    transition is just that short fade. Once done is True the caller
+    calls finish(), which runs on_done(result) on the main thread and
+    returns whatever it returns. Errors raised by the task go to
+    on_error(exc) if given, otherwise they are re-raised from finish(), as
+    if the call had been made inline.
+
+    The first draw() snapshots the surface, so the overlay fades out of
+    whatever was on screen.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        task: Optional[Callable[[], Any]] = None,
+        on_done: Optional[Callable[[Any], Any]] = None,
+        on_error: Optional[Callable[[BaseException], Any]] = None,
+        min_duration: float = 0.4,
+        fade: float = 0.15,
+        color: Color = (0, 0, 0),
+    ):
+        self.title = title
+        self.on_done = on_done
+        self.on_error = on_error
+        self.min_duration = min_duration
+        self.fade = fade
+        self.color = color
+        self.elapsed = 0.0
+        self.future: Future | None = run_in_background(task) if task is not None else None
+        self._snapshot: pygame.Surface | None = None
+        self._overlay: pygame.Surface | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.elapsed >= self.min_duration and (self.future is None or self.future.done())
+
+    def update(self, dt: float) -> None:
+        self.elapsed += dt
+
+    def finish(self) -> Any:
+        result = None
+        if self.future is not None:
+            exc = self.future.exception()
+            if exc is not None and self.on_error is not None:
+                return self.on_error(exc)
+            result = self.future.result()
+        return self.on_done(result) if self.on_done is not None else None
+
+    def draw(self, surface: pygame.Surface) -> None:
+        if self._snapshot is None:
+            self._snapshot = surface.copy()
+            self._overlay = pygame.Surface(surface.get_size())
+            self._overlay.fill(self.color)
+
+        t = min(self.elapsed / self.fade, 1.0) if self.fade > 0 else 1.0
+        if t < 1.0:
+            surface.blit(self._snapshot, (0, 0))
+            self._overlay.set_alpha(int(255 * t))
+            surface.blit(self._overlay, (0, 0))
+            return
+
+        surface.fill(self.color)
+        font = get_font("Arial", 32)
+        text = render_text(font, self.title, True, (255, 255, 255))
+        rect = text.get_rect(center=surface.get_rect().center)
+        surface.blit(text, rect)
+
+        # Three pulsing dots while waiting
+        lit = int(self.elapsed * 3) % 3
+        for i in range(3):
+            shade = 255 if i == lit else 110
+            pygame.draw.circle(surface, (shade, shade, shade), (rect.centerx - 16 + i * 16, rect.bottom + 24), 4)
+
+
+class TransitionScreen:
+    """
+    Screen wrapper for ScreenManager flows: shows the transition and, when
+    it is done, switches to the screen returned by its on_done (if any).
+    Input is ignored meanwhile; QUIT is still handled by the manager.
+    """
+
+    def __init__(self, sm, transition: Transition):
+        self.sm = sm
+        self.transition = transition
+        self.finished = False
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        pass
+
+    def update(self, dt: float) -> None:
+        self.transition.update(dt)
+        if self.transition.done and not self.finished:
+            self.finished = True
+            nxt = self.transition.finish()
+            if nxt is not None:
+                self.sm.set(nxt)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        self.transition.draw(surface)
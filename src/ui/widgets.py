@@ -1,5 +1,6 @@
 from __future__ import annotations
 import pygame
+from ui.text_cache import render_text
 
 
 class Button:
@@ -18,7 +19,7 @@ class Button:
     def draw(self, surface: pygame.Surface) -> None:
         bg = (30, 120, 220) if not self.hover else (50, 150, 245)
         pygame.draw.rect(surface, bg, self.rect, border_radius=12)
-        label = self.font.render(self.text, True, (255, 255, 255))
+        label = render_text(self.font, self.text, True, (255, 255, 255))
         surface.blit(label, (self.rect.centerx - label.get_width() //
                      2, self.rect.centery - label.get_height()//2))
 
@@ -49,7 +50,7 @@ class TextInput:
             160, 160, 160), self.rect, 2, border_radius=10)
         shown = self.text if self.text else self.placeholder
         col = (40, 40, 40) if self.text else (150, 150, 150)
-        label = self.font.render(shown, True, col)
+        label = render_text(self.font, shown, True, col)
         surface.blit(label, (self.rect.x + 10, self.rect.y +
                      (self.rect.height - label.get_height())//2))
 
@@ -77,5 +78,5 @@ class ChoiceGroup:
             pygame.draw.rect(surface, (80, 80, 80), r, 2)
             if i == self.selected:
                 pygame.draw.circle(surface, (30, 120, 220), r.center, 5)
-            label = self.font.render(self.options[i], True, (30, 30, 30))
+            label = render_text(self.font, self.options[i], True, (30, 30, 30))
             surface.blit(label, (r.right + 10, r.y - 2))